@@ -0,0 +1,8 @@
+"""Benchmarks for streamed parsing.
+
+Each workload is a generated document split into token-sized chunks. Every
+chunk is parsed either by reparsing the whole prefix (``prefix`` mode, what
+``JSONParser.parse`` callers do) or by ``IncrementalJSONParser.feed``
+(``incremental`` mode). Run ``python -m benchmarks --help`` from the
+repository root.
+"""
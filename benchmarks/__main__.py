@@ -0,0 +1,75 @@
+"""Command line entry point: ``python -m benchmarks --help``."""
+import argparse
+import json
+import sys
+
+from . import runner, workloads
+
+# (result field, header, width, format)
+_COLUMNS = [
+    ("workload", "workload", max(map(len, ["workload", *workloads.WORKLOADS])), "{}"),
+    ("parser", "parser", max(map(len, ["parser", *runner.PARSERS])), "{}"),
+    ("strict", "strict", 6, "{}"),
+    ("mode", "mode", max(map(len, ["mode", *runner.MODES])), "{}"),
+    ("tokens", "tokens", 6, "{}"),
+    ("total_ms", "total ms", 10, "{:.2f}"),
+    ("token_median_us", "median us", 10, "{:.1f}"),
+    ("token_p95_us", "p95 us", 10, "{:.1f}"),
+    ("token_max_us", "max us", 10, "{:.1f}"),
+    ("peak_kib", "peak KiB", 9, "{:.1f}"),
+    ("failed_prefixes", "failed", 6, "{}"),
+]
+
+
+def _print_table(rows, baseline=None):
+    print(" ".join(f"{header:>{width}}" for _, header, width, _ in _COLUMNS) + ("   vs base" if baseline else ""))
+    for row in rows:
+        cells = []
+        for name, _, width, fmt in _COLUMNS:
+            text = "-" if row[name] is None else fmt.format(row[name])
+            cells.append(f"{text:>{width}}")
+        line = " ".join(cells)
+        base = baseline.get(runner.row_key(row)) if baseline else None
+        if base:
+            line += f"   {row['total_ms'] / base['total_ms']:>8.2f}x"
+        print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("--workload", action="append", choices=sorted(workloads.WORKLOADS))
+    parser.add_argument("--parser", action="append", choices=sorted(runner.PARSERS))
+    parser.add_argument("--mode", action="append", choices=runner.MODES)
+    parser.add_argument("--strict-only", action="store_true", help="skip strict=False runs")
+    parser.add_argument("--size", type=int, default=2000, help="approximate document size in characters")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case; the fastest is kept")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--compare", help="JSON results from an earlier run to compare total time against")
+    args = parser.parse_args(argv)
+
+    report = runner.run(
+        names=args.workload,
+        size=args.size,
+        parsers=args.parser,
+        stricts=(True,) if args.strict_only else (True, False),
+        modes=args.mode or runner.MODES,
+        repeat=args.repeat,
+        seed=args.seed,
+        memory=not args.no_memory,
+    )
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = {runner.row_key(row): row for row in json.load(f)["results"]}
+    _print_table(report["results"], baseline)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
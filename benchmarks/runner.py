@@ -0,0 +1,143 @@
+"""Timing and memory measurements for streamed parsing."""
+import functools
+import gc
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+import partialjson
+from partialjson import IncrementalJSONParser, create_json5_parser, create_json_parser
+
+from . import workloads
+
+PARSERS = {
+    "json": create_json_parser,
+    "json-py": functools.partial(create_json_parser, speedups=False),
+    "json-numeric": functools.partial(create_json_parser, numeric_arrays="array"),
+    "json5": create_json5_parser,
+}
+MODES = ("prefix", "incremental", "live")
+
+
+def _quiet(*args):
+    pass
+
+
+def _stream(parser_name, strict, mode):
+    """Return a function that feeds one chunk and parses everything received so far.
+
+    It returns False when the prefix could not be parsed; streaming callers
+    typically keep the previous snapshot in that case.
+    """
+    if mode != "prefix":
+        parser = IncrementalJSONParser(
+            strict=strict, json5_enabled=parser_name == "json5", on_extra_token=_quiet, live=mode == "live"
+        )
+        parse = parser.feed
+    else:
+        parser = PARSERS[parser_name](strict=strict, on_extra_token=_quiet)
+        buffer = []
+
+        def parse(chunk):
+            buffer.append(chunk)
+            return parser.parse("".join(buffer))
+
+    def feed(chunk):
+        try:
+            parse(chunk)
+        except ValueError:
+            return False
+        return True
+
+    return feed
+
+
+def _timed_run(chunks, parser_name, strict, mode):
+    feed = _stream(parser_name, strict, mode)
+    clock = time.perf_counter_ns
+    latencies = []
+    failures = 0
+    for chunk in chunks:
+        start = clock()
+        ok = feed(chunk)
+        latencies.append(clock() - start)
+        failures += not ok
+    return latencies, failures
+
+
+def _memory_run(chunks, parser_name, strict, mode):
+    feed = _stream(parser_name, strict, mode)
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    tracemalloc.start()
+    try:
+        for chunk in chunks:
+            feed(chunk)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak, sys.getallocatedblocks() - blocks
+
+
+def measure(name, size, parser_name, strict, mode, repeat=3, seed=0, memory=True):
+    """Stream workload ``name`` through one parser configuration and return a result row.
+
+    With ``memory``, a separate untimed run under ``tracemalloc`` records the
+    peak traced memory and the blocks still allocated afterwards.
+    """
+    doc, chunks = workloads.build(name, size, seed)
+    runs = [_timed_run(chunks, parser_name, strict, mode) for _ in range(repeat)]
+    latencies, failures = min(runs, key=lambda run: sum(run[0]))
+    ordered = sorted(latencies)
+    peak, blocks = _memory_run(chunks, parser_name, strict, mode) if memory else (None, None)
+    return {
+        "workload": name,
+        "size": len(doc),
+        "parser": parser_name,
+        "strict": strict,
+        "mode": mode,
+        "tokens": len(chunks),
+        "failed_prefixes": failures,
+        "total_ms": sum(latencies) / 1e6,
+        "token_median_us": statistics.median(latencies) / 1e3,
+        "token_p95_us": ordered[int(len(ordered) * 0.95)] / 1e3,
+        "token_max_us": ordered[-1] / 1e3,
+        "peak_kib": peak / 1024 if memory else None,
+        "retained_blocks": blocks,
+    }
+
+
+def run(names=None, size=2000, parsers=None, stricts=(True, False), modes=MODES, repeat=3, seed=0, memory=True):
+    """Measure every combination and return ``{"meta": ..., "results": [...]}``."""
+    results = []
+    for name in names or workloads.WORKLOADS:
+        json5_only = workloads.WORKLOADS[name][1]
+        for parser_name in parsers or PARSERS:
+            if json5_only and parser_name != "json5":
+                continue
+            for strict in stricts:
+                for mode in modes:
+                    if parser_name in ("json-py", "json-numeric") and mode != "prefix":
+                        # The incremental scanner decodes scalars only; same as "json".
+                        continue
+                    results.append(measure(name, size, parser_name, strict, mode, repeat, seed, memory))
+    return {"meta": metadata(size, repeat, seed), "results": results}
+
+
+def metadata(size, repeat, seed):
+    return {
+        "partialjson": partialjson.__version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+        "size": size,
+        "repeat": repeat,
+        "seed": seed,
+    }
+
+
+def row_key(row):
+    return (row["workload"], row["size"], row["parser"], row["strict"], row["mode"])
@@ -0,0 +1,89 @@
+"""Deterministic documents shaped like LLM output, split into token-sized chunks."""
+import json
+import random
+
+_WORDS = (
+    "the model returns a partial answer while streaming tokens to the client and "
+    "each chunk may end inside a string number literal or nested container"
+).split()
+
+
+def _sentence(rng, words):
+    return " ".join(rng.choice(_WORDS) for _ in range(words))
+
+
+def long_string(rng, size):
+    """One long message field with escapes and non-ASCII text, as in chat completions."""
+    parts = []
+    while sum(map(len, parts)) < size:
+        parts.append(_sentence(rng, 12))
+        parts.append(rng.choice(["\n", "\t", ' "quoted" ', " café ", " \\ "]))
+    return json.dumps({"role": "assistant", "content": "".join(parts)[:size]})
+
+
+def wide_object(rng, size):
+    """A flat object with many short fields, as in tool-call arguments."""
+    doc = {}
+    while len(json.dumps(doc)) < size:
+        key = f"field_{len(doc)}"
+        doc[key] = rng.choice([_sentence(rng, 3), rng.randint(0, 10**6), rng.random(), True, None])
+    return json.dumps(doc)
+
+
+def deep_nesting(rng, size):
+    """Objects and arrays nested a few hundred levels deep."""
+    depth = max(1, size // 24)
+    doc = {"leaf": _sentence(rng, 2)}
+    for level in range(depth):
+        doc = {"level": level, "child": doc} if level % 2 else [level, doc]
+    return json.dumps(doc)
+
+
+def number_array(rng, size):
+    """Arrays of ints and floats, as in embeddings or scores."""
+    values = []
+    while len(values) * 12 < size:
+        values.append(round(rng.uniform(-1, 1), 8) if rng.random() < 0.8 else rng.randint(-1000, 1000))
+    return json.dumps({"embedding": values})
+
+
+def json5_config(rng, size):
+    """A JSON5 config with comments, unquoted keys, single quotes and trailing commas."""
+    lines = ["{"]
+    while sum(map(len, lines)) < size:
+        n = len(lines)
+        lines.append(f"  // {_sentence(rng, 6)}")
+        lines.append(f"  key{n}: '{_sentence(rng, 3)}',")
+        lines.append(f"  /* {_sentence(rng, 4)} */ count{n}: {rng.choice(['0x1F', '+4', '.5', 'Infinity', '12'])},")
+        lines.append(f"  list{n}: [1, 2, 3,],")
+    lines.append("}")
+    return "\n".join(lines)
+
+
+# name -> (generator, json5 only)
+WORKLOADS = {
+    "long_string": (long_string, False),
+    "wide_object": (wide_object, False),
+    "deep_nesting": (deep_nesting, False),
+    "number_array": (number_array, False),
+    "json5_config": (json5_config, True),
+}
+
+
+def tokenize(doc, rng, low=1, high=6):
+    """Split ``doc`` into chunks of ``low`` to ``high`` characters, like streamed tokens."""
+    chunks = []
+    pos = 0
+    while pos < len(doc):
+        step = rng.randint(low, high)
+        chunks.append(doc[pos : pos + step])
+        pos += step
+    return chunks
+
+
+def build(name, size, seed=0):
+    """Return ``(document, chunks)`` for workload ``name``."""
+    rng = random.Random(f"{name}-{size}-{seed}")
+    generator, _ = WORKLOADS[name]
+    doc = generator(rng, size)
+    return doc, tokenize(doc, rng)
@@ -6,6 +6,19 @@ Parsing ChatGPT JSON stream response — Partial and incomplete JSON parser pyth
 
 from .json_parser import JSONParser, create_json_parser
 from .json5_parser import create_json5_parser
+from .delta import apply_patch, diff_snapshots
+from .incremental import (
+    IncrementalDocumentParser,
+    IncrementalEventParser,
+    IncrementalJSONParser,
+    iter_documents,
+    iter_events,
+)
+from .pool import ParserPool, parse_many
+from .cache import ParseCache
+from .stats import ParseStats
+from .tape import Tape
+from .schema import SchemaParser
 
 __version__ = "1.1.0"
 __author__ = "Nima Akbarzadeh"
@@ -19,5 +32,18 @@ __all__ = [
     "JSONParser",
     "create_json_parser",
     "create_json5_parser",
+    "IncrementalJSONParser",
+    "IncrementalEventParser",
+    "iter_events",
+    "IncrementalDocumentParser",
+    "iter_documents",
+    "diff_snapshots",
+    "apply_patch",
+    "ParserPool",
+    "parse_many",
+    "ParseCache",
+    "ParseStats",
+    "Tape",
+    "SchemaParser",
     "PYPI_SIMPLE_ENDPOINT",
 ]
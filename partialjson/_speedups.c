@@ -0,0 +1,853 @@
+/*
+ * Optional accelerator for partialjson.json_parser.
+ *
+ * parse_container(parser, s, i, e) is a C port of _JSONParser._parse_container
+ * and returns the same (value, index) pair. Plain strings, numbers and
+ * literals are decoded here; any scalar whose result is not obvious (escapes
+ * in strict mode, exponents, malformed numbers, characters without a fast
+ * path) is handed to the parser's own Python methods, so results and errors
+ * match the pure-Python engine. With the parser's numeric_arrays option,
+ * arrays of plain numbers are packed as in _JSONParser._pack_numbers, and the
+ * cases that need Python's rules are again handed to the parser.
+ *
+ * skip_value(s, i) is a C port of _JSONParser._skip_value.
+ */
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+static PyObject *JSONDecodeError = NULL;
+static PyObject *str_parsers = NULL;
+static PyObject *str_strict = NULL;
+static PyObject *str_max_depth = NULL;
+static PyObject *str_numeric_arrays = NULL;
+static PyObject *str_to_ndarray = NULL;
+static PyObject *array_type = NULL;
+
+typedef struct {
+    PyObject *acc;
+    PyObject *key;
+} Frame;
+
+typedef struct {
+    PyObject *parser;
+    PyObject *s;
+    int kind;
+    const void *data;
+    Py_ssize_t n;
+    PyObject *parsers;
+    int strict;
+    PyObject *e;
+    int numeric;
+    PyObject *to_ndarray;
+} State;
+
+#define READ(st, i) PyUnicode_READ((st)->kind, (st)->data, (i))
+#define IS_DIGIT(c) ((c) >= '0' && (c) <= '9')
+
+static Py_ssize_t
+skip_space(State *st, Py_ssize_t i)
+{
+    while (i < st->n && Py_UNICODE_ISSPACE(READ(st, i))) {
+        i++;
+    }
+    return i;
+}
+
+static int
+raise_e(State *st)
+{
+    PyErr_SetObject((PyObject *)Py_TYPE(st->e), st->e);
+    return -1;
+}
+
+/* Look up the Python parser for character c; NULL (no error set) if there is none. */
+static PyObject *
+lookup_parser(State *st, Py_UCS4 c)
+{
+    PyObject *key = PyUnicode_FromOrdinal(c);
+    PyObject *func;
+    if (key == NULL) {
+        return NULL;
+    }
+    func = PyDict_GetItemWithError(st->parsers, key);
+    Py_DECREF(key);
+    return func;
+}
+
+static int
+call_parser(State *st, PyObject *func, Py_ssize_t i, PyObject **value, Py_ssize_t *end)
+{
+    PyObject *index, *result;
+    index = PyLong_FromSsize_t(i);
+    if (index == NULL) {
+        return -1;
+    }
+    result = PyObject_CallFunctionObjArgs(func, st->parser, st->s, index, st->e, NULL);
+    Py_DECREF(index);
+    if (result == NULL) {
+        return -1;
+    }
+    if (!PyTuple_Check(result) || PyTuple_GET_SIZE(result) != 2) {
+        PyErr_SetString(PyExc_TypeError, "parser must return a (value, index) tuple");
+        Py_DECREF(result);
+        return -1;
+    }
+    *end = PyLong_AsSsize_t(PyTuple_GET_ITEM(result, 1));
+    if (*end == -1 && PyErr_Occurred()) {
+        Py_DECREF(result);
+        return -1;
+    }
+    *value = PyTuple_GET_ITEM(result, 0);
+    Py_INCREF(*value);
+    Py_DECREF(result);
+    return 0;
+}
+
+/* Like _JSONParser._parse_string, or NULL with *done = 0 when Python must decide. */
+static PyObject *
+fast_string(State *st, Py_ssize_t i, Py_ssize_t *end, int *done)
+{
+    Py_ssize_t j = i + 1;
+    Py_UCS4 c;
+    *done = 1;
+    while (j < st->n) {
+        c = READ(st, j);
+        if (c == '"') {
+            *end = j + 1;
+            return PyUnicode_Substring(st->s, i + 1, j);
+        }
+        if (c == '\\') {
+            if (st->strict) {
+                break;
+            }
+            j += 2;
+            continue;
+        }
+        if (c < 0x20 && st->strict) {
+            break;
+        }
+        j++;
+    }
+    if (j >= st->n) {
+        /* Unterminated; without escapes it decodes to itself in both modes. */
+        *end = st->n;
+        return PyUnicode_Substring(st->s, i + 1, st->n);
+    }
+    *done = 0;
+    return NULL;
+}
+
+/* Like _JSONParser._parse_number for -?[0-9]+(\.[0-9]*)?, otherwise *done = 0. */
+static PyObject *
+fast_number(State *st, Py_ssize_t i, Py_ssize_t *end, int *done)
+{
+    Py_ssize_t j = i, k, digits_end;
+    long long value = 0;
+    int negative = 0;
+    Py_UCS4 c;
+    char buf[64];
+    char *stop;
+    double d;
+
+    *done = 0;
+    if (READ(st, j) == '-') {
+        negative = 1;
+        j++;
+    }
+    k = j;
+    while (k < st->n && IS_DIGIT(READ(st, k))) {
+        k++;
+    }
+    if (k == j || k - j > 18) {
+        return NULL;
+    }
+    digits_end = k;
+    if (k < st->n && READ(st, k) == '.') {
+        k++;
+        while (k < st->n && IS_DIGIT(READ(st, k))) {
+            k++;
+        }
+    }
+    if (k < st->n) {
+        c = READ(st, k);
+        if (c == '.' || c == '-') {
+            return NULL;
+        }
+    }
+    if (k > digits_end + 1) {
+        /* A fraction: float(num_str). */
+        Py_ssize_t length = k - i, m;
+        if (length >= (Py_ssize_t)sizeof(buf)) {
+            return NULL;
+        }
+        for (m = 0; m < length; m++) {
+            buf[m] = (char)READ(st, i + m);
+        }
+        buf[length] = '\0';
+        d = PyOS_string_to_double(buf, &stop, NULL);
+        if (d == -1.0 && PyErr_Occurred()) {
+            PyErr_Clear();
+            return NULL;
+        }
+        if (stop != buf + length) {
+            return NULL;
+        }
+        *done = 1;
+        *end = k;
+        return PyFloat_FromDouble(d);
+    }
+    /* An integer, possibly with a trailing '.': int(num_str.rstrip(".")). */
+    for (; j < digits_end; j++) {
+        value = value * 10 + (READ(st, j) - '0');
+    }
+    *done = 1;
+    *end = k;
+    return PyLong_FromLongLong(negative ? -value : value);
+}
+
+/* Decode the scalar at i (s[i] is not whitespace) into *value; -1 on error. */
+static int
+parse_scalar(State *st, Py_ssize_t i, PyObject **value, Py_ssize_t *end)
+{
+    Py_UCS4 c = READ(st, i);
+    PyObject *func;
+    int done = 0;
+
+    switch (c) {
+    case '"':
+        *value = fast_string(st, i, end, &done);
+        break;
+    case '-': case '.':
+    case '0': case '1': case '2': case '3': case '4':
+    case '5': case '6': case '7': case '8': case '9':
+        *value = fast_number(st, i, end, &done);
+        break;
+    case 't':
+        *value = Py_True;
+        Py_INCREF(*value);
+        *end = i + 4;
+        return 0;
+    case 'f':
+        *value = Py_False;
+        Py_INCREF(*value);
+        *end = i + 5;
+        return 0;
+    case 'n':
+        *value = Py_None;
+        Py_INCREF(*value);
+        *end = i + 4;
+        return 0;
+    }
+    if (done) {
+        return *value == NULL ? -1 : 0;
+    }
+    if (PyErr_Occurred()) {
+        return -1;
+    }
+    func = lookup_parser(st, c);
+    if (func == NULL) {
+        return PyErr_Occurred() ? -1 : raise_e(st);
+    }
+    Py_INCREF(func);
+    done = call_parser(st, func, i, value, end);
+    Py_DECREF(func);
+    return done;
+}
+
+/* Whether s[i] has a parser, as in `s[i] in parsers`. */
+static int
+has_parser(State *st, Py_ssize_t i)
+{
+    Py_UCS4 c = READ(st, i);
+    if (IS_DIGIT(c) || c == '-' || c == '.' || c == '"' || c == 't' || c == 'f' ||
+        c == 'n' || c == '[' || c == '{') {
+        return 1;
+    }
+    if (lookup_parser(st, c) != NULL) {
+        return 1;
+    }
+    return PyErr_Occurred() ? -1 : 0;
+}
+
+static int
+set_item(PyObject *acc, PyObject *key, PyObject *value)
+{
+    if (PyList_CheckExact(acc)) {
+        return PyList_Append(acc, value);
+    }
+    return PyDict_SetItem(acc, key, value);
+}
+
+/* array("d") holding numbers[:count], wrapped by parser._to_ndarray when set. */
+static PyObject *
+pack_doubles(State *st, double *numbers, Py_ssize_t count)
+{
+    PyObject *bytes, *packed, *wrapped;
+    bytes = PyBytes_FromStringAndSize((const char *)numbers, count * (Py_ssize_t)sizeof(double));
+    if (bytes == NULL) {
+        return NULL;
+    }
+    packed = PyObject_CallFunction(array_type, "sO", "d", bytes);
+    Py_DECREF(bytes);
+    if (packed == NULL || st->to_ndarray == Py_None) {
+        return packed;
+    }
+    wrapped = PyObject_CallOneArg(st->to_ndarray, packed);
+    Py_DECREF(packed);
+    return wrapped;
+}
+
+/* Hand the array whose elements start at start to parser._pack_numbers. */
+static int
+pack_in_python(State *st, Py_ssize_t start, PyObject **value, Py_ssize_t *end)
+{
+    PyObject *result = PyObject_CallMethod(st->parser, "_pack_numbers", "OnO", st->s, start, st->e);
+    if (result == NULL) {
+        return -1;
+    }
+    if (result == Py_None) {
+        Py_DECREF(result);
+        return 0;
+    }
+    if (!PyArg_ParseTuple(result, "On", value, end)) {
+        Py_DECREF(result);
+        return -1;
+    }
+    Py_INCREF(*value);
+    Py_DECREF(result);
+    return 1;
+}
+
+/* Convert s[i:j] with PyOS_string_to_double, as float() does; 0 if it is not a whole number. */
+static int
+to_double(State *st, Py_ssize_t i, Py_ssize_t j, double *d)
+{
+    char buf[64];
+    char *stop;
+    Py_ssize_t m;
+    for (m = 0; m < j - i; m++) {
+        buf[m] = (char)READ(st, i + m);
+    }
+    buf[j - i] = '\0';
+    *d = PyOS_string_to_double(buf, &stop, NULL);
+    if (*d == -1.0 && PyErr_Occurred()) {
+        PyErr_Clear();
+        return 0;
+    }
+    return stop == buf + (j - i);
+}
+
+/*
+ * Like _JSONParser._pack_numbers for the array whose elements start at start:
+ * 1 with *value set to the packed array, 0 to parse it element by element,
+ * -1 on error.
+ */
+static int
+pack_numbers(State *st, Py_ssize_t start, PyObject **value, Py_ssize_t *end)
+{
+    double *numbers = NULL, *grown, d;
+    Py_ssize_t count = 0, capacity = 0, i = start, j, k;
+    Py_UCS4 c, prev;
+    PyObject *token, *number;
+    int result = 0;
+
+    for (;;) {
+        i = skip_space(st, i);
+        prev = 0;
+        for (j = i; j < st->n; j++) {
+            c = READ(st, j);
+            if (!(IS_DIGIT(c) || c == '.' || c == '-' || c == 'e' || c == 'E' || c == '+')) {
+                break;
+            }
+            if (c == '+' && prev != 'e' && prev != 'E') {
+                goto done;
+            }
+            prev = c;
+        }
+        if (j - i >= 64) {
+            result = pack_in_python(st, start, value, end);
+            goto done;
+        }
+        k = skip_space(st, j);
+        if (k >= st->n) {
+            /* The last number may be cut off. */
+            if (j > i) {
+                if (!to_double(st, i, j, &d)) {
+                    token = PyUnicode_Substring(st->s, i, j);
+                    if (token == NULL) {
+                        result = -1;
+                        goto done;
+                    }
+                    number = PyObject_CallMethod(st->parser, "_last_number", "OO", token, st->e);
+                    Py_DECREF(token);
+                    if (number == NULL) {
+                        result = -1;
+                        goto done;
+                    }
+                    if (number == Py_None) {
+                        Py_DECREF(number);
+                        goto done;
+                    }
+                    if (PyUnicode_Check(number)) {
+                        j = i;
+                    }
+                    else {
+                        d = PyFloat_AsDouble(number);
+                    }
+                    Py_DECREF(number);
+                    if (d == -1.0 && PyErr_Occurred()) {
+                        result = -1;
+                        goto done;
+                    }
+                }
+            }
+            *end = st->n;
+        }
+        else {
+            c = READ(st, k);
+            if (c != ',' && c != ']') {
+                goto done;
+            }
+            if (j == i) {
+                /* Only a trailing comma may leave an element empty. */
+                if (c == ',' || count == 0) {
+                    goto done;
+                }
+            }
+            else if (!to_double(st, i, j, &d)) {
+                goto done;
+            }
+            *end = k + 1;
+        }
+        if (j > i) {
+            if (count == capacity) {
+                capacity = capacity ? capacity * 2 : 64;
+                grown = PyMem_Realloc(numbers, capacity * sizeof(double));
+                if (grown == NULL) {
+                    PyErr_NoMemory();
+                    result = -1;
+                    goto done;
+                }
+                numbers = grown;
+            }
+            numbers[count++] = d;
+        }
+        if (k >= st->n || READ(st, k) == ']') {
+            break;
+        }
+        i = k + 1;
+    }
+    if (count > 0) {
+        *value = pack_doubles(st, numbers, count);
+        result = *value == NULL ? -1 : 1;
+    }
+
+done:
+    PyMem_Free(numbers);
+    return result;
+}
+
+static int
+raise_depth(PyObject *s, Py_ssize_t pos)
+{
+    PyObject *exc = PyObject_CallFunction(JSONDecodeError, "sOn", "Maximum nesting depth exceeded", s, pos);
+    if (exc != NULL) {
+        PyErr_SetObject(JSONDecodeError, exc);
+        Py_DECREF(exc);
+    }
+    return -1;
+}
+
+static PyObject *
+parse_container(PyObject *module, PyObject *args)
+{
+    PyObject *parser, *s, *e, *obj;
+    Py_ssize_t i, n, max_depth = 0, depth = 0, capacity = 16, end;
+    Frame *stack = NULL;
+    PyObject *acc = NULL, *key = NULL, *value = NULL;
+    State st;
+    int closed, found, limited = 0;
+    Py_UCS4 c;
+
+    if (!PyArg_ParseTuple(args, "OUnO:parse_container", &parser, &s, &i, &e)) {
+        return NULL;
+    }
+    n = PyUnicode_GET_LENGTH(s);
+    if (i < 0 || i >= n) {
+        PyErr_SetString(PyExc_IndexError, "string index out of range");
+        return NULL;
+    }
+    st.s = s;
+    st.kind = PyUnicode_KIND(s);
+    st.data = PyUnicode_DATA(s);
+    st.n = n;
+    st.e = e;
+    st.parser = parser;
+    st.to_ndarray = NULL;
+    st.parsers = PyObject_GetAttr(parser, str_parsers);
+    if (st.parsers == NULL) {
+        return NULL;
+    }
+    if (!PyDict_Check(st.parsers)) {
+        PyErr_SetString(PyExc_TypeError, "_parsers must be a dict");
+        goto error;
+    }
+    obj = PyObject_GetAttr(parser, str_strict);
+    if (obj == NULL) {
+        goto error;
+    }
+    st.strict = PyObject_IsTrue(obj);
+    Py_DECREF(obj);
+    if (st.strict < 0) {
+        goto error;
+    }
+    obj = PyObject_GetAttr(parser, str_max_depth);
+    if (obj == NULL) {
+        goto error;
+    }
+    if (obj != Py_None) {
+        limited = 1;
+        max_depth = PyLong_AsSsize_t(obj);
+        if (max_depth == -1 && PyErr_Occurred()) {
+            Py_DECREF(obj);
+            goto error;
+        }
+    }
+    Py_DECREF(obj);
+    obj = PyObject_GetAttr(parser, str_numeric_arrays);
+    if (obj == NULL) {
+        goto error;
+    }
+    st.numeric = PyObject_IsTrue(obj);
+    Py_DECREF(obj);
+    if (st.numeric < 0) {
+        goto error;
+    }
+    if (st.numeric) {
+        st.to_ndarray = PyObject_GetAttr(parser, str_to_ndarray);
+        if (st.to_ndarray == NULL) {
+            goto error;
+        }
+        if (READ(&st, i) == '[') {
+            found = pack_numbers(&st, i + 1, &value, &end);
+            if (found < 0) {
+                goto error;
+            }
+            if (found) {
+                Py_DECREF(st.parsers);
+                Py_DECREF(st.to_ndarray);
+                return Py_BuildValue("(Nn)", value, end);
+            }
+        }
+    }
+
+    stack = PyMem_Malloc(capacity * sizeof(Frame));
+    if (stack == NULL) {
+        PyErr_NoMemory();
+        goto error;
+    }
+    acc = READ(&st, i) == '[' ? PyList_New(0) : PyDict_New();
+    if (acc == NULL) {
+        goto error;
+    }
+    i++;
+
+    for (;;) {
+        i = skip_space(&st, i);
+        closed = 1;
+        c = i < n ? READ(&st, i) : 0;
+        if (PyList_CheckExact(acc)) {
+            if (i < n && c == ']') {
+                i++;
+            }
+            else if (i < n) {
+                closed = 0;
+                if (c == '[' || c == '{') {
+                    goto push;
+                }
+                if (parse_scalar(&st, i, &value, &end) < 0) {
+                    goto error;
+                }
+                i = end;
+                if (PyList_Append(acc, value) < 0) {
+                    goto error;
+                }
+                Py_CLEAR(value);
+            }
+        }
+        else if (i < n && c == '}') {
+            i++;
+        }
+        else if (i < n) {
+            if (c == '[' || c == '{') {
+                raise_e(&st);
+                goto error;
+            }
+            Py_CLEAR(key);
+            if (parse_scalar(&st, i, &key, &end) < 0) {
+                goto error;
+            }
+            i = skip_space(&st, end);
+            if (i >= n || READ(&st, i) == '}') {
+                if (key != Py_None && PyDict_SetItem(acc, key, Py_None) < 0) {
+                    goto error;
+                }
+                if (i < n) {
+                    i++;
+                }
+            }
+            else if (READ(&st, i) != ':') {
+                if (key != Py_None && PyDict_SetItem(acc, key, Py_None) < 0) {
+                    goto error;
+                }
+            }
+            else {
+                i = skip_space(&st, i + 1);
+                c = i < n ? READ(&st, i) : 0;
+                if (i >= n || c == ',' || c == '}') {
+                    if (PyDict_SetItem(acc, key, Py_None) < 0) {
+                        goto error;
+                    }
+                    if (i < n) {
+                        i++;
+                    }
+                }
+                else if ((found = has_parser(&st, i)) != 0) {
+                    if (found < 0) {
+                        goto error;
+                    }
+                    closed = 0;
+                    if (c == '[' || c == '{') {
+                        goto push;
+                    }
+                    if (parse_scalar(&st, i, &value, &end) < 0) {
+                        goto error;
+                    }
+                    i = end;
+                    if (PyDict_SetItem(acc, key, value) < 0) {
+                        goto error;
+                    }
+                    Py_CLEAR(value);
+                }
+                else if (key != Py_None) {
+                    if (PyDict_SetItem(acc, key, Py_None) < 0) {
+                        goto error;
+                    }
+                }
+            }
+        }
+
+    close:
+        if (closed) {
+            if (depth == 0) {
+                Py_XDECREF(key);
+                Py_DECREF(st.parsers);
+                Py_XDECREF(st.to_ndarray);
+                PyMem_Free(stack);
+                return Py_BuildValue("(Nn)", acc, i);
+            }
+            value = acc;
+            depth--;
+            acc = stack[depth].acc;
+            Py_XDECREF(key);
+            key = stack[depth].key;
+            if (set_item(acc, key, value) < 0) {
+                goto error;
+            }
+            Py_CLEAR(value);
+        }
+        i = skip_space(&st, i);
+        if (i < n && READ(&st, i) == ',') {
+            i++;
+        }
+        continue;
+
+    push:
+        if (depth == capacity) {
+            Frame *grown;
+            capacity *= 2;
+            grown = PyMem_Realloc(stack, capacity * sizeof(Frame));
+            if (grown == NULL) {
+                PyErr_NoMemory();
+                goto error;
+            }
+            stack = grown;
+        }
+        stack[depth].acc = acc;
+        stack[depth].key = PyList_CheckExact(acc) ? NULL : key;
+        if (PyList_CheckExact(acc)) {
+            Py_CLEAR(key);
+        }
+        key = NULL;
+        depth++;
+        acc = c == '[' ? PyList_New(0) : PyDict_New();
+        if (acc == NULL) {
+            goto error;
+        }
+        i++;
+        if (limited && depth >= max_depth) {
+            raise_depth(s, i - 1);
+            goto error;
+        }
+        if (c == '[' && st.numeric) {
+            found = pack_numbers(&st, i, &value, &end);
+            if (found < 0) {
+                goto error;
+            }
+            if (found) {
+                /* Closed like any other array. */
+                Py_DECREF(acc);
+                acc = value;
+                value = NULL;
+                i = end;
+                closed = 1;
+                goto close;
+            }
+        }
+    }
+
+error:
+    Py_XDECREF(value);
+    Py_XDECREF(acc);
+    Py_XDECREF(key);
+    if (stack != NULL) {
+        while (depth > 0) {
+            depth--;
+            Py_DECREF(stack[depth].acc);
+            Py_XDECREF(stack[depth].key);
+        }
+        PyMem_Free(stack);
+    }
+    Py_DECREF(st.parsers);
+    Py_XDECREF(st.to_ndarray);
+    return NULL;
+}
+
+/* The end of the string at i, or n if it is unterminated. */
+static Py_ssize_t
+skip_string(State *st, Py_ssize_t i)
+{
+    Py_UCS4 c;
+    i++;
+    while (i < st->n) {
+        c = READ(st, i);
+        if (c == '"') {
+            return i + 1;
+        }
+        if (c == '\\') {
+            i++;
+        }
+        i++;
+    }
+    return st->n;
+}
+
+static PyObject *
+skip_value(PyObject *module, PyObject *args)
+{
+    PyObject *s;
+    Py_ssize_t i, depth = 0;
+    State st;
+    Py_UCS4 c;
+
+    if (!PyArg_ParseTuple(args, "Un:skip_value", &s, &i)) {
+        return NULL;
+    }
+    st.kind = PyUnicode_KIND(s);
+    st.data = PyUnicode_DATA(s);
+    st.n = PyUnicode_GET_LENGTH(s);
+    if (i < 0) {
+        PyErr_SetString(PyExc_IndexError, "string index out of range");
+        return NULL;
+    }
+    if (i >= st.n) {
+        return PyLong_FromSsize_t(st.n);
+    }
+    c = READ(&st, i);
+    if (c == '"') {
+        return PyLong_FromSsize_t(skip_string(&st, i));
+    }
+    if (c != '[' && c != '{') {
+        while (i < st.n) {
+            c = READ(&st, i);
+            if (c == ',' || c == ']' || c == '}' || Py_UNICODE_ISSPACE(c)) {
+                break;
+            }
+            i++;
+        }
+        return PyLong_FromSsize_t(i);
+    }
+    while (i < st.n) {
+        c = READ(&st, i);
+        if (c == '"') {
+            i = skip_string(&st, i);
+            continue;
+        }
+        i++;
+        if (c == '[' || c == '{') {
+            depth++;
+        }
+        else if (c == ']' || c == '}') {
+            depth--;
+            if (depth == 0) {
+                break;
+            }
+        }
+    }
+    return PyLong_FromSsize_t(i);
+}
+
+static PyMethodDef speedups_methods[] = {
+    {"parse_container", parse_container, METH_VARARGS,
+     "parse_container(parser, s, i, e) -> (value, index)\n\n"
+     "C implementation of _JSONParser._parse_container."},
+    {"skip_value", skip_value, METH_VARARGS,
+     "skip_value(s, i) -> index\n\n"
+     "C implementation of _JSONParser._skip_value."},
+    {NULL, NULL, 0, NULL},
+};
+
+static struct PyModuleDef speedups_module = {
+    PyModuleDef_HEAD_INIT,
+    "partialjson._speedups",
+    "C accelerator for partialjson.json_parser.",
+    -1,
+    speedups_methods,
+    NULL,
+    NULL,
+    NULL,
+    NULL,
+};
+
+PyMODINIT_FUNC
+PyInit__speedups(void)
+{
+    PyObject *array, *json = PyImport_ImportModule("json");
+    if (json == NULL) {
+        return NULL;
+    }
+    JSONDecodeError = PyObject_GetAttrString(json, "JSONDecodeError");
+    Py_DECREF(json);
+    if (JSONDecodeError == NULL) {
+        return NULL;
+    }
+    str_parsers = PyUnicode_InternFromString("_parsers");
+    str_strict = PyUnicode_InternFromString("strict");
+    str_max_depth = PyUnicode_InternFromString("max_depth");
+    str_numeric_arrays = PyUnicode_InternFromString("numeric_arrays");
+    str_to_ndarray = PyUnicode_InternFromString("_to_ndarray");
+    if (str_parsers == NULL || str_strict == NULL || str_max_depth == NULL || str_numeric_arrays == NULL ||
+        str_to_ndarray == NULL) {
+        return NULL;
+    }
+    array = PyImport_ImportModule("array");
+    if (array == NULL) {
+        return NULL;
+    }
+    array_type = PyObject_GetAttrString(array, "array");
+    Py_DECREF(array);
+    if (array_type == NULL) {
+        return NULL;
+    }
+    return PyModule_Create(&speedups_module);
+}
@@ -0,0 +1,90 @@
+"""asyncio integration - parsed snapshots from an async stream of chunks."""
+import asyncio
+
+from .incremental import IncrementalJSONParser
+
+
+def _join(chunks, decode):
+    if len(chunks) == 1:
+        return chunks[0]
+    if all(isinstance(chunk, str) for chunk in chunks):
+        return "".join(chunks)
+    if not any(isinstance(chunk, str) for chunk in chunks):
+        return b"".join(chunks)
+    # Mixed text and bytes: decode the bytes in order, as feeding them one by one would.
+    return "".join(chunk if isinstance(chunk, str) else decode(chunk) for chunk in chunks)
+
+
+async def aparse_stream(
+    chunks,
+    *,
+    min_interval=None,
+    coalesce=True,
+    strict=True,
+    json5_enabled=False,
+    offload_size=None,
+    executor=None,
+):
+    """Yield a parsed snapshot for the text or UTF-8 byte chunks of an async iterable.
+
+    With ``coalesce``, chunks arriving while the consumer is still busy with
+    the previous snapshot are fed together and produce one snapshot, and
+    ``min_interval`` (seconds) spaces snapshots out further. Without it, every
+    chunk yields a snapshot. The snapshot for the last chunk is always
+    yielded. Once the buffer reaches ``offload_size`` characters, parsing runs
+    in ``executor`` (the loop's default executor if ``None``) instead of on
+    the event loop.
+    """
+    if min_interval is not None and not coalesce:
+        raise ValueError("min_interval requires coalesce=True")
+    parser = IncrementalJSONParser(strict=strict, json5_enabled=json5_enabled)
+    loop = asyncio.get_running_loop()
+
+    async def feed(data):
+        if offload_size is not None and len(parser.buffer) + len(data) >= offload_size:
+            return await loop.run_in_executor(executor, parser.feed, data)
+        return parser.feed(data)
+
+    if not coalesce:
+        async for chunk in chunks:
+            yield await feed(chunk)
+        return
+
+    pending = []
+    ready = asyncio.Event()
+    state = {"done": False, "error": None}
+
+    async def pump():
+        try:
+            async for chunk in chunks:
+                pending.append(chunk)
+                ready.set()
+        except Exception as e:
+            state["error"] = e
+        finally:
+            state["done"] = True
+            ready.set()
+
+    task = loop.create_task(pump())
+    last = None
+    try:
+        while True:
+            await ready.wait()
+            if min_interval is not None and last is not None and not state["done"]:
+                delay = last + min_interval - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            ready.clear()
+            done = state["done"]
+            batch = pending[:]
+            del pending[:]
+            if batch:
+                snapshot = await feed(_join(batch, parser._decoder.decode))
+                yield snapshot
+                last = loop.time()
+            if done:
+                if state["error"] is not None:
+                    raise state["error"]
+                return
+    finally:
+        task.cancel()
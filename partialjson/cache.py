@@ -0,0 +1,121 @@
+"""Result cache - reuses parse results and parser states for repeated and growing buffers."""
+from collections import OrderedDict
+
+from .incremental import IncrementalJSONParser
+from .json_parser import _decode_utf8
+
+
+class ParseCache:
+    """Bounded LRU cache in front of ``IncrementalJSONParser``.
+
+    ``parse(s)`` returns the same value as ``parse()`` on a fresh parser. A
+    buffer that was parsed before is answered from the cache. Otherwise
+    parsing resumes from the longest cached parser state whose buffer is a
+    prefix of ``s``, so retries, several subscribers to one stream and a
+    stream parsed again after every chunk only scan the new input. States
+    are kept every ``checkpoint_interval`` characters and at the end of the
+    parsed buffer, where the latter replaces the end state it resumed from.
+
+    At most ``max_entries`` results and states are kept, holding at most
+    ``max_size`` characters of buffers between them; the least recently used
+    ones are evicted first. ``hits``, ``misses`` and ``resumes`` count the
+    calls answered from the cache, the calls that had to parse, and the
+    misses that started from a cached state. Cached results are shared
+    between callers and should be treated as read-only. A cache must not be
+    used from several threads at once.
+    """
+
+    def __init__(
+        self,
+        max_entries=256,
+        max_size=1 << 24,
+        checkpoint_interval=4096,
+        strict=True,
+        json5_enabled=False,
+        on_extra_token=None,
+    ):
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.checkpoint_interval = checkpoint_interval
+        self._options = dict(strict=strict, json5_enabled=json5_enabled, on_extra_token=on_extra_token)
+        self.clear()
+
+    def clear(self):
+        """Drop every entry and reset the counters."""
+        # (is_checkpoint, buffer) -> result or parser, least recently used first.
+        self._entries = OrderedDict()
+        # Buffer length -> buffers of the checkpoints with that length.
+        self._lengths = {}
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.resumes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def parse(self, s):
+        if not isinstance(s, str):
+            s = _decode_utf8(s)
+        entries = self._entries
+        key = (False, s)
+        if key in entries:
+            entries.move_to_end(key)
+            self.hits += 1
+            return entries[key]
+        self.misses += 1
+
+        parser = self._checkpoint(s)
+        if parser is None:
+            parser = IncrementalJSONParser(**self._options)
+        else:
+            self.resumes += 1
+        pos = start = len(parser.buffer)
+        interval = self.checkpoint_interval
+        if interval:
+            for stop in range((pos // interval + 1) * interval, len(s), interval):
+                parser._consume(s[pos:stop])
+                self._store((True, parser.buffer), parser.copy())
+                pos = stop
+        result = parser.feed(s[pos:])
+        # Share the buffer with the result key instead of keeping an equal copy.
+        parser._buffer = s
+        self._store((True, s), parser)
+        if 0 < start < len(s) and (not interval or start % interval) and (True, s[:start]) in entries:
+            self._remove((True, s[:start]))
+        self._store(key, result)
+        return result
+
+    def _checkpoint(self, s):
+        """Return a copy of the longest cached parser state for a prefix of ``s``."""
+        for length in sorted(self._lengths, reverse=True):
+            if length > len(s):
+                continue
+            for buffer in self._lengths[length]:
+                if s.startswith(buffer):
+                    key = (True, buffer)
+                    self._entries.move_to_end(key)
+                    return self._entries[key].copy()
+        return None
+
+    def _store(self, key, value):
+        entries = self._entries
+        if key in entries:
+            entries.move_to_end(key)
+            return
+        entries[key] = value
+        self.size += len(key[1])
+        if key[0]:
+            self._lengths.setdefault(len(key[1]), []).append(key[1])
+        while entries and (len(entries) > self.max_entries or self.size > self.max_size):
+            self._remove(next(iter(entries)))
+
+    def _remove(self, key):
+        del self._entries[key]
+        is_checkpoint, buffer = key
+        self.size -= len(buffer)
+        if is_checkpoint:
+            buffers = self._lengths[len(buffer)]
+            buffers.remove(buffer)
+            if not buffers:
+                del self._lengths[len(buffer)]
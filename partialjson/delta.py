@@ -0,0 +1,72 @@
+"""Snapshot deltas - JSON-Patch style operations between consecutive parse results."""
+
+
+def _pointer(path, key):
+    return path + "/" + str(key).replace("~", "~0").replace("/", "~1")
+
+
+def diff_snapshots(old, new, append_strings=False):
+    """Return JSON-Patch (RFC 6902) operations turning ``old`` into ``new``.
+
+    Subtrees shared by identity are skipped without being compared, so
+    snapshots from ``IncrementalJSONParser`` diff in time proportional to the
+    open path. With ``append_strings``, a string that only grew is reported as
+    ``{"op": "append", "path": ..., "value": suffix}`` instead of a ``replace``.
+    """
+    ops = []
+    _diff(old, new, "", ops, append_strings)
+    return ops
+
+
+def _diff(old, new, path, ops, append_strings):
+    if old is new:
+        return
+    if type(old) is dict and type(new) is dict:
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": _pointer(path, key)})
+        for key, value in new.items():
+            if key in old:
+                _diff(old[key], value, _pointer(path, key), ops, append_strings)
+            else:
+                ops.append({"op": "add", "path": _pointer(path, key), "value": value})
+        return
+    if type(old) is list and type(new) is list:
+        common = min(len(old), len(new))
+        for i in range(common):
+            if old[i] is not new[i]:
+                _diff(old[i], new[i], _pointer(path, i), ops, append_strings)
+        for i in range(common, len(new)):
+            ops.append({"op": "add", "path": _pointer(path, i), "value": new[i]})
+        for i in reversed(range(common, len(old))):
+            ops.append({"op": "remove", "path": _pointer(path, i)})
+        return
+    if type(old) is type(new) and old == new:
+        return
+    if append_strings and type(old) is str and type(new) is str and new.startswith(old):
+        ops.append({"op": "append", "path": path, "value": new[len(old) :]})
+        return
+    ops.append({"op": "replace", "path": path, "value": new})
+
+
+def apply_patch(doc, ops):
+    """Apply operations from ``diff_snapshots`` to ``doc`` in place and return the result."""
+    for op in ops:
+        path = op["path"]
+        if not path:
+            doc = op["value"] if op["op"] != "append" else doc + op["value"]
+            continue
+        parts = [p.replace("~1", "/").replace("~0", "~") for p in path[1:].split("/")]
+        parent = doc
+        for part in parts[:-1]:
+            parent = parent[int(part)] if type(parent) is list else parent[part]
+        key = int(parts[-1]) if type(parent) is list else parts[-1]
+        if op["op"] == "remove":
+            del parent[key]
+        elif op["op"] == "add" and type(parent) is list:
+            parent.insert(key, op["value"])
+        elif op["op"] == "append":
+            parent[key] += op["value"]
+        else:
+            parent[key] = op["value"]
+    return doc
@@ -0,0 +1,921 @@
+"""Incremental parser - resumes from the previous chunk instead of reparsing the buffer."""
+import codecs
+import copy
+import json
+import re
+from itertools import islice
+
+from .delta import _diff, _pointer, diff_snapshots
+from .json5_parser import _IDENTIFIER, _JSON5_WHITESPACE, _LINE_COMMENT, _STRING_BODIES, create_json5_parser
+from .json5_parser import _INCOMPLETE_ESCAPE_REGEX as _INCOMPLETE_ESCAPE
+from .json5_parser import _SPACE as _JSON5_SPACE
+from .json_parser import _SPACE as _JSON_SPACE
+from .json_parser import create_json_parser
+
+# Frame states. Arrays use _VALUE and _AFTER_VALUE, objects use all four.
+_KEY, _COLON, _VALUE, _AFTER_VALUE = range(4)
+
+# Placeholders in the description of a snapshot's open containers.
+_MISSING = object()
+_OPEN = object()
+
+_LITERALS = {"t": "true", "f": "false", "n": "null"}
+_INTEGER = re.compile(r"-?[0-9]+")
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# The end of an unfinished string inside an escape, which strict mode decodes
+# as "" if the backslash is not itself escaped.
+_OPEN_ESCAPE = re.compile(r"\\(?:u[0-9a-fA-F]{0,3})?\Z")
+# Pieces of a string that json.loads decodes the same on their own; the last
+# one is captured so that a high surrogate can wait for its low half.
+_STRING_PIECES = re.compile(r'(?:([^"\\\x00-\x1f]+|\\["\\/bfnrt]|\\u[0-9a-fA-F]{4}))*')
+_HIGH_SURROGATE = re.compile(r"\\u[dD][89abAB][0-9a-fA-F]{2}")
+
+# A scalar token runs until a delimiter or whitespace.
+_JSON_TOKEN = re.compile(r'[^,:\[\]{}"\s]*')
+_JSON5_TOKEN = re.compile(r"[^,:\[\]{}\"'/\s\uFEFF]*")
+
+
+def _ends_in_escape(s):
+    """Whether the unfinished string ``s`` ends inside an escape."""
+    match = _OPEN_ESCAPE.search(s, max(0, len(s) - 5))
+    if match is None:
+        return False
+    # The backslash starts an escape if an even number of backslashes precede it.
+    start = match.start()
+    i = start
+    while i > 0 and s[i - 1] == "\\":
+        i -= 1
+    return (start - i) % 2 == 0
+
+
+class _Unsupported(Exception):
+    """Raised when the buffer leaves the shape the incremental scanner handles."""
+
+
+class _IncrementalScanner:
+    """Resumable scanner shared by the incremental front-ends.
+
+    Complete tokens are consumed from the buffer one at a time and reported
+    through the ``_open``/``_close``/``_add_key``/``_add_value`` hooks; the
+    scanner stops at the unfinished token at the end of the buffer.
+    """
+
+    def __init__(self, strict=True, json5_enabled=False, on_extra_token=None, max_depth=None):
+        if json5_enabled:
+            self._parser = create_json5_parser(strict=strict, on_extra_token=on_extra_token, max_depth=max_depth)
+            self._quotes = "\"'"
+            self._token = _JSON5_TOKEN
+            self._space = _JSON5_SPACE
+        else:
+            self._parser = create_json_parser(strict=strict, on_extra_token=on_extra_token, max_depth=max_depth)
+            self._quotes = '"'
+            self._token = _JSON_TOKEN
+            self._space = _JSON_SPACE
+        self._json5 = json5_enabled
+        self._max_depth = max_depth
+        self._error = json.JSONDecodeError("Invalid JSON", "", 0)
+        self.reset()
+
+    def reset(self):
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._resume = 0
+        # (offset from _pos, decoded text) of the unfinished string at _pos,
+        # with text None once it has an invalid escape.
+        self._decoded = None
+        self._stack = []
+        self._done = False
+
+    @property
+    def buffer(self):
+        return self._buffer
+
+    def _append(self, chunk):
+        if not isinstance(chunk, str):
+            chunk = self._decoder.decode(chunk)
+        # Concatenating to a local that holds the only reference lets CPython
+        # grow the string in place instead of copying the whole buffer.
+        buf = self._buffer
+        self._buffer = None
+        buf += chunk
+        self._buffer = buf
+
+    def _open(self, frame, is_list, pos):
+        """Return the container for a new frame nested in ``frame`` (``None`` at the root).
+
+        ``pos`` is the position of the opening bracket, and of the closing
+        bracket in ``_close``; ``_add_key`` gets the key's start and end.
+        """
+        return [] if is_list else {}
+
+    def _close(self, frame, pos):
+        pass
+
+    def _add_key(self, frame, key, start, end):
+        pass
+
+    def _add_value(self, frame, value):
+        pass
+
+    def _decode_mismatch(self, buf, pos, end):
+        """Decode a scalar token the partial parser does not stop exactly at."""
+        raise _Unsupported
+
+    def _is_space(self, c):
+        return c.isspace() or (self._json5 and c in _JSON5_WHITESPACE)
+
+    def _skip_comment(self, buf, pos):
+        """Return the position after the comment at ``pos``, or -1 if it is unfinished."""
+        if pos + 1 >= len(buf):
+            return -1
+        if buf[pos + 1] == "/":
+            end = _LINE_COMMENT.match(buf, pos + 2).end()
+            return end if end < len(buf) else -1
+        if buf[pos + 1] == "*":
+            end = buf.find("*/", pos + 2)
+            return end + 2 if end != -1 else -1
+        raise _Unsupported
+
+    def _scan_string(self, buf, pos):
+        """Return the position after the closing quote, or -1 if the string is unfinished."""
+        quote = buf[pos]
+        end = self._resume if pos == self._pos and self._resume else pos + 1
+        # The body pattern never stops between a backslash and the character
+        # it escapes, so its end is a safe place to resume from.
+        end = _STRING_BODIES[quote].match(buf, end).end()
+        if end < len(buf) and buf[end] == quote:
+            return end + 1
+        self._resume = end
+        return -1
+
+    def _partial_string(self, buf, pos):
+        """Decode the unfinished string at ``pos`` as the partial parser does.
+
+        Only the characters added since the previous call are decoded: the
+        text decoded so far is kept up to the last complete escape.
+        """
+        parser = self._parser
+        content_start = pos + 1
+        if not parser.strict or buf[pos] == "'":
+            if parser.strict and len(buf) - content_start <= 5 and _INCOMPLETE_ESCAPE.match(buf[content_start:]):
+                return ""
+            return buf[content_start:]
+        offset, text = self._decoded or (1, "")
+        if text is None:
+            return ""
+        start = pos + offset
+        match = _STRING_PIECES.match(buf, start)
+        end = safe = match.end()
+        last = match.group(1)
+        if last is not None and _HIGH_SURROGATE.fullmatch(last):
+            safe -= 6
+        if safe > start:
+            text += json.loads(f'"{buf[start:safe]}"')
+            self._decoded = (safe - pos, text)
+        if end < len(buf):
+            if not _OPEN_ESCAPE.match(buf, end):
+                # json.loads rejects the string whatever follows.
+                self._decoded = (safe - pos, None)
+            return ""
+        return text + json.loads(f'"{buf[safe:end]}"') if safe < end else text
+
+    def _scan_token(self, buf, pos):
+        """Return the delimiter position ending the scalar at ``pos``, or -1 at end of buffer."""
+        end = self._resume if pos == self._pos and self._resume else pos + 1
+        end = self._token.match(buf, end).end()
+        if end < len(buf):
+            return end
+        self._resume = end
+        return -1
+
+    def _scan_identifier(self, buf, pos):
+        end = _IDENTIFIER.match(buf, pos).end()
+        return end if end < len(buf) else -1
+
+    def _read_value(self, buf, pos):
+        """Decode the complete scalar at ``pos``; return ``(value, end)`` or ``None`` if unfinished."""
+        if buf[pos] in self._quotes:
+            end = self._scan_string(buf, pos)
+        else:
+            end = self._scan_token(buf, pos)
+        if end == -1:
+            return None
+        # The scalar parsers run on the whole buffer, exactly as in parse(), and
+        # must stop where the scanned token ends.
+        value, stop = self._parser._parse_value(buf, pos, self._error)
+        if stop != end:
+            value = self._decode_mismatch(buf, pos, end)
+        return value, end
+
+    def _advance(self):
+        buf = self._buffer
+        parsers = self._parser._parsers
+        stack = self._stack
+        pos = self._pos
+        try:
+            while pos < len(buf):
+                c = buf[pos]
+                if self._is_space(c):
+                    pos = self._space.match(buf, pos + 1).end()
+                    continue
+                if c == "/" and self._json5:
+                    end = self._skip_comment(buf, pos)
+                    if end == -1:
+                        break
+                    pos = end
+                    continue
+
+                frame = stack[-1] if stack else None
+                state = frame[1] if stack else _VALUE
+                is_list = stack and type(frame[0]) is list
+                if state == _AFTER_VALUE:
+                    if c == ",":
+                        frame[1] = _VALUE if is_list else _KEY
+                    elif c == ("]" if is_list else "}"):
+                        self._close(stack.pop(), pos)
+                        if not stack:
+                            self._done = True
+                            pos += 1
+                            break
+                    else:
+                        raise _Unsupported
+                    pos += 1
+                    continue
+                if state == _COLON:
+                    if c != ":":
+                        raise _Unsupported
+                    frame[1] = _VALUE
+                    pos += 1
+                    continue
+                if (state == _KEY and c == "}") or (is_list and c == "]"):
+                    self._close(stack.pop(), pos)
+                    pos += 1
+                    if not stack:
+                        self._done = True
+                        break
+                    continue
+
+                if state == _KEY:
+                    if c in self._quotes:
+                        end = self._scan_string(buf, pos)
+                        if end == -1:
+                            break
+                        key, stop = self._parser._parse_value(buf, pos, self._error)
+                        if stop != end:
+                            raise _Unsupported
+                    elif self._json5 and (c.isalnum() or c in "_$"):
+                        end = self._scan_identifier(buf, pos)
+                        if end == -1:
+                            break
+                        key = buf[pos:end]
+                    else:
+                        raise _Unsupported
+                    frame[1] = _COLON
+                    frame[2] = key
+                    self._add_key(frame, key, pos, end)
+                    self._resume = 0
+                    self._decoded = None
+                    pos = end
+                    continue
+
+                # state == _VALUE, or the root value
+                if c == "[" or c == "{":
+                    child = self._open(frame, c == "[", pos)
+                    if stack:
+                        frame[1] = _AFTER_VALUE
+                    stack.append([child, _VALUE if c == "[" else _KEY, None])
+                    pos += 1
+                    if self._max_depth is not None and len(stack) > self._max_depth:
+                        raise json.JSONDecodeError("Maximum nesting depth exceeded", buf, pos - 1)
+                    continue
+                if c not in parsers:
+                    raise _Unsupported
+                result = self._read_value(buf, pos)
+                if result is None:
+                    break
+                value, pos = result
+                self._add_value(frame, value)
+                self._resume = 0
+                self._decoded = None
+                if not stack:
+                    self._done = True
+                    break
+                frame[1] = _AFTER_VALUE
+        finally:
+            self._pos = pos
+
+
+class IncrementalJSONParser(_IncrementalScanner):
+    """Stateful parser fed one chunk at a time.
+
+    ``feed(chunk)`` returns the same snapshot ``parse(buffer)`` would return for
+    everything fed so far, but only the new input is scanned: completed keys,
+    values and containers are kept on a stack between calls, and only the
+    unfinished token at the end of the buffer is decoded again. For an
+    unfinished string that is only the part added since the previous feed;
+    the text decoded so far is kept up to the last complete escape.
+
+    Input the scanner does not handle (extra tokens, malformed or unusual
+    documents) is handed to the wrapped parser, so results and errors always
+    match ``parse(buffer)``.
+
+    Snapshots share structure: a value is decoded once and every closed
+    container is built once, and later snapshots reuse those objects, so a
+    subtree that is the same object (``is``) as in an earlier snapshot is
+    guaranteed to be unchanged. Only the containers that are still open are
+    new in each snapshot (shallow copies, which do not copy their closed
+    children), and the snapshot of a finished document is the tree built
+    while scanning it. Snapshots should therefore be treated as read-only.
+    When a chunk cannot change the result, the previous snapshot is returned
+    as is; ``update`` reports this.
+
+    Copying the open containers costs time proportional to their size, so
+    streaming one wide array that stays open is quadratic overall. With
+    ``live=True`` no copies are made: every snapshot is the parser's own tree,
+    updated in place by the next feed, with the unfinished token at the end
+    added to it until then. Use it when each snapshot is consumed before the
+    next chunk arrives. ``feed_patch`` diffs only the open path in both modes.
+
+    Chunks may be ``str`` or UTF-8 ``bytes``, ``bytearray`` or ``memoryview``;
+    each byte chunk is decoded once, and a multi-byte sequence cut at the end
+    of a chunk is held back until the next one completes it.
+    """
+
+    def __init__(self, strict=True, json5_enabled=False, on_extra_token=None, max_depth=None, live=False):
+        self.live = live
+        super().__init__(strict=strict, json5_enabled=json5_enabled, on_extra_token=on_extra_token, max_depth=max_depth)
+
+    def reset(self):
+        super().reset()
+        self._broken = False
+        self._last = None
+        self._stale = True
+        self._version = 0
+        self._root = None
+        # (container, key, previous value, value) of the unfinished token a
+        # live snapshot added to the open container.
+        self._placed = None
+        # The last snapshot's open containers, as built by _describe.
+        self._record = None
+
+    def feed(self, chunk):
+        return self.update(chunk)[0]
+
+    def update(self, chunk):
+        """Feed ``chunk`` and return ``(snapshot, changed)``.
+
+        ``changed`` is False when the chunk cannot alter the snapshot, for
+        example whitespace, a literal that only got longer (``t`` to ``tr``) or
+        a trailing ``.`` on an integer; the previous snapshot is then returned
+        without being rebuilt. In strict JSON mode a chunk that stays inside an
+        unfinished escape is unchanged too. A chunk that happens to rebuild an
+        equal value may still report True.
+        """
+        stale = self._stale
+        state = self._state()
+        tail = self._buffer[self._pos :]
+        self._consume(chunk)
+        if not stale and self._state() == state and self._same_tail(tail, self._buffer[self._pos :]):
+            self._stale = False
+            if self.live:
+                # _consume took the unfinished token out of the tree.
+                self._last = self._snapshot()
+            return self._last, False
+        self._last = self._snapshot()
+        self._stale = False
+        return self._last, True
+
+    def feed_patch(self, chunk, append_strings=True):
+        """Feed ``chunk`` and return the operations from the previous snapshot to the new one.
+
+        The first call diffs against ``None``, so it replaces the whole document.
+        See ``diff_snapshots`` for the operation format. Only the containers
+        that were open in the previous snapshot are compared, and in them only
+        the entries that could have changed.
+        """
+        previous, record = self._last, self._record
+        snapshot = self.feed(chunk)
+        if record is not None and self._record is not None:
+            ops = []
+            _diff_open(record, self._record, 0, snapshot, "", ops, append_strings)
+            return ops
+        if self.live and (type(previous) is list or type(previous) is dict):
+            # The previous snapshot was the live tree, which has changed since.
+            return [{"op": "replace", "path": "", "value": snapshot}]
+        return diff_snapshots(previous, snapshot, append_strings=append_strings)
+
+    def copy(self):
+        """Return an independent parser in the same state.
+
+        Only the containers that are still open are copied; closed subtrees
+        are shared with this parser.
+        """
+        placed = self._placed
+        self._unplace()
+        clone = copy.copy(self)
+        clone._decoder = codecs.getincrementaldecoder("utf-8")()
+        clone._decoder.setstate(self._decoder.getstate())
+        clone._stack = []
+        for container, state, key in self._stack:
+            container = container[:] if type(container) is list else dict(container)
+            if clone._stack:
+                parent, _, parent_key = clone._stack[-1]
+                if type(parent) is list:
+                    parent[-1] = container
+                else:
+                    parent[parent_key] = container
+            clone._stack.append([container, state, key])
+        if clone._stack:
+            clone._root = clone._stack[0][0]
+        if placed is not None:
+            self._place(placed[0], placed[1], placed[3])
+        return clone
+
+    def _place(self, container, key, value):
+        """Add the unfinished token to the live tree until the next feed."""
+        if key is _MISSING:
+            self._placed = container, key, None, value
+            container.append(value)
+        else:
+            self._placed = container, key, container.get(key, _MISSING), value
+            container[key] = value
+
+    def _unplace(self):
+        placed = self._placed
+        if placed is None:
+            return
+        self._placed = None
+        container, key, previous, _ = placed
+        if key is _MISSING:
+            container.pop()
+        elif previous is _MISSING:
+            del container[key]
+        else:
+            container[key] = previous
+
+    def _consume(self, chunk):
+        """Scan ``chunk`` without building a snapshot."""
+        self._unplace()
+        self._append(chunk)
+        self._stale = True
+        if not (self._broken or self._done):
+            try:
+                self._advance()
+            except Exception:
+                self._broken = True
+
+    def _state(self):
+        """Everything besides the unfinished tail that the snapshot depends on."""
+        top = tuple(self._stack[-1][1:]) if self._stack else None
+        return self._version, len(self._stack), top, self._done, self._broken
+
+    def _same_tail(self, old, new):
+        """Whether the unfinished tail ``new`` decodes like ``old`` did."""
+        if old == new:
+            return True
+        if self._broken or not new.startswith(old):
+            return False
+        if self._done:
+            space = self._space if self._json5 else _JSON_WHITESPACE
+            return space.fullmatch(new, len(old)) is not None
+        if not old:
+            return False
+        if not self._json5 and old[0] in _LITERALS:
+            # JSON literals are decided by their first character.
+            return _LITERALS[old[0]].startswith(new)
+        if not self._json5 and self._parser.strict and old[0] == '"' and "\\" in old[-6:] and "\\" in new[-6:]:
+            return _ends_in_escape(old) and _ends_in_escape(new)
+        return new == old + "." and _INTEGER.fullmatch(old) is not None
+
+    def _open(self, frame, is_list, pos):
+        child = [] if is_list else {}
+        self._add_value(frame, child)
+        return child
+
+    def _add_value(self, frame, value):
+        self._version += 1
+        if frame is None:
+            self._root = value
+            return
+        if type(frame[0]) is list:
+            frame[0].append(value)
+        else:
+            frame[0][frame[2]] = value
+
+    def _is_final(self, buf, pos):
+        """Whether ``parse(buf)`` returns the tree built while scanning the finished document."""
+        if not self._json5:
+            # json.loads decodes the escapes the non-strict parser keeps as written.
+            if not self._parser.strict and "\\" in buf:
+                return False
+            return _JSON_WHITESPACE.match(buf, pos).end() == len(buf)
+        if self._parser.validate:
+            return False
+        while True:
+            pos = self._space.match(buf, pos).end()
+            if not buf.startswith(("//", "/*"), pos):
+                return pos == len(buf)
+            pos = self._skip_comment(buf, pos)
+            if pos == -1:
+                return True
+
+    def _snapshot(self):
+        self._record = None
+        buf = self._buffer
+        pos = self._pos
+        if self._done and not self._broken and self._is_final(buf, pos):
+            root = self._root
+            if type(root) is list or type(root) is dict:
+                self._record = [(type(root), len(root), _MISSING, None)]
+            return root
+        if self._broken or not self._stack:
+            if not (self._broken or self._done) and buf.startswith(tuple(self._quotes), pos):
+                return self._partial_string(buf, pos)
+            return self._parser.parse(buf, complete=True if self._done else None)
+        # From here on a container is still open, so json.loads cannot succeed.
+        if buf.startswith("/", pos):
+            if not buf.startswith(("//", "/*"), pos):
+                return self._parser.parse(buf, complete=False)
+            pos = len(buf)
+
+        container, state, key = self._stack[-1]
+        try:
+            tail = self._tail(buf, pos, container, state, key)
+        except Exception:
+            return self._parser.parse(buf, complete=False)
+
+        if self.live:
+            if tail is not None:
+                self._place(container, *tail)
+            chain = [frame[0] for frame in self._stack]
+        else:
+            value = container[:] if type(container) is list else dict(container)
+            if tail is not None:
+                if tail[0] is _MISSING:
+                    value.append(tail[1])
+                else:
+                    value[tail[0]] = tail[1]
+            chain = [value]
+            for parent, _, parent_key in reversed(self._stack[:-1]):
+                parent = parent[:] if type(parent) is list else dict(parent)
+                if type(parent) is list:
+                    parent[-1] = value
+                else:
+                    parent[parent_key] = value
+                value = parent
+                chain.append(parent)
+            chain.reverse()
+        self._record = self._describe(chain, tail)
+        return chain[0]
+
+    def _tail(self, buf, pos, container, state, key):
+        """Return ``(key, value)`` for the unfinished token at ``pos``, or None.
+
+        The key is ``_MISSING`` for an array, whose value is appended.
+        """
+        if state == _KEY and pos < len(buf):
+            if buf[pos] in self._quotes:
+                key = self._partial_string(buf, pos)
+            else:
+                key, stop = self._parser._parse_identifier(buf, pos, self._error)
+                if stop < len(buf):
+                    raise _Unsupported
+            return key, None
+        if state == _VALUE and pos < len(buf):
+            if buf[pos] in self._quotes:
+                item = self._partial_string(buf, pos)
+            else:
+                item, stop = self._parser._parse_value(buf, pos, self._error)
+                if stop < len(buf):
+                    raise _Unsupported
+            return (_MISSING if type(container) is list else key), item
+        if pos < len(buf):
+            raise _Unsupported
+        if state == _COLON or (state == _VALUE and type(container) is dict):
+            return key, None
+        return None
+
+    def _describe(self, chain, tail):
+        """Record what ``feed_patch`` needs to diff the open containers of a snapshot.
+
+        One ``(type, length, key, value)`` per open container, where ``key``
+        is the only entry that may still change (``_MISSING`` for none) and
+        ``value`` its value in the snapshot, or ``_OPEN`` for the next one.
+        """
+        record = []
+        last = len(chain) - 1
+        for level, container in enumerate(chain):
+            is_list = type(container) is list
+            if level < last:
+                key = len(container) - 1 if is_list else self._stack[level][2]
+                record.append((type(container), len(container), key, _OPEN))
+            elif tail is None:
+                record.append((type(container), len(container), _MISSING, None))
+            else:
+                key = len(container) - 1 if is_list else tail[0]
+                record.append((type(container), len(container), key, container[key]))
+        return record
+
+
+def _diff_open(record, new_record, level, new, path, ops, append_strings, on_path=True):
+    """Diff ``new`` against the open container ``record[level]`` described by ``_describe``.
+
+    Entries before the one that could change are the same objects in both
+    snapshots, so only that entry and the ones added after it are visited,
+    plus the entry ``new_record`` marks as changing if it is an older key
+    (``on_path`` while the new snapshot's open path has not branched off).
+    """
+    kind, length, key, old = record[level]
+    changed = new_record[level][2] if on_path and level < len(new_record) else _MISSING
+    on_path = changed is not _MISSING and changed == key
+    if type(new) is not kind:
+        ops.append({"op": "replace", "path": path, "value": new})
+        return
+    start = length
+    if kind is list:
+        if key is not _MISSING and key < len(new):
+            if old is _OPEN:
+                _diff_open(record, new_record, level + 1, new[key], _pointer(path, key), ops, append_strings, on_path)
+            else:
+                _diff(old, new[key], _pointer(path, key), ops, append_strings)
+        for i in range(length, len(new)):
+            ops.append({"op": "add", "path": _pointer(path, i), "value": new[i]})
+        for i in reversed(range(len(new), length)):
+            ops.append({"op": "remove", "path": _pointer(path, i)})
+        return
+    if key is not _MISSING:
+        if key not in new:
+            # An unfinished key that turned out different.
+            ops.append({"op": "remove", "path": _pointer(path, key)})
+            start -= 1
+        elif old is _OPEN:
+            _diff_open(record, new_record, level + 1, new[key], _pointer(path, key), ops, append_strings, on_path)
+        else:
+            _diff(old, new[key], _pointer(path, key), ops, append_strings)
+    added = {}
+    for name, value in islice(new.items(), start, None):
+        added[name] = value
+        ops.append({"op": "add", "path": _pointer(path, name), "value": value})
+    if changed is not _MISSING and changed != key and changed in new and changed not in added:
+        # A duplicated key overwriting an earlier entry.
+        ops.append({"op": "replace", "path": _pointer(path, changed), "value": new[changed]})
+
+
+class IncrementalEventParser(_IncrementalScanner):
+    """Event-style parser fed one chunk at a time, similar to ``ijson.basic_parse``.
+
+    ``feed(chunk)`` returns the ``(event, value)`` pairs completed by the new
+    input: ``start_map``, ``map_key``, ``end_map``, ``start_array``,
+    ``end_array`` and ``value``. No containers are built and consumed input is
+    dropped, so memory stays proportional to the unfinished token.
+
+    Truncation is tolerated: when the input ends inside a value, the last pair
+    of the batch is a provisional ``("partial_string", text)`` or
+    ``("partial_value", value)``. It is repeated, possibly extended, until the
+    value completes and is reported as ``value``; only the new characters of
+    an unfinished string are decoded each time. ``close()`` ends the input.
+    Malformed input raises ``json.JSONDecodeError``.
+    """
+
+    def reset(self):
+        super().reset()
+        self._events = []
+
+    def feed(self, chunk):
+        self._append(chunk)
+        try:
+            if not self._done:
+                self._advance()
+        except json.JSONDecodeError:
+            raise
+        except Exception:
+            raise json.JSONDecodeError("Unexpected input", self._buffer, self._pos) from None
+        if self._done:
+            stop = self._parser._parse_space(self._buffer, self._pos, self._error)
+            if self._buffer[stop:] not in ("", "/"):
+                raise json.JSONDecodeError("Extra data", self._buffer, stop)
+        self._add_partial()
+        events, self._events = self._events, []
+        # Everything before the unfinished token has been reported.
+        if self._resume:
+            self._resume -= self._pos
+        self._buffer = self._buffer[self._pos :]
+        self._pos = 0
+        return events
+
+    def close(self):
+        """Return the events left at the end of the input and reset the parser.
+
+        A final top-level number or literal ends with the input. An unfinished
+        document is completed as ``parse()`` would complete it: the value cut
+        off at the end is reported as ``value``, a key without a value gets
+        ``None``, and the open containers are ended.
+        """
+        buf, pos, stack = self._buffer, self._pos, self._stack
+        events = []
+        try:
+            if not self._done:
+                pos = self._parser._parse_space(buf, pos, self._error)
+                state = stack[-1][1] if stack else _VALUE
+                if pos < len(buf) and state == _KEY:
+                    if buf[pos] in self._quotes:
+                        key = self._partial_string(buf, pos)
+                    else:
+                        key = self._parser._parse_identifier(buf, pos, self._error)[0]
+                    events += [("map_key", key), ("value", None)]
+                elif pos < len(buf):
+                    if buf[pos] in self._quotes:
+                        value = self._partial_string(buf, pos)
+                    else:
+                        value, stop = self._parser._parse_value(buf, pos, self._error)
+                        if stop < len(buf):
+                            value = self._decode_mismatch(buf, pos, len(buf))
+                    events.append(("value", value))
+                elif state == _COLON or (stack and state == _VALUE and type(stack[-1][0]) is dict):
+                    events.append(("value", None))
+                for frame in reversed(stack):
+                    events.append(("end_array" if type(frame[0]) is list else "end_map", None))
+        except json.JSONDecodeError:
+            raise
+        except Exception:
+            raise json.JSONDecodeError("Unexpected input", buf, pos) from None
+        self.reset()
+        return events
+
+    def _open(self, frame, is_list, pos):
+        self._events.append(("start_array" if is_list else "start_map", None))
+        return [] if is_list else {}
+
+    def _close(self, frame, pos):
+        self._events.append(("end_array" if type(frame[0]) is list else "end_map", None))
+
+    def _add_key(self, frame, key, start, end):
+        self._events.append(("map_key", key))
+
+    def _add_value(self, frame, value):
+        self._events.append(("value", value))
+
+    def _decode_mismatch(self, buf, pos, end):
+        # Complete tokens the partial parser cannot finish, such as exponents.
+        try:
+            value = json.loads(buf[pos:end])
+        except ValueError:
+            raise _Unsupported from None
+        if isinstance(value, str):
+            raise _Unsupported
+        return value
+
+    def _add_partial(self):
+        buf = self._buffer
+        pos = self._pos
+        if self._done or pos >= len(buf) or buf[pos] == "/":
+            return
+        if self._stack and self._stack[-1][1] != _VALUE:
+            return
+        if buf[pos] in self._quotes:
+            self._events.append(("partial_string", self._partial_string(buf, pos)))
+            return
+        try:
+            value, _ = self._parser._parse_value(buf, pos, self._error)
+        except Exception:
+            return
+        if not isinstance(value, str):
+            self._events.append(("partial_value", value))
+
+
+def iter_events(chunks, strict=True, json5_enabled=False, max_depth=None):
+    """Yield ``(event, value)`` pairs from an iterable of text or byte chunks, then those of ``close()``."""
+    parser = IncrementalEventParser(strict=strict, json5_enabled=json5_enabled, max_depth=max_depth)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+class IncrementalDocumentParser(_IncrementalScanner):
+    """Splitter for a stream of JSON documents, fed one chunk at a time.
+
+    Documents may be newline-delimited (NDJSON) or simply follow each other.
+    ``feed(chunk)`` returns the documents completed by the new input, each
+    decoded as ``parse()`` decodes it on its own. Only the unfinished
+    document is kept, so memory does not grow with the length of the stream.
+    ``snapshot()`` parses the unfinished document and ``close()`` returns it
+    at the end of the input. Malformed input raises ``json.JSONDecodeError``.
+    """
+
+    def reset(self):
+        super().reset()
+        self._start = 0
+
+    def feed(self, chunk):
+        if self._start:
+            # Drop the documents returned by the previous call.
+            self._buffer = self._buffer[self._start :]
+            self._pos -= self._start
+            if self._resume:
+                self._resume -= self._start
+            self._start = 0
+        self._append(chunk)
+        documents = []
+        while True:
+            if not self._stack and not self._json5:
+                self._split_lines(documents)
+            try:
+                self._advance()
+            except json.JSONDecodeError:
+                raise
+            except Exception:
+                raise json.JSONDecodeError("Unexpected input", self._buffer, self._pos) from None
+            if not self._done:
+                break
+            documents.append(self._parser.parse(self._buffer[self._start : self._pos]))
+            self._start = self._pos
+            self._done = False
+        if not self._stack:
+            # Skip the whitespace before the next document.
+            self._start = self._pos
+        return documents
+
+    def snapshot(self):
+        """Parse the unfinished document; ``None`` if no document has started."""
+        if not self.pending:
+            return None
+        return self._parser.parse(self._buffer[self._start :])
+
+    def close(self):
+        """Return the documents left at the end of the input and reset the parser.
+
+        A final top-level number or literal ends with the input; an unfinished
+        document is parsed as ``parse()`` would.
+        """
+        documents = [self._parser.parse(self._buffer[self._start :])] if self.pending else []
+        self.reset()
+        return documents
+
+    @property
+    def pending(self):
+        """Whether a document has started but not been returned yet."""
+        buf = self._buffer
+        return self._parser._parse_space(buf, self._start, self._error) < len(buf)
+
+    def _split_lines(self, documents):
+        """Decode whole lines holding one document each with ``json.loads``, as NDJSON.
+
+        Lines it rejects, such as a document spread over several lines, are
+        left to the scanner.
+        """
+        buf = self._buffer
+        pos = start = self._pos
+        end = buf.find("\n", pos)
+        while end != -1:
+            line = buf[pos:end]
+            if line and not line.isspace():
+                try:
+                    documents.append(json.loads(line))
+                except (ValueError, RecursionError):
+                    break
+            pos = end + 1
+            end = buf.find("\n", pos)
+        if pos != start:
+            self._pos = self._start = pos
+            self._resume = 0
+            self._decoded = None
+
+    def _truncated(self):
+        """Whether the input ends inside a container or a top-level string."""
+        return bool(self._stack) or self._buffer.startswith(tuple(self._quotes), self._pos)
+
+    def _read_value(self, buf, pos):
+        # Scalars are only skipped here; the whole document is decoded at once.
+        if buf[pos] in self._quotes:
+            end = self._scan_string(buf, pos)
+        else:
+            end = self._scan_token(buf, pos)
+        return None if end == -1 else (None, end)
+
+
+def iter_documents(chunks, partial=False, strict=True, json5_enabled=False, max_depth=None):
+    """Yield each document of a stream of concatenated or newline-delimited documents.
+
+    With ``partial``, yields ``(document, complete)`` pairs instead, adding a
+    ``(snapshot, False)`` for the unfinished document after each chunk. A
+    document cut off by the end of the input comes last, with ``False``.
+    """
+    parser = IncrementalDocumentParser(strict=strict, json5_enabled=json5_enabled, max_depth=max_depth)
+    for chunk in chunks:
+        documents = parser.feed(chunk)
+        if not partial:
+            yield from documents
+            continue
+        for document in documents:
+            yield document, True
+        if parser.pending:
+            try:
+                snapshot = parser.snapshot()
+            except ValueError:
+                # Not parseable yet, such as a JSON5 literal cut short.
+                continue
+            yield snapshot, False
+    complete = not parser._truncated()
+    for document in parser.close():
+        yield (document, complete) if partial else document
@@ -1,6 +1,11 @@
 """JSON5 parser - extends JSON with comments, unquoted keys, single quotes, etc."""
+import codecs
 import json
+import logging
 import re
+from time import perf_counter
+
+from .json_parser import _check_depth
 
 try:
     import json5
@@ -8,312 +13,427 @@ except ImportError:
     json5 = None
 
 
-def create_json5_parser(strict=True, on_extra_token=None):
-    """Create a JSON5 parser."""
-    return _JSON5Parser(strict=strict, on_extra_token=on_extra_token)
+def create_json5_parser(strict=True, on_extra_token=None, max_depth=None, validate=False, stats=None):
+    """Create a JSON5 parser. ``max_depth`` limits container nesting (None for no limit).
+
+    Buffers are parsed in a single pass by the partial parser. With
+    ``validate=True``, complete documents are first parsed by the ``json5``
+    package (when installed), which is much slower but rejects invalid JSON5
+    the partial parser tolerates. ``stats`` works as in ``create_json_parser``.
+    """
+    return _JSON5Parser(
+        strict=strict, on_extra_token=on_extra_token, max_depth=max_depth, validate=validate, stats=stats
+    )
+
+
+def _decode_utf8(data):
+    """Decode bytes-like input, holding back an incomplete trailing UTF-8 sequence."""
+    return codecs.utf_8_decode(data, "strict", False)[0]
+
+
+_logger = logging.getLogger(__name__)
 
 
 def _default_on_extra_token(text, data, reminding):
-    print("Parsed JSON with extra tokens:", {"text": text, "data": data, "reminding": reminding})
+    _logger.debug("Parsed JSON5 with %d characters of extra tokens: %.80r", len(reminding), reminding)
 
 
 _INCOMPLETE_ESCAPE_REGEX = re.compile(r"^\\(?:u[0-9a-fA-F]{0,3}|x[0-9a-fA-F]{0,1})?$")
 _JSON5_WHITESPACE = "\v\f\u00A0\u2028\u2029\uFEFF"
+_CLOSERS = {"{": "}", "[": "]", '"': '"', "'": "'"}
+_STRING_BODIES = {
+    '"': re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.S),
+    "'": re.compile(r"[^'\\]*(?:\\.[^'\\]*)*", re.S),
+}
+_STRUCTURE = re.compile(r"[\"'\[\]{}/]")
+_SPACE = re.compile(r"[\s\uFEFF]*")
+_LINE_COMMENT = re.compile(r"[^\n\r\u2028\u2029]*")
+_IDENTIFIER = re.compile(r"[\w$]*")
+_HEX_DIGITS = re.compile(r"[0-9a-fA-F]*")
+_NUMBER = re.compile(r"[0-9.\-]*")
+_EXPONENT = re.compile(r"[eE][+\-]?[0-9]*")
+_SCALAR = re.compile(r"[^\s,\]}/\u00A0\u2028\u2029\uFEFF]*")
+_HEX_ESCAPE = {"x": re.compile(r"[0-9a-fA-F]{2}"), "u": re.compile(r"[0-9a-fA-F]{4}")}
+# Single-character escapes; an escaped line terminator is a line continuation.
+_ESCAPES = {
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+    "v": "\v",
+    "0": "\0",
+    "\n": "",
+    "\r": "",
+    "\u2028": "",
+    "\u2029": "",
+}
+
+
+def _is_json5_space(c):
+    return c.isspace() or c in _JSON5_WHITESPACE
+
+
+def _decode_string(body):
+    """Decode the escapes in the body of a complete JSON5 string in one pass.
+
+    Any other escaped character stands for itself, as in JSON5; malformed
+    ``\\x``/``\\u`` escapes and ``\\1``-``\\9`` are kept as written.
+    """
+    i = body.find("\\")
+    if i == -1:
+        return body
+    parts = []
+    start = 0
+    while i != -1:
+        parts.append(body[start:i])
+        c = body[i + 1]
+        start = i + 2
+        if c in _ESCAPES:
+            parts.append(_ESCAPES[c])
+            if c == "\r" and body.startswith("\n", start):
+                start += 1
+        elif c == "x" or c == "u":
+            if _HEX_ESCAPE[c].match(body, start):
+                start += 2 if c == "x" else 4
+                code = int(body[i + 2 : start], 16)
+                if 0xD800 <= code < 0xDC00 and body.startswith("\\u", start):
+                    # A surrogate pair, combined as json.loads does.
+                    low = int(body[start + 2 : start + 6], 16) if _HEX_ESCAPE["u"].match(body, start + 2) else 0
+                    if 0xDC00 <= low < 0xE000:
+                        code = 0x10000 + ((code - 0xD800) << 10) + (low - 0xDC00)
+                        start += 6
+                parts.append(chr(code))
+            else:
+                parts.append(body[i:start])
+        elif "1" <= c <= "9":
+            parts.append(body[i:start])
+        else:
+            parts.append(c)
+        i = body.find("\\", start)
+    parts.append(body[start:])
+    return "".join(parts)
+
+
+def _may_be_complete(s):
+    """Cheap check ruling out buffers that json5.loads would reject as truncated."""
+    if "/" in s:
+        # A complete document may end in a comment.
+        return True
+    end = len(s) - 1
+    while end >= 0 and _is_json5_space(s[end]):
+        end -= 1
+    if end < 0:
+        return False
+    start = 0
+    while _is_json5_space(s[start]):
+        start += 1
+    closer = _CLOSERS.get(s[start])
+    return closer is None or (end > start and s[end] == closer)
 
 
 class _JSON5Parser:
-    """JSON5 parser with comments, unquoted keys, single quotes, hex, Infinity, etc."""
+    """JSON5 parser with comments, unquoted keys, single quotes, hex, Infinity, etc.
 
-    def __init__(self, strict=True, on_extra_token=None):
+    Like the JSON parser, one instance can be shared between threads, with the
+    same caveat: ``path_counts`` may lose counts from concurrent calls.
+    """
+
+    __slots__ = ("strict", "max_depth", "validate", "on_extra_token", "last_parse_reminding", "path_counts", "stats")
+
+    def __init__(self, strict=True, on_extra_token=None, max_depth=None, validate=False, stats=None):
         self.strict = strict
+        self.max_depth = max_depth
+        self.validate = validate
         self.on_extra_token = on_extra_token or _default_on_extra_token
         self.last_parse_reminding = None
-        self._parsers = self._build_parsers()
-
-    def _build_parsers(self):
-        parsers = {
-            " ": self._parse_space,
-            "\r": self._parse_space,
-            "\n": self._parse_space,
-            "\t": self._parse_space,
-            "[": self._parse_array,
-            "{": self._parse_object,
-            '"': self._parse_string,
-            "'": self._parse_string,
-            "t": self._parse_true,
-            "f": self._parse_false,
-            "n": self._parse_null,
-            "/": self._parse_space,
-            "+": self._parse_number,
-            "I": self._parse_number,
-            "N": self._parse_n_literal,
-            "T": self._parse_true,
-            "F": self._parse_false,
-        }
-        for c in _JSON5_WHITESPACE:
-            parsers[c] = self._parse_space
-        for c in "0123456789.-":
-            parsers[c] = self._parse_number
-        return parsers
-
-    def parse(self, s):
+        self.path_counts = {"complete": 0, "fallback": 0, "partial": 0}
+        self.stats = stats
+
+    def parse(self, s, complete=None, paths=None, lazy=False):
+        """Parse ``s`` in a single pass, or with ``json5.loads`` first when validating.
+
+        ``complete``, ``paths``, ``path_counts`` and bytes input work as in the
+        JSON parser, as does ``lazy``; ``complete`` only matters with ``validate=True``.
+        """
+        if not isinstance(s, str):
+            s = _decode_utf8(s)
+        if paths is not None:
+            return {path: self.extract(s, path) for path in paths}
+        if lazy:
+            from .lazy import parse_lazy
+
+            return parse_lazy(self, s)
         if len(s) >= 1:
-            if json5:
+            stats = self.stats
+            started = loaded = None
+            if stats is not None:
+                started = perf_counter()
+            error = json.JSONDecodeError("", "", 0)
+            if json5 and self.validate and (complete or (complete is None and _may_be_complete(s))):
                 try:
-                    return json5.loads(s)
-                except (json.JSONDecodeError, ValueError) as e:
-                    data, reminding = self.parse_any(s, e)
-                    self.last_parse_reminding = reminding
-                    if self.on_extra_token and reminding:
-                        self.on_extra_token(s, data, reminding)
+                    data = json5.loads(s)
+                    _check_depth(s, data, self.max_depth)
+                    self.path_counts["complete"] += 1
+                    if stats is not None:
+                        stats._record("complete", s, len(s), data, None, started, perf_counter(), None)
                     return data
-            data, reminding = self.parse_any(s, json.JSONDecodeError("", "", 0))
+                except (json.JSONDecodeError, ValueError, RecursionError) as e:
+                    self.path_counts["fallback"] += 1
+                    path = "fallback"
+                    error = e
+                    if stats is not None:
+                        loaded = perf_counter()
+            else:
+                self.path_counts["partial"] += 1
+                path = "partial"
+            try:
+                data, reminding = self.parse_any(s, error)
+            except Exception as exc:
+                if stats is not None:
+                    stats._record(path, s, 0, None, error, started, loaded, perf_counter(), exc)
+                raise
+            consumed = len(s) - len(reminding)
+            if reminding and self._parse_space(reminding, 0, error) == len(reminding):
+                # Trailing whitespace and comments are not extra tokens.
+                reminding = ""
             self.last_parse_reminding = reminding
+            if stats is not None:
+                parsed = perf_counter()
             if self.on_extra_token and reminding:
                 self.on_extra_token(s, data, reminding)
+            if stats is not None:
+                stats._record(path, s, consumed, data, error, started, loaded, parsed)
             return data
         return json.loads("{}")
 
+    def extract(self, s, path):
+        """Return the value at ``path`` (e.g. ``$.choices[0].message``), skipping everything else."""
+        from .path import extract
+
+        if not isinstance(s, str):
+            s = _decode_utf8(s)
+        return extract(self, s, path)
+
     def parse_any(self, s, e):
-        if not s:
+        """Parse a value from the start of ``s``; return ``(value, remainder)``."""
+        value, i = self._parse_value(s, 0, e)
+        return value, s[i:]
+
+    def _parse_value(self, s, i, e):
+        if i >= len(s):
             raise e
-        while s and self._is_space_or_comment_start(s):
-            s = self._parse_space(s, e)
-        if not s:
-            return None, ""
-        parser = self._parsers.get(s[0])
+        i = self._parse_space(s, i, e)
+        if i >= len(s):
+            return None, i
+        parser = self._parsers.get(s[i])
         if not parser:
             raise e
-        return parser(s, e)
-
-    def _is_space_or_comment_start(self, s):
-        if not s:
-            return False
-        c = s[0]
-        if c.isspace() or c in _JSON5_WHITESPACE:
-            return True
-        if s.startswith("//") or s.startswith("/*"):
-            return True
-        return False
-
-    def _parse_space(self, s, e):
-        i = 0
-        while i < len(s):
-            if s[i].isspace() or s[i] in _JSON5_WHITESPACE:
-                i += 1
-            elif s[i : i + 2] == "//":
-                i += 2
-                while i < len(s) and s[i] not in "\n\r\u2028\u2029":
-                    i += 1
-            elif s[i : i + 2] == "/*":
-                i += 2
-                end = s.find("*/", i)
+        return parser(self, s, i, e)
+
+    def _parse_space(self, s, i, e):
+        n = len(s)
+        while i < n:
+            c = s[i]
+            if c.isspace() or c in _JSON5_WHITESPACE:
+                i = _SPACE.match(s, i + 1).end()
+            elif s.startswith("//", i):
+                i = _LINE_COMMENT.match(s, i + 2).end()
+            elif s.startswith("/*", i):
+                end = s.find("*/", i + 2)
                 if end == -1:
-                    return ""
+                    return n
                 i = end + 2
             else:
                 break
-        return s[i:]
-
-    def _parse_array(self, s, e):
-        s = s[1:]
-        acc = []
+        return i
+
+    def _parse_key(self, s, i, e):
+        if i < len(s) and s[i] in "\"'":
+            return self._parse_value(s, i, e)
+        return self._parse_identifier(s, i, e)
+
+    def _skip_value(self, s, i, e):
+        """Return the position after the value at ``i`` without decoding it."""
+        n = len(s)
+        if i >= n:
+            return n
+        c = s[i]
+        if c in "\"'":
+            return self._skip_string(s, i)
+        if c != "[" and c != "{":
+            return _SCALAR.match(s, i).end()
+        depth = 0
         while True:
-            while s and self._is_space_or_comment_start(s):
-                s = self._parse_space(s, e)
-            if not s:
-                break
-            if s[0] == "]":
-                s = s[1:]
-                break
-            res, s = self.parse_any(s, e)
-            acc.append(res)
-            while s and self._is_space_or_comment_start(s):
-                s = self._parse_space(s, e)
-            if s and s.startswith(","):
-                s = s[1:]
-        return acc, s
-
-    def _parse_object(self, s, e):
-        s = s[1:]
-        acc = {}
+            match = _STRUCTURE.search(s, i)
+            if not match:
+                return n
+            c = match.group()
+            if c in "\"'":
+                i = self._skip_string(s, match.start())
+                continue
+            if c == "/":
+                i = max(self._parse_space(s, match.start(), e), match.end())
+                continue
+            i = match.end()
+            depth += 1 if c in "[{" else -1
+            if depth == 0:
+                return i
+
+    def _skip_string(self, s, i):
+        quote = s[i]
+        end = _STRING_BODIES[quote].match(s, i + 1).end()
+        return end + 1 if end < len(s) and s[end] == quote else len(s)
+
+    def _parse_container(self, s, i, e):
+        # Nested containers are kept on an explicit stack rather than parsed
+        # recursively, so depth is bounded only by max_depth.
+        n = len(s)
+        parsers = self._parsers
+        max_depth = self.max_depth
+        stack = []
+        acc = [] if s[i] == "[" else {}
+        key = None
+        i += 1
         while True:
-            while s and self._is_space_or_comment_start(s):
-                s = self._parse_space(s, e)
-            if not s:
-                break
-            if s[0] == "}":
-                s = s[1:]
-                break
-            if s[0] not in '"\'':
-                key, s = self._parse_identifier(s, e)
-                if not key:
-                    while s and self._is_space_or_comment_start(s):
-                        s = self._parse_space(s, e)
-                    if s and s[0] == "}":
-                        s = s[1:]
-                    break
-            else:
-                key, s = self.parse_any(s, e)
-            while s and self._is_space_or_comment_start(s):
-                s = self._parse_space(s, e)
-            if not s or s[0] == "}":
-                if key is not None:
-                    acc[key] = None
-                if s and s[0] == "}":
-                    s = s[1:]
-                break
-            if s[0] != ":":
-                if key is not None:
+            i = self._parse_space(s, i, e)
+            closed = True
+            if type(acc) is list:
+                if i < n and s[i] == "]":
+                    i += 1
+                elif i < n:
+                    closed = False
+                    c = s[i]
+                    if c == "[" or c == "{":
+                        stack.append((acc, None))
+                        acc = [] if c == "[" else {}
+                        i += 1
+                        if max_depth is not None and len(stack) >= max_depth:
+                            raise json.JSONDecodeError("Maximum nesting depth exceeded", s, i - 1)
+                        continue
+                    parser = parsers.get(c)
+                    if not parser:
+                        raise e
+                    value, i = parser(self, s, i, e)
+                    acc.append(value)
+            elif i < n and s[i] == "}":
+                i += 1
+            elif i < n:
+                quoted = s[i] in "\"'"
+                if quoted:
+                    key, i = self._parse_value(s, i, e)
+                else:
+                    key, i = self._parse_identifier(s, i, e)
+                i = self._parse_space(s, i, e)
+                if not quoted and not key:
+                    if i < n and s[i] == "}":
+                        i += 1
+                elif i >= n or s[i] == "}":
                     acc[key] = None
-                break
-            s = s[1:]
-            while s and self._is_space_or_comment_start(s):
-                s = self._parse_space(s, e)
-            if not s or s[0] in ",}":
-                acc[key] = None
-                if s and s.startswith(","):
-                    s = s[1:]
-                elif s and s.startswith("}"):
-                    s = s[1:]
-                break
-            while s and self._is_space_or_comment_start(s):
-                s = self._parse_space(s, e)
-            if s and (
-                s[0] in self._parsers
-                or s[0] in "/+IN"
-                or s[0] in _JSON5_WHITESPACE
-            ):
-                value, s = self.parse_any(s, e)
-                acc[key] = value
-            else:
-                if key is not None:
+                    if i < n:
+                        i += 1
+                elif s[i] != ":":
                     acc[key] = None
-                break
-            while s and self._is_space_or_comment_start(s):
-                s = self._parse_space(s, e)
-            if s and s.startswith(","):
-                s = s[1:]
-        return acc, s
-
-    def _parse_identifier(self, s, e):
-        i = 0
-        while i < len(s) and (s[i].isalnum() or s[i] in "_$"):
-            i += 1
-        return s[:i], s[i:]
-
-    def _parse_string(self, s, e):
-        quote = s[0]
-        end = 1
-        while end < len(s):
-            if s[end] == "\\":
-                end += 2
-                continue
-            if s[end] == quote:
-                break
-            end += 1
+                else:
+                    i = self._parse_space(s, i + 1, e)
+                    if i >= n or s[i] in ",}":
+                        acc[key] = None
+                        if i < n:
+                            i += 1
+                    elif s[i] in parsers or s[i] in "/+IN" or s[i] in _JSON5_WHITESPACE:
+                        closed = False
+                        c = s[i]
+                        if c == "[" or c == "{":
+                            stack.append((acc, key))
+                            acc = [] if c == "[" else {}
+                            i += 1
+                            if max_depth is not None and len(stack) >= max_depth:
+                                raise json.JSONDecodeError("Maximum nesting depth exceeded", s, i - 1)
+                            continue
+                        value, i = self._parse_value(s, i, e)
+                        acc[key] = value
+                    else:
+                        acc[key] = None
+
+            if closed:
+                if not stack:
+                    return acc, i
+                value = acc
+                acc, key = stack.pop()
+                if type(acc) is list:
+                    acc.append(value)
+                else:
+                    acc[key] = value
+            i = self._parse_space(s, i, e)
+            if i < n and s[i] == ",":
+                i += 1
+
+    def _parse_identifier(self, s, i, e):
+        end = _IDENTIFIER.match(s, i).end()
+        return s[i:end], end
 
-        if end >= len(s):
-            content = s[1:]
+    def _parse_string(self, s, i, e):
+        n = len(s)
+        quote = s[i]
+        end = _STRING_BODIES[quote].match(s, i + 1).end()
+
+        if end >= n or s[end] != quote:
+            content = s[i + 1 :]
             if not self.strict:
-                return content, ""
+                return content, n
             if _INCOMPLETE_ESCAPE_REGEX.match(content):
-                return "", ""
+                return "", n
             try:
                 if quote == "'":
-                    return content, ""
-                return json.loads(f'"{content}"'), ""
+                    return content, n
+                return json.loads(f'"{content}"'), n
             except json.JSONDecodeError:
-                return "", ""
-
-        str_val = s[: end + 1]
-        remainder = s[end + 1 :]
-
-        if json5:
-            try:
-                return json5.loads(str_val), remainder
-            except Exception:
-                pass
-
-        decoded = str_val[1:-1]
-        decoded = re.sub(r"\\\n", "", decoded)
-        decoded = re.sub(r"\\\r\n", "", decoded)
-
-        def replace_hex(match):
-            return chr(int(match.group(1), 16))
-
-        decoded = re.sub(r"\\x([0-9a-fA-F]{2})", replace_hex, decoded)
-
-        if quote == "'":
-            decoded = decoded.replace('"', '\\"').replace("\\'", "'")
-            try:
-                return json.loads(f'"{decoded}"'), remainder
-            except Exception:
-                return decoded, remainder
-        if "\\x" in decoded or "\\\n" in str_val or "\\\r" in str_val:
-            return decoded, remainder
-        try:
-            return json.loads(str_val), remainder
-        except Exception:
-            return decoded, remainder
-
-    def _parse_number(self, s, e):
-        if s.startswith(("-0x", "-0X")):
-            i = 3
-            while i < len(s) and s[i] in "0123456789abcdefABCDEF":
-                i += 1
-            num_str = s[1:i]
-            remainder = s[i:]
-            if len(num_str) <= 2:
-                return s[:3], ""
-            return -int(num_str, 16), remainder
-        if s.startswith(("+0x", "+0X")):
-            i = 3
-            while i < len(s) and s[i] in "0123456789abcdefABCDEF":
-                i += 1
-            num_str = s[1:i]
-            remainder = s[i:]
+                return "", n
+
+        return _decode_string(s[i + 1 : end]), end + 1
+
+    def _parse_number(self, s, i, e):
+        n = len(s)
+        for prefix, sign in (("-0x", -1), ("-0X", -1), ("+0x", 1), ("+0X", 1)):
+            if s.startswith(prefix, i):
+                j = _HEX_DIGITS.match(s, i + 3).end()
+                num_str = s[i + 1 : j]
+                if len(num_str) <= 2:
+                    return s[i : i + 3], n
+                return sign * int(num_str, 16), j
+        if s.startswith(("0x", "0X"), i):
+            j = _HEX_DIGITS.match(s, i + 2).end()
+            num_str = s[i:j]
             if len(num_str) <= 2:
-                return s[:3], ""
-            return int(num_str, 16), remainder
-        if s.startswith(("0x", "0X")):
-            i = 2
-            while i < len(s) and s[i] in "0123456789abcdefABCDEF":
-                i += 1
-            num_str = s[:i]
-            remainder = s[i:]
-            if len(num_str) <= 2:
-                return num_str, ""
-            return int(num_str, 16), remainder
+                return num_str, n
+            return int(num_str, 16), j
 
         for literal, val in [("Infinity", float("inf")), ("NaN", float("nan"))]:
-            if s.startswith(literal):
-                return val, s[len(literal) :]
-            if s.startswith("+" + literal):
-                return val, s[len(literal) + 1 :]
-            if s.startswith("-" + literal):
-                return -val if literal == "Infinity" else val, s[len(literal) + 1 :]
-
-        if s.startswith(".") and len(s) > 1 and s[1].isdigit():
-            i = 1
-            while i < len(s) and s[i].isdigit():
-                i += 1
-            num_str = s[:i]
-            return float(num_str), s[i:]
-
-        if s.startswith("+"):
-            res, remainder = self._parse_number(s[1:], e)
-            return res, remainder
-
-        i = 0
-        while i < len(s) and s[i] in "0123456789.-":
-            i += 1
-        num_str = s[:i]
-        s = s[i:]
-        if not num_str or num_str == "-" or num_str == ".":
-            return num_str, ""
+            if s.startswith(literal, i):
+                return val, i + len(literal)
+            if s.startswith("+" + literal, i):
+                return val, i + len(literal) + 1
+            if s.startswith("-" + literal, i):
+                return -val if literal == "Infinity" else val, i + len(literal) + 1
+
+        if s.startswith(".", i) and i + 1 < n and s[i + 1].isdigit():
+            j = i + 1
+            while j < n and s[j].isdigit():
+                j += 1
+            value, j = self._parse_exponent(s, i, j)
+            return float(value), j
+
+        if s.startswith("+", i):
+            return self._parse_number(s, i + 1, e)
+
+        start = i
+        i = _NUMBER.match(s, i).end()
+        if not s[start:i] or s[start:i] in ("-", "."):
+            return s[start:i], n
+        num_str, i = self._parse_exponent(s, start, i)
         try:
-            if num_str.endswith("."):
+            if num_str.endswith(".") and i == n:
+                # More digits may follow the point.
                 num = int(num_str[:-1])
             else:
                 num = (
@@ -323,24 +443,57 @@ class _JSON5Parser:
                 )
         except ValueError:
             raise e
-        return num, s
-
-    def _parse_n_literal(self, s, e):
-        if s.lower().startswith("nan"):
-            return self._parse_number(s, e)
-        return self._parse_null(s, e)
-
-    def _parse_true(self, s, e):
-        if s.lower().startswith("true"):
-            return True, s[4:]
+        return num, i
+
+    def _parse_exponent(self, s, start, i):
+        """Extend the number ``s[start:i]`` by its exponent; return ``(text to convert, end)``.
+
+        An exponent cut off at the end of the buffer is consumed but left out
+        of the text, like a trailing ``.``.
+        """
+        match = _EXPONENT.match(s, i)
+        if match is None:
+            return s[start:i], i
+        end = match.end()
+        if s[end - 1].isdigit():
+            return s[start:end], end
+        if end == len(s):
+            return s[start:i], end
+        return s[start:i], i
+
+    def _parse_n_literal(self, s, i, e):
+        if s[i : i + 3].lower() == "nan":
+            return self._parse_number(s, i, e)
+        return self._parse_null(s, i, e)
+
+    def _parse_true(self, s, i, e):
+        if s[i : i + 4].lower() == "true":
+            return True, i + 4
         raise e
 
-    def _parse_false(self, s, e):
-        if s.lower().startswith("false"):
-            return False, s[5:]
+    def _parse_false(self, s, i, e):
+        if s[i : i + 5].lower() == "false":
+            return False, i + 5
         raise e
 
-    def _parse_null(self, s, e):
-        if s.lower().startswith("null"):
-            return None, s[4:]
+    def _parse_null(self, s, i, e):
+        if s[i : i + 4].lower() == "null":
+            return None, i + 4
         raise e
+
+    # First character -> handler(parser, s, i, e).
+    _parsers = dict.fromkeys("0123456789.-+I", _parse_number)
+    _parsers.update(
+        {
+            "[": _parse_container,
+            "{": _parse_container,
+            '"': _parse_string,
+            "'": _parse_string,
+            "t": _parse_true,
+            "f": _parse_false,
+            "n": _parse_null,
+            "N": _parse_n_literal,
+            "T": _parse_true,
+            "F": _parse_false,
+        }
+    )
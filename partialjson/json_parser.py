@@ -1,178 +1,488 @@
 """Pure JSON parser - no JSON5 extensions."""
+import codecs
 import json
+import logging
 import re
+from array import array
+from time import perf_counter
 
+try:
+    from . import _speedups
+except ImportError:
+    _speedups = None
 
-def create_json_parser(strict=True, on_extra_token=None):
-    """Create a JSON parser (no JSON5 extensions)."""
-    return _JSONParser(strict=strict, on_extra_token=on_extra_token)
+
+def create_json_parser(
+    strict=True, on_extra_token=None, max_depth=None, speedups=True, numeric_arrays=None, stats=None
+):
+    """Create a JSON parser (no JSON5 extensions).
+
+    ``max_depth`` limits container nesting, of complete documents too; deeper
+    input raises ``json.JSONDecodeError``. The compiled accelerator is used
+    when it was built, unless ``speedups=False``.
+
+    With ``numeric_arrays="array"``, non-empty arrays holding only numbers are
+    parsed in bulk into ``array("d")``; with ``"numpy"`` they become NumPy
+    float arrays instead (NumPy must be installed).
+
+    ``stats`` is an optional ``ParseStats`` collecting counters and timings.
+    Extra tokens after the document are reported to ``on_extra_token``, by
+    default as a debug message on the ``partialjson.json_parser`` logger.
+    """
+    return _JSONParser(
+        strict=strict,
+        on_extra_token=on_extra_token,
+        max_depth=max_depth,
+        speedups=speedups,
+        numeric_arrays=numeric_arrays,
+        stats=stats,
+    )
+
+
+def _decode_utf8(data):
+    """Decode bytes-like input, holding back an incomplete trailing UTF-8 sequence."""
+    return codecs.utf_8_decode(data, "strict", False)[0]
+
+
+_logger = logging.getLogger(__name__)
 
 
 def _default_on_extra_token(text, data, reminding):
-    print("Parsed JSON with extra tokens:", {"text": text, "data": data, "reminding": reminding})
+    _logger.debug("Parsed JSON with %d characters of extra tokens: %.80r", len(reminding), reminding)
 
 
 _INCOMPLETE_ESCAPE_REGEX = re.compile(r"^\\(?:u[0-9a-fA-F]{0,3}|x[0-9a-fA-F]{0,1})?$")
+_JSON_SPACE = " \t\n\r"
+_STRING_BODY = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.S)
+_SPACE = re.compile(r"\s*")
+_NUMBER = re.compile(r"[0-9.\-]*")
+_STRUCTURE = re.compile(r'["\[\]{}]')
+_SCALAR = re.compile(r"[^\s,\]}]*")
+_CLOSERS = {"{": "}", "[": "]", '"': '"'}
+_NUMBERS = re.compile(r"[0-9.eE+\-,\s]*")
+_PLUS_SIGN = re.compile(r"(?<![eE])\+")
+_EXPONENT_START = re.compile(r"[eE][+\-]?")
+_NUMBER_TYPES = {int, float}
+
+
+def _check_depth(s, data, max_depth):
+    """Reject a complete document nested deeper than ``max_depth``.
+
+    The error sends the buffer to the partial parser, which raises it with
+    the position of the first container that is too deep.
+    """
+    if max_depth is None or s.count("[") + s.count("{") <= max_depth:
+        return
+    level = [data] if type(data) is dict or type(data) is list else []
+    depth = 0
+    while level:
+        depth += 1
+        if depth > max_depth:
+            raise json.JSONDecodeError("Maximum nesting depth exceeded", s, 0)
+        level = [
+            child
+            for value in level
+            for child in (value.values() if type(value) is dict else value)
+            if type(child) is dict or type(child) is list
+        ]
+
+
+def _loads_error(s):
+    """Return the error ``json.loads(s)`` raises, or None if it succeeds."""
+    try:
+        json.loads(s)
+    except (json.JSONDecodeError, ValueError, RecursionError) as e:
+        return e
+    return None
+
+
+def _may_be_complete(s):
+    """Cheap check ruling out buffers that json.loads would reject as truncated."""
+    end = len(s) - 1
+    while end >= 0 and s[end] in _JSON_SPACE:
+        end -= 1
+    if end < 0:
+        return False
+    start = 0
+    while s[start] in _JSON_SPACE:
+        start += 1
+    closer = _CLOSERS.get(s[start])
+    return closer is None or (end > start and s[end] == closer)
 
 
 class _JSONParser:
-    """Internal JSON-only parser implementation."""
+    """Internal JSON-only parser implementation.
 
-    def __init__(self, strict=True, on_extra_token=None):
+    The dispatch tables are built once per class, and parsing writes nothing
+    to the instance besides the ``last_parse_reminding`` and ``path_counts``
+    bookkeeping, so one parser can be shared between requests and threads.
+    The bookkeeping is not locked, though: ``last_parse_reminding`` belongs to
+    whichever call finished last, and concurrent calls may lose counts in
+    ``path_counts``. Use one parser per thread (``ParserPool`` does) for exact
+    numbers.
+    """
+
+    __slots__ = (
+        "strict",
+        "on_extra_token",
+        "max_depth",
+        "speedups",
+        "numeric_arrays",
+        "last_parse_reminding",
+        "path_counts",
+        "stats",
+        "_parsers",
+        "_to_ndarray",
+    )
+
+    def __init__(
+        self, strict=True, on_extra_token=None, max_depth=None, speedups=True, numeric_arrays=None, stats=None
+    ):
+        if numeric_arrays not in (None, "array", "numpy"):
+            raise ValueError("numeric_arrays must be None, 'array' or 'numpy'")
         self.strict = strict
         self.on_extra_token = on_extra_token or _default_on_extra_token
+        self.max_depth = max_depth
+        self.speedups = bool(speedups and _speedups)
+        self.numeric_arrays = numeric_arrays
         self.last_parse_reminding = None
-        self._parsers = self._build_parsers()
-
-    def _build_parsers(self):
-        parsers = {
-            " ": self._parse_space,
-            "\r": self._parse_space,
-            "\n": self._parse_space,
-            "\t": self._parse_space,
-            "[": self._parse_array,
-            "{": self._parse_object,
-            '"': self._parse_string,
-            "t": self._parse_true,
-            "f": self._parse_false,
-            "n": self._parse_null,
-        }
-        for c in "0123456789.-":
-            parsers[c] = self._parse_number
-        return parsers
+        self.path_counts = {"complete": 0, "fallback": 0, "partial": 0}
+        self.stats = stats
+        self._parsers = self._SPEEDUP_PARSERS if self.speedups else self._PARSERS
+        self._to_ndarray = None
+        if numeric_arrays == "numpy":
+            import numpy
 
-    def parse(self, s):
+            self._to_ndarray = numpy.frombuffer
+
+    def parse(self, s, complete=None, paths=None, lazy=False):
+        """Parse ``s``, trying ``json.loads`` first unless it cannot succeed.
+
+        ``complete=None`` skips ``json.loads`` when a cheap check shows the
+        buffer is truncated; ``True`` always tries it and ``False`` never does.
+        ``path_counts`` records how often each path was taken. ``s`` may also
+        be ``bytes``, ``bytearray`` or ``memoryview`` holding UTF-8. With
+        ``paths``, returns ``{path: extract(s, path)}`` instead. With ``lazy``,
+        objects and arrays are read-only proxies that decode a value only when
+        it is first accessed (see ``parse_lazy``).
+        """
+        if not isinstance(s, str):
+            s = _decode_utf8(s)
+        if paths is not None:
+            return {path: self.extract(s, path) for path in paths}
+        if lazy:
+            from .lazy import parse_lazy
+
+            return parse_lazy(self, s)
         if len(s) >= 1:
+            stats = self.stats
+            started = loaded = None
+            if stats is not None:
+                started = perf_counter()
+            if complete is None:
+                complete = _may_be_complete(s)
+            if complete:
+                try:
+                    data = json.loads(s)
+                    _check_depth(s, data, self.max_depth)
+                    self.path_counts["complete"] += 1
+                    if self.numeric_arrays:
+                        data = self._pack_lists(data)
+                    if stats is not None:
+                        stats._record("complete", s, len(s), data, None, started, perf_counter(), None)
+                    return data
+                except (json.JSONDecodeError, ValueError, RecursionError) as e:
+                    self.path_counts["fallback"] += 1
+                    path = "fallback"
+                    error = e
+                    if stats is not None:
+                        loaded = perf_counter()
+            else:
+                self.path_counts["partial"] += 1
+                path = "partial"
+                error = json.JSONDecodeError("Incomplete JSON document", s, len(s))
             try:
-                return json.loads(s)
-            except (json.JSONDecodeError, ValueError) as e:
-                data, reminding = self.parse_any(s, e)
-                self.last_parse_reminding = reminding
-                if self.on_extra_token and reminding:
-                    self.on_extra_token(s, data, reminding)
-                return data
+                data, reminding = self.parse_any(s, error)
+            except Exception as exc:
+                if stats is not None:
+                    parsed = perf_counter()
+                real = None
+                if exc is error and path == "partial":
+                    # json.loads was skipped; its error has the real message and position.
+                    real = _loads_error(s)
+                if stats is not None:
+                    stats._record(path, s, 0, None, error, started, loaded, parsed, real or exc)
+                if real is not None:
+                    raise real from None
+                raise
+            self.last_parse_reminding = reminding
+            if stats is not None:
+                parsed = perf_counter()
+            if self.on_extra_token and reminding:
+                self.on_extra_token(s, data, reminding)
+            if stats is not None:
+                stats._record(path, s, len(s) - len(reminding), data, error, started, loaded, parsed)
+            return data
         return json.loads("{}")
 
+    def extract(self, s, path):
+        """Return the value at ``path`` (e.g. ``$.choices[0].message``), skipping everything else."""
+        from .path import extract
+
+        if not isinstance(s, str):
+            s = _decode_utf8(s)
+        return extract(self, s, path)
+
     def parse_any(self, s, e):
-        if not s:
+        """Parse a value from the start of ``s``; return ``(value, remainder)``."""
+        value, i = self._parse_value(s, 0, e)
+        return value, s[i:]
+
+    def _parse_value(self, s, i, e):
+        if i >= len(s):
             raise e
-        while s and s[0].isspace():
-            s = self._parse_space(s, e)
-        if not s:
-            return None, ""
-        parser = self._parsers.get(s[0])
+        i = self._parse_space(s, i, e)
+        if i >= len(s):
+            return None, i
+        parser = self._parsers.get(s[i])
         if not parser:
             raise e
-        return parser(s, e)
+        return parser(self, s, i, e)
 
-    def _parse_space(self, s, e):
-        i = 0
-        while i < len(s) and s[i].isspace():
-            i += 1
-        return s[i:]
+    def _parse_space(self, s, i, e):
+        if i < len(s) and s[i].isspace():
+            i = _SPACE.match(s, i + 1).end()
+        return i
 
-    def _parse_array(self, s, e):
-        s = s[1:]
-        acc = []
-        while True:
-            while s and s[0].isspace():
-                s = self._parse_space(s, e)
-            if not s:
-                break
-            if s[0] == "]":
-                s = s[1:]
-                break
-            res, s = self.parse_any(s, e)
-            acc.append(res)
-            while s and s[0].isspace():
-                s = self._parse_space(s, e)
-            if s and s.startswith(","):
-                s = s[1:]
-        return acc, s
-
-    def _parse_object(self, s, e):
-        s = s[1:]
-        acc = {}
+    def _parse_key(self, s, i, e):
+        return self._parse_value(s, i, e)
+
+    def _skip_value(self, s, i, e):
+        """Return the position after the value at ``i`` without decoding it."""
+        if self.speedups:
+            return _speedups.skip_value(s, i)
+        n = len(s)
+        if i >= n:
+            return n
+        c = s[i]
+        if c == '"':
+            return self._skip_string(s, i)
+        if c != "[" and c != "{":
+            return _SCALAR.match(s, i).end()
+        depth = 0
         while True:
-            while s and s[0].isspace():
-                s = self._parse_space(s, e)
-            if not s:
-                break
-            if s[0] == "}":
-                s = s[1:]
-                break
-            key, s = self.parse_any(s, e)
-            while s and s[0].isspace():
-                s = self._parse_space(s, e)
-            if not s or s[0] == "}":
-                if key is not None:
-                    acc[key] = None
-                if s and s[0] == "}":
-                    s = s[1:]
-                break
-            if s[0] != ":":
-                if key is not None:
-                    acc[key] = None
-                break
-            s = s[1:]
-            while s and s[0].isspace():
-                s = self._parse_space(s, e)
-            if not s or s[0] in ",}":
-                acc[key] = None
-                if s and s.startswith(","):
-                    s = s[1:]
-                elif s and s.startswith("}"):
-                    s = s[1:]
-                break
-            if s and s[0] in self._parsers:
-                value, s = self.parse_any(s, e)
-                acc[key] = value
-            else:
-                if key is not None:
-                    acc[key] = None
-                break
-            while s and s[0].isspace():
-                s = self._parse_space(s, e)
-            if s and s.startswith(","):
-                s = s[1:]
-        return acc, s
-
-    def _parse_string(self, s, e):
-        quote = s[0]
-        end = 1
-        while end < len(s):
-            if s[end] == "\\":
-                end += 2
+            match = _STRUCTURE.search(s, i)
+            if not match:
+                return n
+            c = match.group()
+            if c == '"':
+                i = self._skip_string(s, match.start())
                 continue
-            if s[end] == quote:
-                break
+            i = match.end()
+            depth += 1 if c in "[{" else -1
+            if depth == 0:
+                return i
+
+    def _skip_string(self, s, i):
+        end = _STRING_BODY.match(s, i + 1).end()
+        return end + 1 if end < len(s) and s[end] == '"' else len(s)
+
+    def _pack_numbers(self, s, i, e):
+        """Parse the elements from ``i`` in bulk if the array holds only numbers.
+
+        Return ``(array, end)``, or None to parse the array element by element.
+        A number cut off at the end of ``s`` is read by ``_parse_number`` and
+        left out while it is only a sign or a point.
+        """
+        n = len(s)
+        end = _NUMBERS.match(s, i).end()
+        if end < n and s[end] != "]":
+            return None
+        body = s[i:end]
+        if "+" in body and _PLUS_SIGN.search(body):
+            return None
+        items = body.split(",")
+        last = None
+        if end < n:
             end += 1
+            if len(items) > 1 and not items[-1].strip():
+                items.pop()
+        else:
+            last = items.pop().strip()
+        try:
+            floats = array("d", map(float, items))
+        except ValueError:
+            return None
+        if last:
+            value = self._last_number(last, e)
+            if value is None:
+                return None
+            if value != "":
+                floats.append(value)
+        if not floats:
+            return None
+        to_ndarray = self._to_ndarray
+        return (floats if to_ndarray is None else to_ndarray(floats)), end
+
+    def _last_number(self, last, e):
+        """Read the number cut off at the end of a packed array, as ``_parse_number`` does.
+
+        Return it, ``""`` for a lone sign or point, or None to parse the array
+        element by element.
+        """
+        try:
+            return float(last)
+        except ValueError:
+            pass
+        value, stop = self._parse_number(last, 0, e)
+        if value == "" or (stop < len(last) and not _EXPONENT_START.fullmatch(last, stop)):
+            return None
+        return "" if type(value) is str else value
+
+    def _pack_lists(self, data):
+        """Replace the non-empty lists of numbers in a ``json.loads`` result, as ``_pack_numbers`` does."""
+        to_ndarray = self._to_ndarray
+        root = [data]
+        stack = [root]
+        while stack:
+            container = stack.pop()
+            for key, value in container.items() if type(container) is dict else enumerate(container):
+                if type(value) is list:
+                    if value and set(map(type, value)) <= _NUMBER_TYPES:
+                        try:
+                            floats = array("d", value)
+                        except OverflowError:
+                            # An int beyond the float range; read its digits as _pack_numbers does (inf).
+                            floats = array("d", [float(str(item)) for item in value])
+                        container[key] = floats if to_ndarray is None else to_ndarray(floats)
+                    else:
+                        stack.append(value)
+                elif type(value) is dict:
+                    stack.append(value)
+        return root[0]
+
+    def _parse_container(self, s, i, e):
+        # Nested containers are kept on an explicit stack rather than parsed
+        # recursively, so depth is bounded only by max_depth.
+        n = len(s)
+        parsers = self._parsers
+        max_depth = self.max_depth
+        numeric_arrays = self.numeric_arrays
+        if numeric_arrays and s[i] == "[":
+            packed = self._pack_numbers(s, i + 1, e)
+            if packed is not None:
+                return packed
+        stack = []
+        acc = [] if s[i] == "[" else {}
+        key = None
+        i += 1
+        while True:
+            i = self._parse_space(s, i, e)
+            closed = True
+            if type(acc) is list:
+                if i < n and s[i] == "]":
+                    i += 1
+                elif i < n:
+                    closed = False
+                    c = s[i]
+                    if c == "[" or c == "{":
+                        stack.append((acc, None))
+                        acc = [] if c == "[" else {}
+                        i += 1
+                        if max_depth is not None and len(stack) >= max_depth:
+                            raise json.JSONDecodeError("Maximum nesting depth exceeded", s, i - 1)
+                        packed = self._pack_numbers(s, i, e) if numeric_arrays and c == "[" else None
+                        if packed is None:
+                            continue
+                        # Closed below like any other array.
+                        acc, i = packed
+                        closed = True
+                    else:
+                        parser = parsers.get(c)
+                        if not parser:
+                            raise e
+                        value, i = parser(self, s, i, e)
+                        acc.append(value)
+            elif i < n and s[i] == "}":
+                i += 1
+            elif i < n:
+                if s[i] == "[" or s[i] == "{":
+                    raise e
+                key, i = self._parse_value(s, i, e)
+                i = self._parse_space(s, i, e)
+                if i >= n or s[i] == "}":
+                    if key is not None:
+                        acc[key] = None
+                    if i < n:
+                        i += 1
+                elif s[i] != ":":
+                    if key is not None:
+                        acc[key] = None
+                else:
+                    i = self._parse_space(s, i + 1, e)
+                    if i >= n or s[i] in ",}":
+                        acc[key] = None
+                        if i < n:
+                            i += 1
+                    elif s[i] in parsers:
+                        closed = False
+                        c = s[i]
+                        if c == "[" or c == "{":
+                            stack.append((acc, key))
+                            acc = [] if c == "[" else {}
+                            i += 1
+                            if max_depth is not None and len(stack) >= max_depth:
+                                raise json.JSONDecodeError("Maximum nesting depth exceeded", s, i - 1)
+                            packed = self._pack_numbers(s, i, e) if numeric_arrays and c == "[" else None
+                            if packed is None:
+                                continue
+                            acc, i = packed
+                            closed = True
+                        else:
+                            value, i = parsers[c](self, s, i, e)
+                            acc[key] = value
+                    elif key is not None:
+                        acc[key] = None
+
+            if closed:
+                if not stack:
+                    return acc, i
+                value = acc
+                acc, key = stack.pop()
+                if type(acc) is list:
+                    acc.append(value)
+                else:
+                    acc[key] = value
+            i = self._parse_space(s, i, e)
+            if i < n and s[i] == ",":
+                i += 1
 
-        if end >= len(s):
-            content = s[1:]
+    def _parse_string(self, s, i, e):
+        n = len(s)
+        end = _STRING_BODY.match(s, i + 1).end()
+
+        if end >= n or s[end] != '"':
+            content = s[i + 1 :]
             if not self.strict:
-                return content, ""
+                return content, n
             if _INCOMPLETE_ESCAPE_REGEX.match(content):
-                return "", ""
+                return "", n
             try:
-                return json.loads(f'"{content}"'), ""
+                return json.loads(f'"{content}"'), n
             except json.JSONDecodeError:
-                return "", ""
+                return "", n
 
-        str_val = s[: end + 1]
-        remainder = s[end + 1 :]
         if not self.strict:
-            return str_val[1:-1], remainder
-        return json.loads(str_val), remainder
-
-    def _parse_number(self, s, e):
-        i = 0
-        while i < len(s) and s[i] in "0123456789.-":
-            i += 1
-        num_str = s[:i]
-        s = s[i:]
+            return s[i + 1 : end], end + 1
+        return json.loads(s[i : end + 1]), end + 1
+
+    def _parse_number(self, s, i, e):
+        n = len(s)
+        start = i
+        i = _NUMBER.match(s, i).end()
+        num_str = s[start:i]
         if not num_str or num_str == "-" or num_str == ".":
-            return num_str, ""
+            return num_str, n
         try:
             if num_str.endswith("."):
                 num = int(num_str[:-1])
@@ -184,49 +494,73 @@ class _JSONParser:
                 )
         except ValueError:
             raise e
-        return num, s
+        return num, i
 
-    def _parse_true(self, s, e):
-        if s.startswith("t") or s.startswith("T"):
-            return True, s[4:]
+    def _parse_true(self, s, i, e):
+        if s[i] in "tT":
+            return True, i + 4
         raise e
 
-    def _parse_false(self, s, e):
-        if s.startswith("f") or s.startswith("F"):
-            return False, s[5:]
+    def _parse_false(self, s, i, e):
+        if s[i] in "fF":
+            return False, i + 5
         raise e
 
-    def _parse_null(self, s, e):
-        if s.startswith("n"):
-            return None, s[4:]
+    def _parse_null(self, s, i, e):
+        if s[i] == "n":
+            return None, i + 4
         raise e
 
+    # First character -> handler(parser, s, i, e).
+    _PARSERS = dict.fromkeys("0123456789.-", _parse_number)
+    _PARSERS.update(
+        {
+            "[": _parse_container,
+            "{": _parse_container,
+            '"': _parse_string,
+            "t": _parse_true,
+            "f": _parse_false,
+            "n": _parse_null,
+        }
+    )
+    if _speedups is not None:
+        _SPEEDUP_PARSERS = dict(_PARSERS, **{"[": _speedups.parse_container, "{": _speedups.parse_container})
+    else:
+        _SPEEDUP_PARSERS = _PARSERS
+
 
 # Backward compatibility
 class JSONParser:
     """JSON parser. Use create_json_parser() or create_json5_parser() for new code."""
 
-    def __init__(self, strict=True, json5_enabled=False, on_extra_token=None):
+    __slots__ = ("_impl", "path_counts")
+
+    def __init__(self, strict=True, json5_enabled=False, on_extra_token=None, max_depth=None, stats=None):
         if json5_enabled:
             from .json5_parser import create_json5_parser
 
-            self._impl = create_json5_parser(strict=strict, on_extra_token=on_extra_token)
+            impl = create_json5_parser(strict=strict, on_extra_token=on_extra_token, max_depth=max_depth, stats=stats)
         else:
-            self._impl = create_json_parser(strict=strict, on_extra_token=on_extra_token)
+            impl = create_json_parser(strict=strict, on_extra_token=on_extra_token, max_depth=max_depth, stats=stats)
+        self._impl = impl
+        self.path_counts = impl.path_counts
+
+    def parse(self, s, complete=None, paths=None, lazy=False):
+        return self._impl.parse(s, complete=complete, paths=paths, lazy=lazy)
 
-    def parse(self, s):
-        return self._impl.parse(s)
+    def extract(self, s, path):
+        return self._impl.extract(s, path)
 
     def parse_any(self, s, e):
         return self._impl.parse_any(s, e)
 
     @property
     def last_parse_reminding(self):
-        return getattr(self._impl, "last_parse_reminding", None)
+        return self._impl.last_parse_reminding
 
     @property
     def on_extra_token(self):
-        return getattr(self._impl, "on_extra_token", None)
+        return self._impl.on_extra_token
 
     @on_extra_token.setter
     def on_extra_token(self, value):
@@ -0,0 +1,186 @@
+"""Lazy parsing - containers that decode their values on first access."""
+import json
+from collections.abc import Mapping, Sequence
+
+
+def parse_lazy(parser, s):
+    """Return ``parser.parse(s)`` with its containers as read-only lazy proxies.
+
+    An object becomes a ``LazyObject`` (a ``Mapping``) and an array a
+    ``LazyArray`` (a ``Sequence``). A container is indexed the first time it
+    is used: keys are decoded and the position of every value is recorded,
+    but values are skipped over. Each value is decoded on first access and
+    cached, and a nested container is again a proxy, so only the parts of the
+    document that are read get decoded.
+
+    Values are decoded as in a partial document, so with ``strict=False``
+    string escapes are kept as written even when the document is complete.
+    Extra tokens after the document are not reported, since finding them
+    would mean scanning the whole buffer, and errors inside a value are
+    raised when it is accessed.
+    """
+    e = json.JSONDecodeError("Invalid JSON", s, 0)
+    i = parser._parse_space(s, 0, e)
+    if i >= len(s) or (s[i] != "[" and s[i] != "{"):
+        return parser.parse(s)
+    return _proxy(parser, s, i, 1)
+
+
+def _proxy(parser, s, i, depth):
+    if parser.max_depth is not None and depth > parser.max_depth:
+        raise json.JSONDecodeError("Maximum nesting depth exceeded", s, i)
+    return LazyArray(parser, s, i, depth) if s[i] == "[" else LazyObject(parser, s, i, depth)
+
+
+class _LazyContainer:
+    __slots__ = ("_parser", "_s", "_start", "_depth", "_offsets", "_values")
+
+    def __init__(self, parser, s, start, depth):
+        self._parser = parser
+        self._s = s
+        self._start = start
+        self._depth = depth
+        self._offsets = None
+        self._values = None
+
+    def _entries(self):
+        return self._offsets if self._offsets is not None else self._index()
+
+    def _decode(self, i, e):
+        """Decode the value at ``i``; a container becomes another proxy."""
+        s = self._s
+        c = s[i]
+        if c == "[" or c == "{":
+            return _proxy(self._parser, s, i, self._depth + 1)
+        parser = self._parser
+        value, stop = parser._parse_value(s, i, e)
+        end = parser._skip_value(s, i, e)
+        if stop != end and end < len(s):
+            # A complete token the partial parser stops inside, e.g. an exponent.
+            try:
+                value = json.loads(s[i:end])
+            except ValueError:
+                pass
+        return value
+
+    def __repr__(self):
+        return repr(self._materialize())
+
+
+class LazyObject(_LazyContainer, Mapping):
+    """Read-only mapping over an object in the parsed buffer. See ``parse_lazy``."""
+
+    __slots__ = ()
+
+    def _index(self):
+        parser, s, n = self._parser, self._s, len(self._s)
+        e = json.JSONDecodeError("Invalid JSON", s, self._start)
+        parsers = parser._parsers
+        # Key -> position of its value, or None for a key without a value.
+        offsets = {}
+        i = self._start + 1
+        while True:
+            i = parser._parse_space(s, i, e)
+            if i >= n or s[i] == "}":
+                break
+            c = s[i]
+            if c == "[" or c == "{":
+                raise e
+            key, i = parser._parse_key(s, i, e)
+            if key == "" and c not in "\"'":
+                break
+            i = parser._parse_space(s, i, e)
+            if i >= n or s[i] != ":":
+                offsets[key] = None
+                break
+            i = parser._parse_space(s, i + 1, e)
+            if i >= n or s[i] not in parsers:
+                offsets[key] = None
+                break
+            offsets[key] = i
+            i = parser._skip_value(s, i, e)
+            i = parser._parse_space(s, i, e)
+            if i < n and s[i] == ",":
+                i += 1
+        self._offsets = offsets
+        self._values = {}
+        return offsets
+
+    def __getitem__(self, key):
+        offsets = self._entries()
+        values = self._values
+        if key in values:
+            return values[key]
+        i = offsets[key]
+        value = None if i is None else self._decode(i, json.JSONDecodeError("Invalid JSON", self._s, i))
+        values[key] = value
+        return value
+
+    def __contains__(self, key):
+        return key in self._entries()
+
+    def __iter__(self):
+        return iter(self._entries())
+
+    def __len__(self):
+        return len(self._entries())
+
+    def _materialize(self):
+        return {key: self[key] for key in self}
+
+
+class LazyArray(_LazyContainer, Sequence):
+    """Read-only sequence over an array in the parsed buffer. See ``parse_lazy``."""
+
+    __slots__ = ()
+
+    def _index(self):
+        parser, s, n = self._parser, self._s, len(self._s)
+        e = json.JSONDecodeError("Invalid JSON", s, self._start)
+        parsers = parser._parsers
+        offsets = []
+        i = self._start + 1
+        while True:
+            i = parser._parse_space(s, i, e)
+            if i >= n or s[i] == "]":
+                break
+            if s[i] not in parsers:
+                raise e
+            offsets.append(i)
+            i = parser._skip_value(s, i, e)
+            i = parser._parse_space(s, i, e)
+            if i < n and s[i] == ",":
+                i += 1
+        self._offsets = offsets
+        self._values = [_MISSING] * len(offsets)
+        return offsets
+
+    def __getitem__(self, index):
+        offsets = self._entries()
+        if isinstance(index, slice):
+            return [self[k] for k in range(*index.indices(len(offsets)))]
+        value = self._values[index]
+        if value is _MISSING:
+            i = offsets[index]
+            value = self._values[index] = self._decode(i, json.JSONDecodeError("Invalid JSON", self._s, i))
+        return value
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __len__(self):
+        return len(self._entries())
+
+    def __eq__(self, other):
+        if isinstance(other, (list, LazyArray)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def _materialize(self):
+        return list(self)
+
+
+_MISSING = object()
@@ -0,0 +1,129 @@
+"""Path-targeted extraction - decodes only the requested parts of a partial document."""
+import functools
+import json
+import re
+
+_ANY = object()
+_PATH_STEP = re.compile(r"""\.([^.\[\]]+)|\[(\d+|\*)\]|\[(["'])(.*?)\3\]""")
+
+
+@functools.lru_cache(maxsize=256)
+def compile_path(path):
+    """Split a path such as ``$.choices[0].message`` or ``tool_calls[*].arguments`` into steps."""
+    if path.startswith("$"):
+        path = path[1:]
+    if path and path[0] not in ".[":
+        path = "." + path
+    steps = []
+    pos = 0
+    while pos < len(path):
+        match = _PATH_STEP.match(path, pos)
+        if not match:
+            raise ValueError(f"Invalid path: {path!r}")
+        name, index, _, quoted = match.groups()
+        if name is not None:
+            steps.append(_ANY if name == "*" else name)
+        elif index is not None:
+            steps.append(_ANY if index == "*" else int(index))
+        else:
+            steps.append(quoted)
+        pos = match.end()
+    return tuple(steps)
+
+
+def extract(parser, s, path):
+    """Return the value ``parser.parse(s)`` holds at ``path``, decoding nothing else.
+
+    Paths with a wildcard return the list of matched values. A missing value
+    is ``None``, and a duplicated key resolves to its first occurrence.
+    """
+    steps = compile_path(path)
+    if not steps:
+        return parser.parse(s)
+    many = any(step is _ANY for step in steps)
+    found = []
+    _Walker(parser, s, many, found).walk(0, steps)
+    if many:
+        return found
+    return found[0] if found else None
+
+
+class _Walker:
+    __slots__ = ("parser", "s", "many", "found", "error")
+
+    def __init__(self, parser, s, many, found):
+        self.parser = parser
+        self.s = s
+        self.many = many
+        self.found = found
+        self.error = json.JSONDecodeError("Invalid JSON", s, 0)
+
+    def walk(self, i, steps):
+        """Collect matches for ``steps`` in the value at ``i``; return the position after it."""
+        parser, s, n = self.parser, self.s, len(self.s)
+        i = parser._parse_space(s, i, self.error)
+        if i >= n:
+            if not steps:
+                self.found.append(None)
+            return n
+        if not steps:
+            end = parser._skip_value(s, i, self.error)
+            if end < n or s[i] == "[" or s[i] == "{":
+                # A complete value is decoded as parse() decodes a complete document.
+                try:
+                    self.found.append(json.loads(s[i:end]))
+                    return end
+                except ValueError:
+                    pass
+            value, i = parser._parse_value(s, i, self.error)
+            self.found.append(value)
+            return i
+        step = steps[0]
+        if s[i] == "{" and type(step) is not int:
+            return self._walk_object(i + 1, step, steps[1:])
+        if s[i] == "[" and (step is _ANY or type(step) is int):
+            return self._walk_array(i + 1, step, steps[1:])
+        return parser._skip_value(s, i, self.error)
+
+    def _walk_object(self, i, step, rest):
+        parser, s, n, e = self.parser, self.s, len(self.s), self.error
+        while True:
+            i = parser._parse_space(s, i, e)
+            if i >= n or s[i] == "}":
+                return i + 1
+            key, i = parser._parse_key(s, i, e)
+            i = parser._parse_space(s, i, e)
+            if i >= n or s[i] != ":":
+                if i >= n and not rest and (step is _ANY or step == key):
+                    self.found.append(None)
+                return n
+            if step is _ANY or step == key:
+                i = self.walk(i + 1, rest)
+                if not self.many:
+                    return n
+            else:
+                i = parser._skip_value(s, parser._parse_space(s, i + 1, e), e)
+            i = parser._parse_space(s, i, e)
+            if i < n and s[i] == ",":
+                i += 1
+
+    def _walk_array(self, i, step, rest):
+        parser, s, n, e = self.parser, self.s, len(self.s), self.error
+        index = 0
+        while True:
+            i = parser._parse_space(s, i, e)
+            if i >= n or s[i] == "]":
+                return i + 1
+            start = i
+            if step is _ANY or step == index:
+                i = self.walk(i, rest)
+                if not self.many:
+                    return n
+            else:
+                i = parser._skip_value(s, i, e)
+            if i <= start:
+                return n
+            index += 1
+            i = parser._parse_space(s, i, e)
+            if i < n and s[i] == ",":
+                i += 1
@@ -0,0 +1,88 @@
+"""Batch parsing - parses many partial buffers per call, optionally on an executor."""
+import threading
+
+from .json_parser import JSONParser
+
+# Parsers can be shared between threads, but last_parse_reminding and
+# path_counts are per instance, so each thread or worker process gets its own
+# instance per set of options to keep them meaningful. The options include
+# on_extra_token, so only the most recently used _MAX_PARSERS are kept.
+_local = threading.local()
+_MAX_PARSERS = 32
+
+
+def _get_parser(options):
+    parsers = getattr(_local, "parsers", None)
+    if parsers is None:
+        parsers = _local.parsers = {}
+    parser = parsers.pop(options, None)
+    if parser is None:
+        if len(parsers) >= _MAX_PARSERS:
+            del parsers[next(iter(parsers))]
+        strict, json5_enabled, on_extra_token, max_depth = options
+        parser = JSONParser(
+            strict=strict, json5_enabled=json5_enabled, on_extra_token=on_extra_token, max_depth=max_depth
+        )
+    parsers[options] = parser
+    return parser
+
+
+def _parse_batch(options, buffers, return_exceptions):
+    parser = _get_parser(options)
+    if not return_exceptions:
+        return [parser.parse(s) for s in buffers]
+    results = []
+    for s in buffers:
+        try:
+            results.append(parser.parse(s))
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+class ParserPool:
+    """Parser that can be shared between threads and fan batches out to an executor.
+
+    Each thread (or worker process) parses with its own ``JSONParser``, so one
+    pool can serve many concurrent streams. With an ``executor`` such as a
+    ``ProcessPoolExecutor``, ``parse_many`` sends the batch in chunks of
+    ``chunksize`` buffers; ``on_extra_token`` must then be picklable.
+    """
+
+    def __init__(self, strict=True, json5_enabled=False, on_extra_token=None, max_depth=None, executor=None):
+        self._options = (strict, json5_enabled, on_extra_token, max_depth)
+        self.executor = executor
+
+    @property
+    def parser(self):
+        """The calling thread's parser."""
+        return _get_parser(self._options)
+
+    def parse(self, s, complete=None):
+        return self.parser.parse(s, complete=complete)
+
+    def parse_many(self, buffers, return_exceptions=False, chunksize=None):
+        """Parse every buffer and return the results in order.
+
+        With ``return_exceptions``, a buffer that fails to parse yields its
+        exception instead of aborting the batch.
+        """
+        buffers = [bytes(s) if isinstance(s, memoryview) else s for s in buffers]
+        if self.executor is None or len(buffers) <= 1:
+            return _parse_batch(self._options, buffers, return_exceptions)
+        if chunksize is None:
+            chunksize = max(1, len(buffers) // 32)
+        futures = [
+            self.executor.submit(_parse_batch, self._options, buffers[i : i + chunksize], return_exceptions)
+            for i in range(0, len(buffers), chunksize)
+        ]
+        results = []
+        for future in futures:
+            results.extend(future.result())
+        return results
+
+
+def parse_many(buffers, executor=None, strict=True, json5_enabled=False, return_exceptions=False):
+    """Parse a batch of partial buffers, optionally spread over ``executor``."""
+    pool = ParserPool(strict=strict, json5_enabled=json5_enabled, executor=executor)
+    return pool.parse_many(buffers, return_exceptions=return_exceptions)
@@ -0,0 +1,283 @@
+"""Schema-guided parsing - shapes partial results by a JSON Schema or Pydantic model."""
+import copy
+import json
+import typing
+
+from . import json_parser
+from .incremental import IncrementalJSONParser
+from .json5_parser import create_json5_parser
+from .json_parser import _decode_utf8, create_json_parser
+
+_TYPES = {
+    "object": (dict,),
+    "array": (list,),
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "null": (type(None),),
+}
+
+
+def _types(schema):
+    t = schema.get("type")
+    if t is None:
+        return ()
+    return (t,) if isinstance(t, str) else tuple(t)
+
+
+def _matches(value, types):
+    for t in types:
+        if type(value) is bool and t in ("integer", "number"):
+            continue
+        if isinstance(value, _TYPES.get(t, ())):
+            return True
+    return False
+
+
+def _collect_models(model, found):
+    """Map class name to Pydantic model for ``model`` and the models nested in its fields."""
+    if model.__name__ in found:
+        return
+    found[model.__name__] = model
+    stack = [field.annotation for field in getattr(model, "model_fields", {}).values()]
+    while stack:
+        annotation = stack.pop()
+        if hasattr(annotation, "model_json_schema"):
+            _collect_models(annotation, found)
+        else:
+            stack.extend(typing.get_args(annotation))
+
+
+class SchemaParser:
+    """Parser returning partial results shaped by a JSON Schema or a Pydantic model.
+
+    Keys not declared in an object's ``properties`` are dropped (unless
+    ``additionalProperties`` allows them), declared defaults fill in keys that
+    have not arrived yet, and partial numbers and literals are coerced to the
+    declared types. With a Pydantic model class, objects matching the model
+    or a nested model are built with ``model_construct``, without validation.
+
+    ``parse(s)`` skips undeclared keys without decoding them. ``feed(chunk)``
+    parses incrementally and converts each closed subtree only once.
+    """
+
+    def __init__(self, schema, strict=True, json5_enabled=False, on_extra_token=None):
+        self._models = {}
+        if hasattr(schema, "model_json_schema"):
+            models = {}
+            _collect_models(schema, models)
+            root = schema
+            schema = schema.model_json_schema()
+            defs = schema.get("$defs", {})
+            self._models = {id(defs[name]): model for name, model in models.items() if name in defs}
+            self._models[id(schema)] = root
+        self.schema = schema
+        if json5_enabled:
+            self._parser = create_json5_parser(strict=strict, on_extra_token=on_extra_token)
+            # The partial parser handles complete JSON5 in a single pass.
+            self._loads = None
+        else:
+            self._parser = create_json_parser(strict=strict, on_extra_token=on_extra_token)
+            self._may_be_complete = json_parser._may_be_complete
+            self._loads = json.loads
+        self._incremental = IncrementalJSONParser(
+            strict=strict, json5_enabled=json5_enabled, on_extra_token=on_extra_token
+        )
+        self._memo = {}
+
+    def parse(self, s):
+        """Parse the whole buffer ``s`` against the schema."""
+        if not isinstance(s, str):
+            s = _decode_utf8(s)
+        if self._loads and s and self._may_be_complete(s):
+            try:
+                return self.coerce(self._loads(s))
+            except (ValueError, RecursionError):
+                pass
+        value, _ = _SchemaWalker(self, s).value(0, self.schema, root=True)
+        return value
+
+    def feed(self, chunk):
+        """Feed the next chunk and return the shaped snapshot of everything fed so far."""
+        raw = self._incremental.feed(chunk)
+        # Closed subtrees are shared between raw snapshots, so their shaped
+        # values are carried over from the previous feed instead of rebuilt.
+        memo = {}
+        result = self._convert(raw, self.schema, self._memo, memo)
+        self._memo = memo
+        return result
+
+    def reset(self):
+        self._incremental.reset()
+        self._memo = {}
+
+    def coerce(self, value, schema=None):
+        """Shape an already parsed ``value`` by ``schema`` (the parser's schema by default)."""
+        return self._convert(value, self.schema if schema is None else schema, {}, {})
+
+    def _resolve(self, schema):
+        """Follow ``$ref`` and pick the single schema of ``allOf``."""
+        while True:
+            ref = schema.get("$ref")
+            if ref is not None and ref.startswith("#"):
+                target = self.schema
+                for part in ref[1:].split("/")[1:]:
+                    target = target[part.replace("~1", "/").replace("~0", "~")]
+                schema = target
+            elif len(schema.get("allOf", ())) == 1 and "properties" not in schema:
+                schema = schema["allOf"][0]
+            else:
+                return schema
+
+    def _choose(self, value, schema):
+        """Resolve ``schema`` and pick the ``anyOf``/``oneOf`` branch that fits ``value``."""
+        schema = self._resolve(schema)
+        options = schema.get("anyOf") or schema.get("oneOf")
+        if not options:
+            return schema
+        options = [self._resolve(option) for option in options]
+        for option in options:
+            if _matches(value, _types(option)):
+                return option
+        for option in options:
+            if "null" not in _types(option):
+                return option
+        return options[0]
+
+    def _convert(self, value, schema, previous, memo):
+        if type(value) is not dict and type(value) is not list:
+            return self._scalar(value, self._choose(value, schema))
+        key = (id(value), id(schema))
+        hit = previous.get(key)
+        if hit is not None and hit[0] is value:
+            memo[key] = hit
+            return hit[1]
+        chosen = self._choose(value, schema)
+        if type(value) is dict:
+            properties = chosen.get("properties")
+            extra = chosen.get("additionalProperties", properties is None)
+            out = {}
+            for name, item in value.items():
+                if properties is not None and name in properties:
+                    out[name] = self._convert(item, properties[name], previous, memo)
+                elif isinstance(extra, dict):
+                    out[name] = self._convert(item, extra, previous, memo)
+                elif extra:
+                    out[name] = item
+            result = self._finish_object(out, chosen)
+        else:
+            result = [self._convert(item, self._item_schema(chosen, i), previous, memo) for i, item in enumerate(value)]
+        memo[key] = (value, result)
+        return result
+
+    def _item_schema(self, schema, index):
+        prefix = schema.get("prefixItems")
+        if prefix is not None and index < len(prefix):
+            return prefix[index]
+        items = schema.get("items")
+        return items if isinstance(items, dict) else {}
+
+    def _finish_object(self, out, schema):
+        for name, prop in (schema.get("properties") or {}).items():
+            if name not in out:
+                prop = self._resolve(prop)
+                if "default" in prop:
+                    out[name] = copy.deepcopy(prop["default"])
+        model = self._models.get(id(schema))
+        return model.model_construct(**out) if model is not None else out
+
+    def _scalar(self, value, schema):
+        types = _types(schema)
+        if not types or _matches(value, types):
+            if type(value) is int and "number" in types and "integer" not in types:
+                return float(value)
+            return value
+        if "integer" in types and type(value) is float and value.is_integer():
+            return int(value)
+        if "number" in types and type(value) is int:
+            return float(value)
+        if ("integer" in types or "number" in types) and value in ("-", "."):
+            # A number that has not got past its sign or point yet.
+            return None
+        return value
+
+
+class _SchemaWalker:
+    __slots__ = ("owner", "parser", "s", "error")
+
+    def __init__(self, owner, s):
+        self.owner = owner
+        self.parser = owner._parser
+        self.s = s
+        self.error = json.JSONDecodeError("Invalid JSON", s, 0)
+
+    def value(self, i, schema, root=False):
+        """Return the shaped value at ``i`` and the position after it."""
+        parser, s, n, e = self.parser, self.s, len(self.s), self.error
+        i = parser._parse_space(s, i, e)
+        c = s[i] if i < n else ""
+        if c == "{" or c == "[":
+            chosen = self.owner._choose({} if c == "{" else [], schema)
+            if c == "{" and chosen.get("properties") is not None:
+                return self._object(i + 1, chosen)
+            if c == "[" and (chosen.get("items") or chosen.get("prefixItems")):
+                return self._array(i + 1, chosen)
+        if root:
+            return self.owner.coerce(parser.parse(s, complete=False), schema), n
+        if i >= n:
+            return None, n
+        value, i = parser._parse_value(s, i, e)
+        return self.owner.coerce(value, schema), i
+
+    def _object(self, i, schema):
+        parser, s, n, e = self.parser, self.s, len(self.s), self.error
+        properties = schema["properties"]
+        extra = schema.get("additionalProperties", False)
+        out = {}
+        while True:
+            i = parser._parse_space(s, i, e)
+            if i >= n or s[i] == "}":
+                i += 1
+                break
+            start = i
+            key, i = parser._parse_key(s, i, e)
+            i = parser._parse_space(s, i, e)
+            if i >= n or s[i] != ":":
+                if key in properties:
+                    out[key] = None
+                if i < n and s[i] == "}":
+                    i += 1
+                break
+            if key in properties:
+                out[key], i = self.value(i + 1, properties[key])
+            elif isinstance(extra, dict):
+                out[key], i = self.value(i + 1, extra)
+            elif extra:
+                out[key], i = parser._parse_value(s, parser._parse_space(s, i + 1, e), e)
+            else:
+                i = parser._skip_value(s, parser._parse_space(s, i + 1, e), e)
+            if i <= start:
+                i = n
+            i = parser._parse_space(s, i, e)
+            if i < n and s[i] == ",":
+                i += 1
+        return self.owner._finish_object(out, schema), i
+
+    def _array(self, i, schema):
+        parser, s, n, e = self.parser, self.s, len(self.s), self.error
+        out = []
+        while True:
+            i = parser._parse_space(s, i, e)
+            if i >= n or s[i] == "]":
+                i += 1
+                break
+            start = i
+            value, i = self.value(i, self.owner._item_schema(schema, len(out)))
+            out.append(value)
+            if i <= start:
+                i = n
+            i = parser._parse_space(s, i, e)
+            if i < n and s[i] == ",":
+                i += 1
+        return out, i
@@ -0,0 +1,145 @@
+"""Parse statistics - counters and timings for a parser, off unless requested."""
+import json
+from time import perf_counter
+
+
+class ParseStats:
+    """Counters and timings of the ``parse()`` calls of the parsers it is given to.
+
+    Pass one to ``create_json_parser(stats=...)`` or
+    ``create_json5_parser(stats=...)``; a parser without one only checks that
+    its ``stats`` is None. For each path (``"complete"`` when ``json.loads``
+    succeeded, ``"fallback"`` when it failed and ``"partial"`` when it was
+    skipped), ``counts`` and ``seconds`` hold the calls and their total time.
+    That time is split into ``loads_seconds`` (``json.loads`` attempts, also
+    the failed ones), ``partial_seconds`` (the partial parser) and
+    ``callback_seconds`` (``on_extra_token``). ``fallback_reasons`` counts the
+    messages of the errors that sent a buffer to the partial parser. A parse
+    whose partial parser raised is counted and timed like the others and also
+    in ``errors``, by the message of the error it raised.
+
+    ``chars_scanned`` counts the characters read, once per attempt, and
+    ``chars_consumed`` the ones that ended up in a parsed value, so the
+    difference is input read twice or left over as extra tokens. Bytes input
+    is counted after decoding. ``containers`` is the number of objects and
+    arrays returned and ``max_depth`` their deepest nesting; finding them
+    walks each result, so they are only computed when ``nesting=True``.
+
+    ``on_parse``, if given, is called after each parse with a dict describing
+    it, e.g. to feed a metrics system. Calls from several threads may lose
+    counts; use one ``ParseStats`` per thread for exact numbers.
+    """
+
+    __slots__ = (
+        "on_parse",
+        "nesting",
+        "counts",
+        "seconds",
+        "loads_seconds",
+        "partial_seconds",
+        "callback_seconds",
+        "chars_scanned",
+        "chars_consumed",
+        "containers",
+        "max_depth",
+        "fallback_reasons",
+        "errors",
+    )
+
+    def __init__(self, on_parse=None, nesting=False):
+        self.on_parse = on_parse
+        self.nesting = nesting
+        self.reset()
+
+    def reset(self):
+        """Set every counter back to zero."""
+        self.counts = {"complete": 0, "fallback": 0, "partial": 0}
+        self.seconds = {"complete": 0.0, "fallback": 0.0, "partial": 0.0}
+        self.loads_seconds = 0.0
+        self.partial_seconds = 0.0
+        self.callback_seconds = 0.0
+        self.chars_scanned = 0
+        self.chars_consumed = 0
+        self.containers = 0
+        self.max_depth = 0
+        self.fallback_reasons = {}
+        self.errors = {}
+
+    def as_dict(self):
+        """Return the counters as a plain dict."""
+        return {name: getattr(self, name) for name in self.__slots__[2:]}
+
+    def _record(self, path, s, consumed, data, error, started, loaded, parsed, raised=None):
+        """Add one ``parse()`` call.
+
+        ``started``, ``loaded`` and ``parsed`` are the ``perf_counter()``
+        readings at the start, after the ``json.loads`` attempt (None without
+        one) and after the partial parser (None when it did not run).
+        ``raised`` is the exception the partial parser raised, if any.
+        """
+        finished = perf_counter()
+        seconds = finished - started
+        loads_seconds = 0.0 if loaded is None else loaded - started
+        partial_seconds = callback_seconds = 0.0
+        if parsed is not None:
+            partial_seconds = parsed - (started if loaded is None else loaded)
+            callback_seconds = finished - parsed
+        scanned = consumed + (len(s) if path == "fallback" else 0)
+        reason = None
+        if path == "fallback":
+            reason = _message(error)
+            self.fallback_reasons[reason] = self.fallback_reasons.get(reason, 0) + 1
+        failure = None
+        if raised is not None:
+            failure = _message(raised)
+            self.errors[failure] = self.errors.get(failure, 0) + 1
+        self.counts[path] += 1
+        self.seconds[path] += seconds
+        self.loads_seconds += loads_seconds
+        self.partial_seconds += partial_seconds
+        self.callback_seconds += callback_seconds
+        self.chars_scanned += scanned
+        self.chars_consumed += consumed
+        containers = depth = None
+        if self.nesting:
+            containers, depth = _count_containers(data)
+            self.containers += containers
+            self.max_depth = max(self.max_depth, depth)
+        if self.on_parse is not None:
+            self.on_parse(
+                {
+                    "path": path,
+                    "seconds": seconds,
+                    "loads_seconds": loads_seconds,
+                    "partial_seconds": partial_seconds,
+                    "callback_seconds": callback_seconds,
+                    "chars_scanned": scanned,
+                    "chars_consumed": consumed,
+                    "containers": containers,
+                    "depth": depth,
+                    "fallback_reason": reason,
+                    "error": failure,
+                }
+            )
+
+
+def _message(error):
+    return error.msg if isinstance(error, json.JSONDecodeError) else type(error).__name__
+
+
+def _count_containers(data):
+    """Return the number of lists and dicts in ``data`` and their deepest nesting."""
+    count = depth = 0
+    stack = [(data, 1)]
+    while stack:
+        value, level = stack.pop()
+        if type(value) is dict:
+            children = value.values()
+        elif type(value) is list:
+            children = value
+        else:
+            continue
+        count += 1
+        depth = max(depth, level)
+        stack.extend((child, level + 1) for child in children if type(child) is dict or type(child) is list)
+    return count, depth
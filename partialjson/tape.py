@@ -0,0 +1,176 @@
+"""Structural index - token offsets of a growing buffer for repeated queries."""
+import json
+from array import array
+
+from .incremental import _AFTER_VALUE, _KEY, _IncrementalScanner
+from .path import _ANY, _Walker, compile_path
+
+# Entry kinds.
+OBJECT, ARRAY, KEY, VALUE = range(4)
+
+
+class Tape(_IncrementalScanner):
+    """Structural index of a buffer fed one chunk at a time, similar to simdjson's tape.
+
+    Every complete token gets an entry in a set of compact arrays:
+    ``kinds[k]`` is ``OBJECT``, ``ARRAY``, ``KEY`` or ``VALUE`` and
+    ``starts[k]``/``ends[k]`` are its offsets in ``buffer``. The children of
+    a container follow its entry, a key is followed by its value, and
+    ``links[k]`` is the entry after the value at ``k``, so the first child
+    (``k + 1``) and the next sibling (``skip(k)``) are found in O(1). A
+    container that is still open has ``ends`` and ``links`` 0. Keys are
+    decoded into ``keys``, but scalars are only located, not decoded.
+
+    ``value(k)`` decodes one entry and ``extract(path)`` returns what
+    ``extract`` on the whole buffer returns, following the tape instead of
+    scanning the buffer, so repeated queries on a growing buffer only pay for
+    the new input once. Unlike the partial JSON parser, complete numbers with
+    an exponent are decoded. The unfinished token at the end of the buffer is not
+    on the tape; a query reaching it reads it from the buffer. Input the
+    indexer does not handle (such as extra tokens or malformed documents)
+    stops indexing, and queries are then answered by the parser.
+    """
+
+    def reset(self):
+        super().reset()
+        self.kinds = array("B")
+        self.starts = array("I")
+        self.ends = array("I")
+        self.links = array("I")
+        self.keys = {}
+        # Entries of the containers that are still open, outermost first.
+        self._open_entries = []
+        self._broken = False
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def feed(self, chunk):
+        """Index ``chunk``; return the number of entries added."""
+        count = len(self.kinds)
+        self._append(chunk)
+        if not (self._broken or self._done):
+            try:
+                self._advance()
+            except Exception:
+                self._broken = True
+        return len(self.kinds) - count
+
+    def skip(self, k):
+        """Return the entry after the value at ``k``, i.e. its next sibling."""
+        return self.links[k] or len(self.kinds)
+
+    def children(self, k):
+        """Yield the entries of the values in the container at ``k``, or of the keys for an object."""
+        kinds = self.kinds
+        stop = self.skip(k)
+        j = k + 1
+        while j < stop:
+            yield j
+            if kinds[j] == KEY:
+                j += 1
+                if j == stop:
+                    return
+            j = self.skip(j)
+
+    def value(self, k=0):
+        """Decode the entry at ``k`` as the parser decodes it at that position of the buffer."""
+        kind = self.kinds[k]
+        if kind == KEY:
+            return self.keys[k]
+        buf, start, end = self._buffer, self.starts[k], self.ends[k]
+        value, stop = self._parser._parse_value(buf, start, self._error)
+        if kind == VALUE and stop != end:
+            # A complete token the partial parser stops inside, e.g. an exponent.
+            try:
+                value = json.loads(buf[start:end])
+            except ValueError:
+                pass
+        return value
+
+    def extract(self, path):
+        """Return the value at ``path``, as the parser's ``extract`` on the whole buffer."""
+        steps = compile_path(path)
+        buf, pos = self._buffer, self._pos
+        # A "/" that does not start a comment is left to the parser, as in IncrementalJSONParser.
+        stray = buf.startswith("/", pos) and not buf.startswith(("//", "/*"), pos)
+        if not steps or self._broken or stray or not self.kinds:
+            return self._parser.extract(buf, path)
+        many = any(step is _ANY for step in steps)
+        found = []
+        self._walk(0, steps, _Walker(self._parser, buf, many, found))
+        if many:
+            return found
+        return found[0] if found else None
+
+    def _walk(self, k, steps, walker):
+        """Collect matches for ``steps`` in the value at entry ``k``."""
+        if not steps:
+            walker.found.append(self.value(k))
+            return
+        kinds = self.kinds
+        kind = kinds[k]
+        step, rest = steps[0], steps[1:]
+        if not (
+            (kind == OBJECT and type(step) is not int) or (kind == ARRAY and (step is _ANY or type(step) is int))
+        ):
+            return
+        index = 0
+        pending = -1
+        for j in self.children(k):
+            if kind == OBJECT:
+                if j + 1 == len(kinds):
+                    # The key's value is not on the tape yet.
+                    pending = j
+                    break
+                matched = step is _ANY or self.keys[j] == step
+                j += 1
+            else:
+                matched = step is _ANY or step == index
+            if matched:
+                self._walk(j, rest, walker)
+                if not walker.many:
+                    return
+            index += 1
+        if not self._open_entries or self._open_entries[-1] != k:
+            return
+        # The rest of the innermost open container is the unfinished tail.
+        state = self._stack[-1][1]
+        if kind == OBJECT:
+            if pending != -1:
+                walker._walk_object(self.starts[pending], step, rest)
+            elif state == _KEY:
+                walker._walk_object(self._pos, step, rest)
+        elif state != _AFTER_VALUE:
+            walker._walk_array(self._pos, step if step is _ANY else step - index, rest)
+
+    def _entry(self, kind, start, end):
+        self.kinds.append(kind)
+        self.starts.append(start)
+        self.ends.append(end)
+        self.links.append(0 if end == 0 else len(self.kinds))
+
+    def _open(self, frame, is_list, pos):
+        self._open_entries.append(len(self.kinds))
+        self._entry(ARRAY if is_list else OBJECT, pos, 0)
+        return [] if is_list else {}
+
+    def _close(self, frame, pos):
+        k = self._open_entries.pop()
+        self.ends[k] = pos + 1
+        self.links[k] = len(self.kinds)
+
+    def _add_key(self, frame, key, start, end):
+        self.keys[len(self.kinds)] = key
+        self._entry(KEY, start, end)
+
+    def _read_value(self, buf, pos):
+        # Scalars are only located here and decoded by value().
+        if buf[pos] in self._quotes:
+            end = self._scan_string(buf, pos)
+        else:
+            end = self._scan_token(buf, pos)
+        if end == -1:
+            return None
+        self._entry(VALUE, pos, end)
+        return None, end
@@ -1,8 +1,10 @@
+import os
 import os.path
 import pathlib
+import platform
 import re
 
-from setuptools import setup
+from setuptools import Extension, setup
 
 PROJECT_NAME = "partialjson"
 # The directory containing this file
@@ -20,6 +22,14 @@ def get_property(prop):
     return result.group(1)
 
 
+# The C accelerator is optional: it is skipped on other interpreters or with
+# PARTIALJSON_DISABLE_SPEEDUPS=1, and a failed build (no compiler or headers)
+# only emits a warning, leaving the pure-Python parser.
+ext_modules = []
+if platform.python_implementation() == "CPython" and not os.environ.get("PARTIALJSON_DISABLE_SPEEDUPS"):
+    ext_modules.append(Extension("partialjson._speedups", ["partialjson/_speedups.c"], optional=True))
+
+
 setup(
     name="partialjson",
     version=get_property("__version__"),
@@ -31,5 +41,6 @@ setup(
     author_email=get_property("__author_email__"),
     license=get_property("__license__"),
     packages=["partialjson"],
+    ext_modules=ext_modules,
     extras_require={"json5": ["json5"]},
 )
@@ -0,0 +1,35 @@
+"""Documents and helpers shared by the test modules."""
+import math
+
+JSON_DOCUMENTS = [
+    '{"name": "John Doe", "age": 30, "is_student": false, "courses": ["Math", "Science"]}',
+    '[1, 2.5, -3, 12., true, false, null, "x", [], {}, [[1], {"a": [2]}]]',
+    '{"x": "1st line\\n2nd line", "u": "\\u0041\\u00e9", "q": "say \\"hi\\""}',
+    ' \n {"nested": {"deep": {"deeper": [1, {"k": "v"}]}}, "after": 1} \n',
+    '{"a": 1, "a": 2, "b": [1,], "c": {"d": 1,},}',
+    '"top level string"',
+    "12345",
+    '{"e": 1e5}',
+    "[1 2]",
+    '{"a" 1}',
+    "[tru, 1]",
+    "[1] extra",
+]
+
+JSON5_DOCUMENTS = [
+    "{// comment\n\"a\": 1, /* block */ b: 'single', c: [0x1F, +4, .5, Infinity, -Infinity, NaN]}",
+    "{name: 'Demo', version: 1.0, items: [1, 2, 3,], ok: True, no: FALSE, nil: Null,}",
+    "{'it\\'s': 'line1\\\nline2', \"x\": \"\\x41\"}",
+    "[1, /* incomplete comment",
+    "{a: {b: {c: [1, 2, {d: 'e'}]}}} // trailing",
+]
+
+
+def same(a, b):
+    if isinstance(a, float) and isinstance(b, float) and math.isnan(a) and math.isnan(b):
+        return True
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(same(x, y) for x, y in zip(a, b))
+    if isinstance(a, dict) and isinstance(b, dict):
+        return list(a) == list(b) and all(same(a[k], b[k]) for k in a)
+    return type(a) is type(b) and a == b
@@ -0,0 +1,82 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from partialjson.aio import aparse_stream
+
+DOC = '{"message": "hello world", "items": [1, 2, 3], "done": true}'
+
+
+async def _chunks(parts, delay=0):
+    for part in parts:
+        if delay:
+            await asyncio.sleep(delay)
+        yield part
+
+
+def _collect(chunks, **kwargs):
+    async def run():
+        return [snapshot async for snapshot in aparse_stream(chunks, **kwargs)]
+
+    return asyncio.run(run())
+
+
+def test_snapshot_per_chunk_without_coalescing():
+    parts = [DOC[i : i + 5] for i in range(0, len(DOC), 5)]
+    snapshots = _collect(_chunks(parts), coalesce=False)
+    assert len(snapshots) == len(parts)
+    assert snapshots[1] == {"message": None}
+    assert snapshots[-1] == json.loads(DOC)
+
+
+def test_bursts_are_coalesced():
+    # The source never suspends, so everything arrives before the first parse.
+    data = DOC.encode()
+    snapshots = _collect(_chunks([data[i : i + 1] for i in range(len(data))]))
+    assert snapshots == [json.loads(DOC)]
+
+
+def test_mixed_text_and_byte_chunks():
+    doc = '{"message": "h\u00e9llo", "items": [1, 2]}'
+    data = json.loads(doc)
+    encoded = json.dumps(data, ensure_ascii=False).encode()
+    # The two bytes of "é" are split between chunks, and text chunks follow.
+    parts = [encoded[:15], encoded[15:17], encoded[17:20].decode(), encoded[20:24], encoded[24:].decode()]
+    assert _collect(_chunks(parts)) == [data]
+    assert _collect(_chunks(parts), coalesce=False)[-1] == data
+
+
+def test_slow_consumer_gets_fewer_snapshots():
+    async def run():
+        snapshots = []
+        async for snapshot in aparse_stream(_chunks(list(DOC), delay=0.001)):
+            snapshots.append(snapshot)
+            await asyncio.sleep(0.01)
+        return snapshots
+
+    snapshots = asyncio.run(run())
+    assert 1 < len(snapshots) < len(DOC)
+    assert snapshots[-1] == json.loads(DOC)
+
+
+def test_min_interval_and_offload():
+    with ThreadPoolExecutor(1) as executor:
+        snapshots = _collect(
+            _chunks(list(DOC), delay=0.001), min_interval=0.02, offload_size=10, executor=executor
+        )
+    assert len(snapshots) < len(DOC) // 4
+    assert snapshots[-1] == json.loads(DOC)
+
+
+def test_errors_propagate():
+    async def failing():
+        yield '{"a": 1'
+        raise RuntimeError("connection lost")
+
+    with pytest.raises(RuntimeError):
+        _collect(failing())
+    with pytest.raises(ValueError):
+        _collect(_chunks(["[1, ", "\\x"]), coalesce=False)
+    with pytest.raises(ValueError):
+        _collect(_chunks([DOC]), coalesce=False, min_interval=1)
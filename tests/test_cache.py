@@ -0,0 +1,63 @@
+import json
+
+import pytest
+from partialjson.cache import ParseCache
+from partialjson.json_parser import JSONParser
+
+DOC = '{"items": [' + ", ".join(f'{{"id": {i}, "name": "item {i}"}}' for i in range(50)) + '], "done": true}'
+
+
+def test_matches_parse_for_every_prefix():
+    parser = JSONParser()
+    cache = ParseCache(checkpoint_interval=64)
+    for i in range(1, len(DOC) + 1):
+        assert cache.parse(DOC[:i]) == parser.parse(DOC[:i])
+    assert cache.misses == len(DOC)
+    assert cache.resumes == len(DOC) - 1
+
+
+def test_repeated_buffer_is_a_hit():
+    cache = ParseCache()
+    first = cache.parse('{"a": [1, 2')
+    assert cache.parse('{"a": [1, 2') is first
+    assert cache.parse(b'{"a": [1, 2') is first
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_resumes_from_longest_checkpoint():
+    cache = ParseCache(checkpoint_interval=32)
+    cache.parse(DOC[:100])
+    cache.parse(DOC[:50])
+    assert cache.parse(DOC[:120]) == JSONParser().parse(DOC[:120])
+    assert cache.resumes == 2
+    # The other stream shares no prefix with the cached buffers.
+    assert cache.parse('[1, 2') == [1, 2]
+    assert cache.resumes == 2
+
+
+def test_diverging_streams_do_not_share_state():
+    cache = ParseCache(checkpoint_interval=8)
+    base = '{"key": "value", "list": [1, '
+    assert cache.parse(base + "2]}") == {"key": "value", "list": [1, 2]}
+    assert cache.parse(base + '{"x": 3') == {"key": "value", "list": [1, {"x": 3}]}
+    assert cache.parse(base + "2]}") == {"key": "value", "list": [1, 2]}
+
+
+def test_eviction_by_entries_and_size():
+    cache = ParseCache(max_entries=4, checkpoint_interval=0)
+    for i in range(10):
+        cache.parse(f"[{i}")
+    assert len(cache) == 4
+    cache = ParseCache(max_size=20, checkpoint_interval=0)
+    for i in range(10):
+        cache.parse(f"[{i}, 1000")
+    assert cache.size <= 20
+    cache.clear()
+    assert (len(cache), cache.size, cache.hits, cache.misses) == (0, 0, 0, 0)
+
+
+def test_errors_are_not_cached():
+    cache = ParseCache()
+    with pytest.raises(json.JSONDecodeError):
+        cache.parse("[1, \\x]")
+    assert cache.parse("[1, ") == [1]
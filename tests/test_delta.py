@@ -0,0 +1,56 @@
+import copy
+
+import pytest
+from partialjson.delta import apply_patch, diff_snapshots
+from partialjson.incremental import IncrementalJSONParser
+from partialjson.json_parser import JSONParser
+
+
+def test_diff_snapshots():
+    old = {"a": [1, 2], "b": "he", "c": 1}
+    new = {"a": [1, 2, 3], "b": "hello", "d": None}
+    assert diff_snapshots(old, new) == [
+        {"op": "remove", "path": "/c"},
+        {"op": "add", "path": "/a/2", "value": 3},
+        {"op": "replace", "path": "/b", "value": "hello"},
+        {"op": "add", "path": "/d", "value": None},
+    ]
+    assert diff_snapshots("he", "hello", append_strings=True) == [
+        {"op": "append", "path": "", "value": "llo"}
+    ]
+    assert diff_snapshots({"a/b~": 1}, {"a/b~": True}) == [
+        {"op": "replace", "path": "/a~1b~0", "value": True}
+    ]
+
+
+@pytest.mark.parametrize("live", [False, True])
+@pytest.mark.parametrize(
+    "doc",
+    [
+        '{"messages": [{"role": "assistant", "content": "Hello, world"}], "done": true}',
+        '{"a": 1, "b": [1, {"c": 2}], "a": [3, {"a": 4, "a": "x"}], "c": 5}',
+        "[[1, 2], [3, [4, 5]], 6]",
+    ],
+)
+def test_feed_patch_replays_to_the_same_snapshots(doc, live):
+    parser = IncrementalJSONParser(live=live)
+    replica = None
+    for i in range(len(doc)):
+        replica = apply_patch(replica, copy.deepcopy(parser.feed_patch(doc[i])))
+        assert replica == JSONParser().parse(doc[: i + 1])
+
+
+def test_feed_patch_visits_only_the_open_path():
+    parser = IncrementalJSONParser(live=True)
+    parser.feed_patch("[" + ", ".join(map(str, range(1000))))
+    assert parser.feed_patch("0, 5") == [
+        {"op": "replace", "path": "/999", "value": 9990},
+        {"op": "add", "path": "/1000", "value": 5},
+    ]
+
+
+def test_feed_patch_reports_string_growth_as_append():
+    parser = IncrementalJSONParser()
+    parser.feed_patch('{"content": "Hel')
+    assert parser.feed_patch("lo") == [{"op": "append", "path": "/content", "value": "lo"}]
+    assert parser.feed_patch('", ') == []
@@ -0,0 +1,302 @@
+import json
+import math
+
+import pytest
+from partialjson.incremental import (
+    IncrementalDocumentParser,
+    IncrementalEventParser,
+    IncrementalJSONParser,
+    iter_documents,
+    iter_events,
+)
+from partialjson.json_parser import JSONParser
+from _corpus import JSON5_DOCUMENTS, JSON_DOCUMENTS, same
+
+
+def _expected(parser, text):
+    try:
+        return ("ok", parser.parse(text))
+    except Exception as e:
+        return ("error", type(e))
+
+
+def _fed(incremental, chunk):
+    try:
+        return ("ok", incremental.feed(chunk))
+    except Exception as e:
+        return ("error", type(e))
+
+
+def _quiet(*args):
+    pass
+
+
+def _check_every_prefix(doc, strict, json5_enabled):
+    parser = JSONParser(strict=strict, json5_enabled=json5_enabled, on_extra_token=_quiet)
+    incremental = IncrementalJSONParser(strict=strict, json5_enabled=json5_enabled, on_extra_token=_quiet)
+    live = IncrementalJSONParser(strict=strict, json5_enabled=json5_enabled, on_extra_token=_quiet, live=True)
+    for i in range(1, len(doc) + 1):
+        expected = _expected(parser, doc[:i])
+        for actual in (_fed(incremental, doc[i - 1]), _fed(live, doc[i - 1])):
+            assert expected[0] == actual[0], doc[:i]
+            assert same(expected[1], actual[1]), doc[:i]
+
+
+@pytest.mark.parametrize("strict", [True, False])
+@pytest.mark.parametrize("doc", JSON_DOCUMENTS)
+def test_json_matches_parse_for_every_prefix(doc, strict):
+    _check_every_prefix(doc, strict, json5_enabled=False)
+
+
+@pytest.mark.parametrize("strict", [True, False])
+@pytest.mark.parametrize("doc", JSON5_DOCUMENTS)
+def test_json5_matches_parse_for_every_prefix(doc, strict):
+    _check_every_prefix(doc, strict, json5_enabled=True)
+
+
+def test_feed_multi_character_chunks():
+    parser = IncrementalJSONParser()
+    assert parser.feed('{"a": [1, 2') == {"a": [1, 2]}
+    assert parser.feed(', 3], "b": "he') == {"a": [1, 2, 3], "b": "he"}
+    assert parser.feed('llo"}') == {"a": [1, 2, 3], "b": "hello"}
+
+
+def test_update_reports_unchanged_snapshots():
+    parser = IncrementalJSONParser()
+    first, changed = parser.update('{"a": [1, t')
+    assert changed and first == {"a": [1, True]}
+    for chunk in ["r", "u"]:
+        snapshot, changed = parser.update(chunk)
+        assert not changed and snapshot is first
+    snapshot, changed = parser.update("e, 12")
+    assert changed and snapshot == {"a": [1, True, 12]}
+    assert parser.update(".") == (snapshot, False)
+    assert parser.update("5")[1]
+    assert parser.update('], "b": "x\\')[1]
+    for chunk in ["u", "0", "0"]:
+        assert not parser.update(chunk)[1]
+    snapshot, changed = parser.update('41"}')
+    assert changed and snapshot == {"a": [1, True, 12.5], "b": "xA"}
+    assert parser.update(" \n") == (snapshot, False)
+
+
+def test_live_snapshots_are_updated_in_place():
+    parser = IncrementalJSONParser(live=True)
+    snapshot = parser.feed('{"a": [1, 2')
+    assert snapshot == {"a": [1, 2]}
+    items = snapshot["a"]
+    assert parser.feed(', "x') is snapshot and items == [1, 2, "x"]
+    clone = parser.copy()
+    assert parser.feed('y"], "b": tr') is snapshot
+    assert snapshot == {"a": [1, 2, "xy"], "b": True} and snapshot["a"] is items
+    assert clone.feed('"]}') == {"a": [1, 2, "x"]}
+    assert parser.feed("ue}") is snapshot == {"a": [1, 2, "xy"], "b": True}
+
+
+def test_update_after_error():
+    parser = IncrementalJSONParser(json5_enabled=True)
+    with pytest.raises(Exception):
+        parser.update("[nu")
+    with pytest.raises(Exception):
+        parser.update("")
+
+
+@pytest.mark.parametrize("strict", [True, False])
+def test_open_string_decoded_across_feeds(strict):
+    doc = '{"a": "x\\ny \\"q\\" \\\\ \\ud83d\\ude00 caf\\u00e9 \\ud83d!' + "z" * 50 + '", "b": "\\q' + "z" * 50
+    parser = JSONParser(strict=strict)
+    incremental = IncrementalJSONParser(strict=strict)
+    for i in range(1, len(doc) + 1):
+        assert same(incremental.feed(doc[i - 1]), parser.parse(doc[:i])), doc[:i]
+
+
+def test_feed_patch_without_changes():
+    parser = IncrementalJSONParser()
+    parser.feed_patch('{"a": 1')
+    assert parser.feed_patch("  ") == []
+
+
+def test_closed_subtrees_are_shared_between_snapshots():
+    parser = IncrementalJSONParser()
+    first = parser.feed('[{"a": 1}, ')
+    second = parser.feed("2")
+    assert first == [{"a": 1}]
+    assert second == [{"a": 1}, 2]
+    assert first[0] is second[0]
+
+
+@pytest.mark.parametrize("json5_enabled", [False, True])
+def test_finished_document_shares_subtrees(json5_enabled):
+    parser = IncrementalJSONParser(json5_enabled=json5_enabled)
+    first = parser.feed('{"a": [1, {"b": "x"}], "c": {"d": [2]}, "e": "he')
+    last = parser.feed('llo"} ')
+    assert last == {"a": [1, {"b": "x"}], "c": {"d": [2]}, "e": "hello"}
+    assert last["a"] is first["a"] and last["c"] is first["c"]
+    assert parser.feed("\n") is last
+
+
+def test_reset():
+    parser = IncrementalJSONParser()
+    parser.feed("[1, 2")
+    parser.reset()
+    assert parser.buffer == ""
+    assert parser.feed('{"a"') == {"a": None}
+
+
+def test_feed_bytes_split_inside_multibyte_character():
+    parser = IncrementalJSONParser()
+    data = '{"emoji": "😀 ok"}'.encode("utf-8")
+    split = data.index(b"\xf0") + 2
+    assert parser.feed(data[:split]) == {"emoji": ""}
+    assert parser.feed(memoryview(data)[split:]) == {"emoji": "😀 ok"}
+
+
+def _build(events):
+    stack, keys, root = [], [], []
+
+    def add(value):
+        if not stack:
+            root.append(value)
+        elif type(stack[-1]) is list:
+            stack[-1].append(value)
+        else:
+            stack[-1][keys.pop()] = value
+
+    for event, value in events:
+        if event in ("start_map", "start_array"):
+            container = {} if event == "start_map" else []
+            add(container)
+            stack.append(container)
+        elif event in ("end_map", "end_array"):
+            stack.pop()
+        elif event == "map_key":
+            keys.append(value)
+        elif event == "value":
+            add(value)
+    return root[0]
+
+
+def test_events_rebuild_documents_fed_one_character_at_a_time():
+    doc = '{"a": [1, -2.5e3, "x\\ny", true, null, {}], "b": {"c": [[]]}}'
+    parser = IncrementalEventParser()
+    events = [event for c in doc for event in parser.feed(c) if not event[0].startswith("partial")]
+    assert _build(events) == json.loads(doc)
+
+
+def test_events_json5():
+    doc = "{a: 'x', // comment\n b: [Infinity, 0x1F,],} // done"
+    events = list(iter_events([doc[:7], doc[7:]], json5_enabled=True))
+    assert _build(events) == {"a": "x", "b": [float("inf"), 31]}
+
+
+def test_events_report_unfinished_values():
+    parser = IncrementalEventParser()
+    assert parser.feed('[{"k": "he') == [
+        ("start_array", None),
+        ("start_map", None),
+        ("map_key", "k"),
+        ("partial_string", "he"),
+    ]
+    assert parser.feed("llo") == [("partial_string", "hello")]
+    assert parser.feed('"}, 1') == [("value", "hello"), ("end_map", None), ("partial_value", 1)]
+    assert parser.feed("2]") == [("value", 12), ("end_array", None)]
+
+
+def test_events_close():
+    parser = IncrementalEventParser()
+    assert parser.feed("1") == [("partial_value", 1)]
+    assert parser.feed("2") == [("partial_value", 12)]
+    assert parser.close() == [("value", 12)]
+    assert parser.buffer == ""
+    parser.feed('{"a": [1, "he')
+    assert parser.close() == [("value", "he"), ("end_array", None), ("end_map", None)]
+    parser.feed('{"a": 1, "b"')
+    assert parser.close() == [("value", None), ("end_map", None)]
+    parser.feed("[1] ")
+    assert parser.close() == []
+    assert list(iter_events(["[1, 2"])) == [
+        ("start_array", None),
+        ("value", 1),
+        ("partial_value", 2),
+        ("value", 2),
+        ("end_array", None),
+    ]
+
+
+def test_events_drop_consumed_input():
+    parser = IncrementalEventParser()
+    parser.feed('[' + '"item", ' * 1000)
+    assert parser.buffer == ""
+
+
+def test_events_reject_malformed_input():
+    parser = IncrementalEventParser()
+    with pytest.raises(json.JSONDecodeError):
+        parser.feed("[1 2]")
+    with pytest.raises(json.JSONDecodeError):
+        IncrementalEventParser().feed("[1] [2]")
+
+
+def test_max_depth():
+    parser = IncrementalJSONParser(max_depth=2)
+    assert parser.feed('[[1]') == [[1]]
+    with pytest.raises(json.JSONDecodeError):
+        parser.feed(", [[")
+    with pytest.raises(json.JSONDecodeError):
+        IncrementalEventParser(max_depth=1).feed("[[")
+
+
+DOCUMENTS = '{"a": 1}\n[1, 2]\n"s" 12 true {"b": [3]}{"c": "x"}\n\n{\n  "pretty": [1e5]\n}\n{"d": "par'
+
+
+@pytest.mark.parametrize("size", [1, 2, 5, 1000])
+def test_iter_documents(size):
+    chunks = [DOCUMENTS[i : i + size] for i in range(0, len(DOCUMENTS), size)]
+    assert list(iter_documents(chunks)) == [
+        {"a": 1},
+        [1, 2],
+        "s",
+        12,
+        True,
+        {"b": [3]},
+        {"c": "x"},
+        {"pretty": [100000.0]},
+        {"d": "par"},
+    ]
+
+
+def test_iter_documents_partial():
+    chunks = ['{"a": 1}\n{"b": [1', ", 2]}\n3", '\n"x']
+    assert list(iter_documents(chunks, partial=True)) == [
+        ({"a": 1}, True),
+        ({"b": [1]}, False),
+        ({"b": [1, 2]}, True),
+        (3, False),
+        (3, True),
+        ("x", False),
+        ("x", False),
+    ]
+    assert list(iter_documents(["1 2"], partial=True)) == [(1, True), (2, False), (2, True)]
+
+
+def test_iter_documents_json5():
+    chunks = ["{a: 1} // one\n{b: 'x'} /* two */ [Infinity, ", "NaN]"]
+    result = list(iter_documents(chunks, json5_enabled=True))
+    assert result[:2] == [{"a": 1}, {"b": "x"}]
+    assert result[2][0] == math.inf and math.isnan(result[2][1])
+
+
+def test_document_parser_drops_returned_documents():
+    parser = IncrementalDocumentParser()
+    line = '{"id": 1, "tags": ["a", "b"]}\n'
+    for _ in range(1000):
+        assert parser.feed(line * 3) == [{"id": 1, "tags": ["a", "b"]}] * 3
+        assert len(parser.buffer) <= len(line) * 3
+    assert not parser.pending
+    assert parser.close() == []
+
+
+def test_document_parser_rejects_malformed_input():
+    parser = IncrementalDocumentParser()
+    with pytest.raises(json.JSONDecodeError):
+        parser.feed('{"a": 1}\n{"b" 2}')
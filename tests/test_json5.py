@@ -1,3 +1,4 @@
+import json
 import pytest
 import math
 from partialjson.json_parser import JSONParser
@@ -25,6 +26,13 @@ def test_json5_multi_line_strings():
     assert parser.parse("'line1\\\nline2'") == "line1line2"
     assert parser.parse("\"line1\\\r\nline2\"") == "line1line2"
 
+def test_json5_string_escapes():
+    parser = JSONParser(json5_enabled=True)
+    assert parser.parse("['\\x41\\n', \"\\u00e9\\t\\\"\"") == ["A\n", "é\t\""]
+    assert parser.parse("['\\v\\0\\q\\'', \"\\ud83d\\ude00\"") == ["\v\0q'", "😀"]
+    assert parser.parse("['a\\ b', '\\x4g\\1'") == ["ab", "\\x4g\\1"]
+    assert parser.parse("{'k\\x41': 1") == {"kA": 1}
+
 def test_json5_hex_numbers():
     parser = JSONParser(json5_enabled=True)
     assert parser.parse("0x1f") == 31
@@ -55,3 +63,55 @@ def test_json5_trailing_commas():
 def test_json5_whitespace():
     parser = JSONParser(json5_enabled=True)
     assert parser.parse("{\v\"a\"\f: 1\u00A0}") == {"a": 1}
+
+def test_json5_bytes_input():
+    parser = JSONParser(json5_enabled=True)
+    assert parser.parse("{a: 'naïve'}".encode("utf-8")) == {"a": "naïve"}
+    assert parser.parse("{a: 'naï".encode("utf-8")[:-1]) == {"a": "na"}
+
+def test_json5_extract_path():
+    parser = JSONParser(json5_enabled=True)
+    text = "{skip: ['}', /* ] */ {a: 1}], // }\n target: {'k': [0x10, 'va"
+    assert parser.extract(text, "$.target.k[0]") == 16
+    assert parser.extract(text, "target.k[1]") == "va"
+
+
+def test_deeply_nested_input():
+    parser = JSONParser(json5_enabled=True)
+    result = parser.parse("{a: " * 50000 + "[1")
+    for _ in range(50000):
+        result = result["a"]
+    assert result == [1]
+    with pytest.raises(json.JSONDecodeError):
+        JSONParser(json5_enabled=True, max_depth=3).parse("{a: {b: {c: [")
+
+
+def test_json5_exponents():
+    parser = JSONParser(json5_enabled=True)
+    assert parser.parse("{a: 1e5, b: -2.5E-3, c: .5e1, d: 5.}") == {"a": 1e5, "b": -2.5e-3, "c": 5.0, "d": 5.0}
+    assert parser.parse("[1.5e") == [1.5]
+    assert parser.parse("[2e+") == [2]
+    assert parser.parse("[12.") == [12]
+
+
+def test_json5_single_pass_by_default():
+    from partialjson.json5_parser import create_json5_parser
+
+    extra = []
+    parser = create_json5_parser(on_extra_token=lambda *args: extra.append(args))
+    assert parser.parse("{a: 1} // done\n") == {"a": 1}
+    assert parser.path_counts == {"complete": 0, "fallback": 0, "partial": 1}
+    assert extra == []
+    assert parser.parse("{a: 1} x") == {"a": 1}
+    assert len(extra) == 1
+
+
+def test_json5_validate():
+    json5 = pytest.importorskip("json5")
+    from partialjson.json5_parser import create_json5_parser
+
+    parser = create_json5_parser(validate=True)
+    assert parser.parse("{a: [1, 2]}") == json5.loads("{a: [1, 2]}")
+    assert parser.path_counts["complete"] == 1
+    assert parser.parse("{a: [1, 2") == {"a": [1, 2]}
+    assert parser.path_counts["partial"] == 1
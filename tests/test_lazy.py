@@ -0,0 +1,79 @@
+import json
+from collections.abc import Mapping, Sequence
+
+import pytest
+from partialjson.json_parser import JSONParser
+from partialjson.lazy import LazyArray, LazyObject
+from _corpus import JSON5_DOCUMENTS, same
+
+DOCUMENTS = [
+    '{"name": "John Doe", "age": 30, "is_student": false, "courses": ["Math", "Science"]}',
+    '[1, 2.5, -3, 12., true, false, null, "x", [], {}, [[1], {"a": [2]}]]',
+    '{"x": "1st line\\n2nd line", "u": "\\u0041\\u00e9", "q": "say \\"hi\\"", "s": "]}"}',
+    ' \n {"nested": {"deep": {"deeper": [1, {"k": "v"}]}}, "after": 1} \n',
+    '{"a": 1, "a": 2, "b": [1,], "c": {"d": 1,},}',
+    '"top level string"',
+]
+
+
+def _plain(value):
+    if isinstance(value, Mapping):
+        return {key: _plain(value[key]) for key in value}
+    if isinstance(value, Sequence) and not isinstance(value, str):
+        return [_plain(item) for item in value]
+    return value
+
+
+def _outcome(parse):
+    try:
+        return ("ok", _plain(parse()))
+    except Exception as e:
+        return ("error", type(e))
+
+
+def _check_every_prefix(doc, json5_enabled):
+    parser = JSONParser(json5_enabled=json5_enabled, on_extra_token=lambda *args: None)
+    for i in range(1, len(doc) + 1):
+        expected = _outcome(lambda: parser.parse(doc[:i]))
+        actual = _outcome(lambda: parser.parse(doc[:i], lazy=True))
+        assert expected[0] == actual[0], doc[:i]
+        assert same(expected[1], actual[1]), doc[:i]
+
+
+@pytest.mark.parametrize("doc", DOCUMENTS)
+def test_json_matches_parse_for_every_prefix(doc):
+    _check_every_prefix(doc, json5_enabled=False)
+
+
+@pytest.mark.parametrize("doc", JSON5_DOCUMENTS)
+def test_json5_matches_parse_for_every_prefix(doc):
+    _check_every_prefix(doc, json5_enabled=True)
+
+
+def test_proxies():
+    result = JSONParser().parse('{"a": [1, {"b": "x"}, [2, 3]], "c": "he', lazy=True)
+    assert isinstance(result, LazyObject) and isinstance(result["a"], LazyArray)
+    assert list(result) == ["a", "c"] and "c" in result and "d" not in result
+    assert result["a"] is result["a"]
+    assert result["a"][-1] == [2, 3] and result["a"][:2] == [1, {"b": "x"}]
+    assert result == {"a": [1, {"b": "x"}, [2, 3]], "c": "he"}
+    assert repr(result) == "{'a': [1, {'b': 'x'}, [2, 3]], 'c': 'he'}"
+    with pytest.raises(TypeError):
+        result["c"] = "hello"
+    with pytest.raises(KeyError):
+        result["d"]
+    assert JSONParser().parse("[1e5, -2E-3]", lazy=True) == [1e5, -2e-3]
+
+
+def test_values_are_decoded_on_access():
+    result = JSONParser().parse(b'{"ok": true, "bad": [1 x], "tail": {"k": "v', lazy=True)
+    assert result["ok"] is True and result["tail"] == {"k": "v"}
+    with pytest.raises(json.JSONDecodeError):
+        len(result["bad"])
+
+
+def test_max_depth():
+    result = JSONParser(max_depth=2).parse('{"a": [[1]], "b": 1', lazy=True)
+    assert result["b"] == 1
+    with pytest.raises(json.JSONDecodeError):
+        result["a"][0]
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 from partialjson.json_parser import JSONParser
 
@@ -89,3 +91,200 @@ def test_incomplete_string_without_closing_quote():
     # When string has no closing quote, incomplete escapes are handled
     assert parser.parse('{"a":"\\u') == {"a": ""}
     assert parser.parse('{"a":"\\') == {"a": ""}
+
+
+def test_incomplete_buffer_skips_json_loads():
+    parser = JSONParser(strict=True)
+    assert parser.parse('{"a": [1, 2') == {"a": [1, 2]}
+    assert parser.parse('{"a": [1, 2]}') == {"a": [1, 2]}
+    assert parser.parse('[[1, 2]') == [[1, 2]]
+    assert parser.path_counts == {"complete": 1, "fallback": 1, "partial": 1}
+
+
+def test_complete_flag_overrides_detection():
+    parser = JSONParser(strict=False)
+    assert parser.parse('["a\\nb"]', complete=False) == ["a\\nb"]
+    assert parser.parse('["a\\nb"]', complete=True) == ["a\nb"]
+    assert parser.parse('["a\\nb"', complete=True) == ["a\\nb"]
+    assert parser.path_counts == {"complete": 1, "fallback": 1, "partial": 1}
+
+
+def test_bytes_input():
+    parser = JSONParser(strict=True)
+    data = '{"name": "café"}'.encode("utf-8")
+    assert parser.parse(data) == {"name": "café"}
+    assert parser.parse(bytearray(data[:-2])) == {"name": "café"}
+    # The second byte of "é" is missing, so the partial character is held back.
+    assert parser.parse(memoryview(data)[:-3]) == {"name": "caf"}
+
+
+def test_extract_path():
+    parser = JSONParser(strict=True)
+    text = '{"id": "x", "choices": [{"message": {"role": "assistant", "content": "Hel'
+    assert parser.extract(text, "$.choices[0].message.content") == "Hel"
+    assert parser.extract(text, "choices[0].message.role") == "assistant"
+    assert parser.extract(text, "$.choices[1]") is None
+    assert parser.extract(text, "$.usage") is None
+
+
+def test_extract_wildcard_and_parse_paths():
+    parser = JSONParser(strict=True)
+    text = '{"tool_calls": [{"arguments": "{\\"a\\": 1}"}, {"skip": [1, {"]": "}"}], "arguments": "[2'
+    assert parser.extract(text, "tool_calls[*].arguments") == ['{"a": 1}', "[2"]
+    assert parser.parse(text, paths=["tool_calls[0].arguments", "$.missing"]) == {
+        "tool_calls[0].arguments": '{"a": 1}',
+        "$.missing": None,
+    }
+
+
+def test_extract_complete_values_with_exponents():
+    parser = JSONParser(strict=True)
+    doc = '{"a": [1.5e3, {"b": 2E-2}], "c": 1e5, "d": [1e5, 2]}'
+    assert parser.extract("[1e5, 2]", "$[0]") == parser.parse("[1e5, 2]")[0] == 100000.0
+    for path, expected in [("$.a", [1500.0, {"b": 0.02}]), ("$.a[1].b", 0.02), ("$.c", 100000.0), ("$.d[*]", [1e5, 2])]:
+        assert parser.extract(doc, path) == expected
+    assert parser.extract('{"a": [1.5e3]}', "$.a") == [1500.0]
+    assert parser.extract('{"a": [1.5e3], "b": [1, 2', "$.a") == [1500.0]
+
+
+def _depth(value):
+    depth = 0
+    while isinstance(value, list):
+        value = value[0] if value else None
+        depth += 1
+    return depth
+
+
+def test_deeply_nested_input():
+    parser = JSONParser()
+    assert _depth(parser.parse("[" * 100000)) == 100000
+    assert _depth(parser.parse("[" * 100000 + "]" * 100000)) == 100000
+    result = parser.parse('{"a": ' * 50000 + "1")
+    for _ in range(49999):
+        result = result["a"]
+    assert result == {"a": 1}
+
+
+def test_max_depth():
+    parser = JSONParser(max_depth=2)
+    assert parser.parse('{"a": [1, 2') == {"a": [1, 2]}
+    with pytest.raises(json.JSONDecodeError):
+        parser.parse('{"a": [[1')
+
+
+@pytest.mark.parametrize("json5_enabled", [False, True])
+@pytest.mark.parametrize("doc", ["[[[[1]]]]", "[[[[1", '{"a": [{"b": [1e5]}]}', '{"a": [{"b": [1'])
+def test_max_depth_complete_and_truncated(doc, json5_enabled):
+    with pytest.raises(json.JSONDecodeError) as info:
+        JSONParser(max_depth=3, json5_enabled=json5_enabled).parse(doc)
+    assert info.value.msg == "Maximum nesting depth exceeded"
+    assert info.value.pos == [i for i, c in enumerate(doc) if c in "[{"][3]
+    assert JSONParser(max_depth=4, json5_enabled=json5_enabled).parse(doc)
+
+
+def test_parser_shared_between_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    parser = JSONParser()
+    buffers = ['{"id": %d, "items": [%s' % (i, ", ".join(map(str, range(i)))) for i in range(200)]
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(parser.parse, buffers))
+    assert results == [{"id": i, "items": list(range(i))} for i in range(200)]
+
+
+@pytest.mark.parametrize("complete", [None, False])
+def test_truncated_buffer_reports_the_real_error(complete):
+    parser = JSONParser(strict=True)
+    with pytest.raises(json.JSONDecodeError) as info:
+        parser.parse("[1, }", complete=complete)
+    assert (info.value.msg, info.value.pos) == ("Expecting value", 4)
+    with pytest.raises(json.JSONDecodeError) as info:
+        parser.parse('{"a": [1, x', complete=complete)
+    assert (info.value.msg, info.value.pos) == ("Expecting value", 10)
+
+
+def test_dispatch_tables_are_shared():
+    assert JSONParser()._impl._parsers is JSONParser()._impl._parsers
+    assert JSONParser(json5_enabled=True)._impl._parsers is JSONParser(json5_enabled=True)._impl._parsers
+
+
+def test_methods_can_be_overridden_and_patched():
+    from unittest import mock
+
+    class Upper(JSONParser):
+        def parse(self, s, complete=None, paths=None, lazy=False):
+            return super().parse(s.upper(), complete, paths, lazy)
+
+    assert Upper().parse('{"a": "b"}') == {"A": "B"}
+    with mock.patch.object(JSONParser, "parse", return_value="patched"):
+        assert JSONParser().parse("{}") == "patched"
+
+
+def test_numeric_arrays():
+    from array import array
+
+    from partialjson.json_parser import create_json_parser
+
+    parser = create_json_parser(numeric_arrays="array")
+    result = parser.parse('{"embedding": [0.5, -1, 2.5e-3], "logprobs": [[-0.25, 1.')
+    assert result == {"embedding": array("d", [0.5, -1, 2.5e-3]), "logprobs": [array("d", [-0.25, 1])]}
+    assert parser.parse("[1, 2, -") == array("d", [1, 2])
+    assert parser.parse("[1, 2e") == array("d", [1, 2])
+    assert parser.parse('{"a": [1, 2], "b": [true, 1], "c": []}') == {"a": array("d", [1, 2]), "b": [True, 1], "c": []}
+    assert parser.parse('[[1, "x"], [') == [[1, "x"], []]
+    with pytest.raises(json.JSONDecodeError):
+        parser.parse("[1, +2, 3")
+    with pytest.raises(ValueError):
+        create_json_parser(numeric_arrays="list")
+
+
+def test_numeric_arrays_match_lists_for_every_prefix():
+    from array import array
+
+    from partialjson.json_parser import create_json_parser
+
+    doc = '{"a": [1, -2.5, 3., .5, 0], "b": [[10, 20], ["x", 1]], "c": [1 2]}'
+    parser = create_json_parser(on_extra_token=lambda *args: None)
+    packed = create_json_parser(on_extra_token=lambda *args: None, numeric_arrays="array")
+
+    def plain(value):
+        if isinstance(value, dict):
+            return {key: plain(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [plain(item) for item in value]
+        return list(value) if isinstance(value, array) else value
+
+    for i in range(1, len(doc)):
+        try:
+            expected = parser.parse(doc[:i])
+        except json.JSONDecodeError:
+            with pytest.raises(json.JSONDecodeError):
+                packed.parse(doc[:i])
+            continue
+        if doc[:i].endswith((" -", " .")):
+            # A lone sign or point is left out of a packed array.
+            continue
+        assert plain(packed.parse(doc[:i])) == expected, doc[:i]
+
+
+@pytest.mark.parametrize("speedups", [True, False])
+def test_numeric_arrays_out_of_float_range(speedups):
+    from array import array
+
+    from partialjson.json_parser import create_json_parser
+
+    parser = create_json_parser(numeric_arrays="array", speedups=speedups)
+    big = "1" + "0" * 400
+    expected = array("d", [float("inf"), -float("inf"), 2])
+    assert parser.parse(f"[{big}, -{big}, 2]") == expected
+    assert parser.parse(f"[{big}, -{big}, 2") == expected
+    assert parser.parse('{"a": [1e400, 2]}') == {"a": array("d", [float("inf"), 2])}
+
+
+def test_numeric_arrays_numpy():
+    numpy = pytest.importorskip("numpy")
+    from partialjson.json_parser import create_json_parser
+
+    result = create_json_parser(numeric_arrays="numpy").parse('{"embedding": [0.5, -1, 2.')
+    assert isinstance(result["embedding"], numpy.ndarray)
+    assert result["embedding"].tolist() == [0.5, -1.0, 2.0]
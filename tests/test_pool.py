@@ -0,0 +1,52 @@
+import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+from partialjson.json_parser import JSONParser
+from partialjson.pool import ParserPool, parse_many
+
+BUFFERS = ['{"a": [1, 2', '[1, {"b": "te', '"str', "12.", b'{"x": nu', "[true, fal"] * 20
+
+
+def test_parse_many_matches_parse():
+    parser = JSONParser()
+    expected = [parser.parse(s) for s in BUFFERS]
+    assert parse_many(BUFFERS) == expected
+    with ThreadPoolExecutor(4) as executor:
+        assert parse_many(BUFFERS, executor=executor) == expected
+    with ProcessPoolExecutor(2) as executor:
+        assert parse_many(BUFFERS, executor=executor) == expected
+
+
+def test_parse_many_json5():
+    assert parse_many(["{a: 1, // c", "[0x1F"], json5_enabled=True) == [{"a": 1}, [31]]
+
+
+def test_return_exceptions():
+    results = ParserPool().parse_many(['{"a": 1', "[1, \\x]"], return_exceptions=True)
+    assert results[0] == {"a": 1}
+    assert isinstance(results[1], json.JSONDecodeError)
+    with pytest.raises(json.JSONDecodeError):
+        ParserPool().parse_many(['{"a": 1', "[1, \\x]"])
+
+
+def test_threads_get_their_own_parser():
+    pool = ParserPool()
+    with ThreadPoolExecutor(2) as executor:
+        other = executor.submit(lambda: pool.parser).result()
+    assert other is not pool.parser
+    assert pool.parser is pool.parser
+
+
+def test_parser_cache_is_bounded():
+    from partialjson import pool as pool_module
+
+    first = ParserPool(on_extra_token=lambda *args: None)
+    parser = first.parser
+    for _ in range(pool_module._MAX_PARSERS * 2):
+        ParserPool(on_extra_token=lambda *args: None).parse("[1")
+        assert first.parser is parser
+    assert len(pool_module._local.parsers) == pool_module._MAX_PARSERS
+    for _ in range(pool_module._MAX_PARSERS):
+        ParserPool(on_extra_token=lambda *args: None).parse("[1")
+    assert first.parser is not parser
@@ -0,0 +1,80 @@
+import pytest
+from partialjson.schema import SchemaParser
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "count": {"type": "integer"},
+        "score": {"type": "number", "default": 0.0},
+        "tags": {"type": "array", "items": {"type": "string"}},
+        "location": {"$ref": "#/$defs/Location"},
+        "note": {"anyOf": [{"type": "string"}, {"type": "null"}], "default": None},
+    },
+    "$defs": {"Location": {"type": "object", "properties": {"lat": {"type": "number"}, "lon": {"type": "number"}}}},
+}
+
+DOC = (
+    '{"name": "Ada", "debug": {"trace": [1, 2, {"deep": "x"}]}, "count": 3.0, '
+    '"tags": ["a", "b"], "location": {"lat": 1, "lon": -2, "alt": 3}, "score": 5}'
+)
+
+
+def test_parse_prefixes():
+    parser = SchemaParser(SCHEMA)
+    assert parser.parse('{"na') == {"score": 0.0, "note": None}
+    assert parser.parse('{"name": "Ada", "debug": {"trace": [1, 2') == {"name": "Ada", "score": 0.0, "note": None}
+    assert parser.parse('{"name": "Ada", "count": -') == {"name": "Ada", "count": None, "score": 0.0, "note": None}
+    assert parser.parse('{"location": {"lat": 1') == {"location": {"lat": 1.0}, "score": 0.0, "note": None}
+    assert parser.parse(DOC) == {
+        "name": "Ada",
+        "count": 3,
+        "tags": ["a", "b"],
+        "location": {"lat": 1.0, "lon": -2.0},
+        "score": 5.0,
+        "note": None,
+    }
+
+
+def test_feed_matches_parse_for_every_prefix():
+    parser = SchemaParser(SCHEMA)
+    for i in range(1, len(DOC) + 1):
+        assert parser.feed(DOC[i - 1]) == SchemaParser(SCHEMA).parse(DOC[:i]), DOC[:i]
+
+
+def test_feed_reuses_closed_subtrees():
+    parser = SchemaParser({"type": "array", "items": {"type": "object", "properties": {"x": {"type": "number"}}}})
+    first = parser.feed('[{"x": 1, "y": 2}, ')
+    second = parser.feed('{"x"')
+    assert first == [{"x": 1.0}]
+    assert second == [{"x": 1.0}, {"x": None}]
+    assert first[0] is second[0]
+
+
+def test_json5():
+    parser = SchemaParser(SCHEMA, json5_enabled=True)
+    assert parser.parse("{name: 'Ada', // comment\n count: 0x10, extra: [1,") == {
+        "name": "Ada",
+        "count": 16,
+        "score": 0.0,
+        "note": None,
+    }
+
+
+def test_pydantic_model():
+    pydantic = pytest.importorskip("pydantic")
+
+    class Item(pydantic.BaseModel):
+        sku: str
+        qty: int = 1
+
+    class Order(pydantic.BaseModel):
+        id: str
+        items: list[Item] = []
+
+    parser = SchemaParser(Order)
+    order = parser.parse('{"id": "o1", "items": [{"sku": "a", "qty": 2.0}, {"sku": "b')
+    assert isinstance(order, Order)
+    assert order.id == "o1"
+    assert [(item.sku, item.qty) for item in order.items] == [("a", 2), ("b", 1)]
+    assert all(isinstance(item, Item) for item in order.items)
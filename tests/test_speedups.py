@@ -0,0 +1,74 @@
+import json
+
+import pytest
+from partialjson import json_parser
+from partialjson.json_parser import create_json_parser
+from _corpus import JSON_DOCUMENTS, same
+
+pytestmark = pytest.mark.skipif(json_parser._speedups is None, reason="C accelerator not built")
+
+DOCUMENTS = JSON_DOCUMENTS + [
+    '{"name": "John", "age": 30, "city": "New York", "is_student": false, "grades": [85, 90, 78]}',
+    '{"x": "1st line\\n2nd line", "ctl": "a\tb", "u": "\\u00e9\\ud83d\\ude00", "bad": "\\q"}',
+    '[-0, -0., 0.5, -12.75, 007, 123456789012345678901234, 1.2.3, 1-2, -, ., .5, 1e5, 2E-3]',
+    '{"a": {"b": [{"c": null}, [true, false, [[]]]]}, "d": "é😀", null: 1, 12: 2, "k" 3}',
+    '{"a": 1, "b"',
+    "[1, 2] [3]",
+    "[x]",
+    '{"k": x, "m": 1}',
+]
+
+
+def _run(parser, text):
+    try:
+        value, rest = parser.parse_any(text, json.JSONDecodeError("Invalid JSON", text, 0))
+        return ("ok", value, rest)
+    except Exception as e:
+        return ("error", type(e), None)
+
+
+@pytest.mark.parametrize("strict", [True, False])
+@pytest.mark.parametrize("doc", DOCUMENTS)
+def test_matches_python_engine_for_every_prefix(doc, strict):
+    python = create_json_parser(strict=strict, speedups=False)
+    compiled = create_json_parser(strict=strict)
+    assert compiled.speedups and not python.speedups
+    for i in range(1, len(doc) + 1):
+        expected, actual = _run(python, doc[:i]), _run(compiled, doc[:i])
+        assert expected[0] == actual[0] and expected[2] == actual[2], doc[:i]
+        assert same(expected[1], actual[1]), doc[:i]
+
+
+@pytest.mark.parametrize(
+    "doc",
+    DOCUMENTS
+    + [
+        '{"a": [1, -2.5, 3., .5, 0, 1e5, 2E-3], "b": [[10, 20], ["x", 1]], "c": [1 2], "d": [1,,2], "e": [1,]}',
+        "[[0.25, -1.5e-3, 2.], [1, +2], [- 1, 3.-], [], [ ], [,], [1e5e]]",
+        "[%s, 1]" % ("1" * 80),
+    ],
+)
+def test_numeric_arrays_match_python_engine_for_every_prefix(doc):
+    python = create_json_parser(speedups=False, numeric_arrays="array")
+    compiled = create_json_parser(numeric_arrays="array")
+    assert compiled.speedups and not python.speedups
+    for i in range(1, len(doc) + 1):
+        expected, actual = _run(python, doc[:i]), _run(compiled, doc[:i])
+        assert expected[0] == actual[0] and expected[2] == actual[2], doc[:i]
+        assert same(expected[1], actual[1]), doc[:i]
+
+
+def test_deep_nesting_and_max_depth():
+    compiled = create_json_parser()
+    assert compiled.parse("[" * 100000 + "1") is not None
+    with pytest.raises(json.JSONDecodeError):
+        create_json_parser(max_depth=2).parse('{"a": [[1')
+
+
+@pytest.mark.parametrize("doc", DOCUMENTS + ['"a\\', '["x\\"]", [1]]', '{"a": "}"} , 1', "tru e"])
+def test_skip_value_matches_python_engine(doc):
+    python = create_json_parser(speedups=False)
+    compiled = create_json_parser()
+    e = json.JSONDecodeError("Invalid JSON", doc, 0)
+    for i in range(len(doc) + 1):
+        assert compiled._skip_value(doc, i, e) == python._skip_value(doc, i, e), (doc, i)
@@ -0,0 +1,70 @@
+import json
+import logging
+
+import pytest
+from partialjson import ParseStats, create_json5_parser, create_json_parser
+from partialjson.json_parser import JSONParser
+
+
+def test_counts_and_timings_per_path():
+    records = []
+    stats = ParseStats(on_parse=records.append)
+    parser = create_json_parser(stats=stats)
+    assert parser.parse('{"a": [1, 2]}') == {"a": [1, 2]}
+    assert parser.parse('{"a": [1, 2') == {"a": [1, 2]}
+    assert parser.parse('{"a": 1,}') == {"a": 1}
+    assert stats.counts == parser.path_counts == {"complete": 1, "fallback": 1, "partial": 1}
+    assert stats.fallback_reasons == {"Expecting property name enclosed in double quotes": 1}
+    assert [record["path"] for record in records] == ["complete", "partial", "fallback"]
+    assert stats.chars_consumed == 13 + 11 + 9
+    assert stats.chars_scanned == stats.chars_consumed + 9
+    assert stats.seconds["fallback"] >= records[2]["loads_seconds"] + records[2]["partial_seconds"]
+    assert stats.loads_seconds > 0 and stats.partial_seconds > 0
+    assert stats.containers == stats.max_depth == 0
+    assert set(stats.as_dict()) >= {"counts", "seconds", "chars_scanned", "fallback_reasons"}
+    stats.reset()
+    assert stats.counts == {"complete": 0, "fallback": 0, "partial": 0}
+
+
+def test_extra_tokens():
+    seen = []
+    stats = ParseStats(on_parse=seen.append)
+    parser = create_json5_parser(stats=stats, on_extra_token=lambda *args: None)
+    assert parser.parse("{a: 1} // done") == {"a": 1}
+    assert parser.parse("{a: 1} x") == {"a": 1}
+    assert [record["chars_consumed"] for record in seen] == [6, 6]
+    assert stats.callback_seconds >= seen[1]["callback_seconds"] > 0
+
+
+def test_failed_parses_are_counted():
+    records = []
+    stats = ParseStats(on_parse=records.append)
+    parser = create_json_parser(stats=stats)
+    with pytest.raises(json.JSONDecodeError):
+        parser.parse("[1, x")
+    with pytest.raises(json.JSONDecodeError):
+        parser.parse("[1, x]")
+    assert parser.parse("[1") == [1]
+    assert stats.counts == {"complete": 0, "fallback": 1, "partial": 2}
+    assert sum(stats.errors.values()) == 2
+    assert [record["error"] is not None for record in records] == [True, True, False]
+    assert records[0]["partial_seconds"] > 0 and stats.seconds["partial"] > 0
+    with pytest.raises(json.JSONDecodeError):
+        create_json5_parser(stats=stats).parse("[1, @")
+    assert sum(stats.errors.values()) == 3
+
+
+def test_nesting():
+    stats = ParseStats(nesting=True)
+    parser = JSONParser(stats=stats)
+    parser.parse('{"a": [{"b": []}], "c": {}}')
+    parser.parse("[[[1")
+    assert stats.containers == 5 + 3
+    assert stats.max_depth == 4
+
+
+def test_extra_tokens_are_logged_not_printed(capsys, caplog):
+    with caplog.at_level(logging.DEBUG, logger="partialjson"):
+        assert create_json_parser().parse('{"a": 1} extra') == {"a": 1}
+    assert capsys.readouterr().out == ""
+    assert "extra tokens" in caplog.text
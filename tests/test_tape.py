@@ -0,0 +1,61 @@
+import pytest
+from partialjson.json_parser import JSONParser
+from partialjson.tape import ARRAY, KEY, OBJECT, VALUE, Tape
+from _corpus import JSON5_DOCUMENTS, JSON_DOCUMENTS, same
+
+PATHS = ["$.a", "$.b[0]", "$[*]", "$.*", "$.nested.deep.deeper[1].k", "$.courses[1]", "$.c[*]", "$[10][1].a[0]", "x"]
+
+
+def _outcome(extract, path):
+    try:
+        return ("ok", extract(path))
+    except Exception as e:
+        return ("error", type(e))
+
+
+@pytest.mark.parametrize(
+    "doc, json5_enabled",
+    [(doc, False) for doc in JSON_DOCUMENTS] + [(doc, True) for doc in JSON5_DOCUMENTS],
+)
+def test_extract_matches_parser_for_every_prefix(doc, json5_enabled):
+    parser = JSONParser(json5_enabled=json5_enabled, on_extra_token=lambda *args: None)
+    tape = Tape(json5_enabled=json5_enabled)
+    for i in range(1, len(doc) + 1):
+        tape.feed(doc[i - 1])
+        for path in PATHS:
+            expected = _outcome(lambda path: parser.extract(doc[:i], path), path)
+            actual = _outcome(tape.extract, path)
+            assert expected[0] == actual[0], (doc[:i], path)
+            assert same(expected[1], actual[1]), (doc[:i], path)
+
+
+def test_entries():
+    tape = Tape()
+    assert tape.feed('{"a": [1, "x"], "b": {"c": nu') == 8
+    assert list(tape.kinds) == [OBJECT, KEY, ARRAY, VALUE, VALUE, KEY, OBJECT, KEY]
+    assert (tape.starts[2], tape.ends[2], tape.links[2]) == (6, 14, 5)
+    assert tape.ends[0] == tape.links[0] == 0
+    assert list(tape.children(0)) == [1, 5] and list(tape.children(2)) == [3, 4]
+    assert tape.skip(2) == 5 and tape.skip(6) == len(tape)
+    assert tape.value(1) == "a" and tape.value(2) == [1, "x"] and tape.value(6) == {"c": None}
+    assert tape.feed("ll}, \"d\": [1e5]}") == 4
+    assert tape.links[0] == len(tape) and tape.skip(6) == 9
+    assert tape.extract("d[0]") == 100000.0
+
+
+def test_queries_reach_the_unfinished_tail():
+    tape = Tape()
+    tape.feed('{"items": [{"id": 1}, {"id": 2}, {"id"')
+    assert tape.extract("items[*].id") == [1, 2, None]
+    tape.feed(': 3}, "ab')
+    assert tape.extract("items[3]") == "ab"
+    assert tape.extract("$.items[4]") is None
+
+
+def test_falls_back_to_parser():
+    tape = Tape()
+    tape.feed('[1, 2] [3')
+    assert tape.extract("$[1]") == 2
+    tape = Tape()
+    tape.feed("[1 2")
+    assert tape.extract("[1]") == 2